@@ -1,4 +1,5 @@
 import os
+import re
 
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
@@ -36,6 +37,23 @@ if not sqlalchemy_url:
     raise ValueError("TSK_DB_URL environment variable is not set")
 
 
+# 월별/default 파티션은 app.database.partitions 가 관리하므로 autogenerate
+# 비교 대상에서 뺀다.
+PARTITION_NAME = re.compile(r"^(habit_log|routine_log)_(default|y\d{4}m\d{2})")
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table" and reflected and PARTITION_NAME.match(name):
+        return False
+    if (
+        type_ == "index"
+        and reflected
+        and PARTITION_NAME.match(object.table.name)
+    ):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -54,6 +72,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -75,7 +94,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,63 @@
+"""add indexes for per-user date queries
+
+Revision ID: 3861e6010cfd
+Revises: 204d6103061c
+Create Date: 2026-10-18 12:21:20.281495
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3861e6010cfd"
+down_revision: Union[str, None] = "204d6103061c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_habit_user_id"), "habit", ["user_id"], unique=False
+    )
+    op.create_index(
+        "ix_habit_log_habit_id_completed_at",
+        "habit_log",
+        ["habit_id", "completed_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_routine_user_id"), "routine", ["user_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_routine_element_routine_id"),
+        "routine_element",
+        ["routine_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_routine_log_routine_id_completed_at",
+        "routine_log",
+        ["routine_id", "completed_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_todo_user_id_target_date",
+        "todo",
+        ["user_id", "target_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_todo_user_id_target_date", table_name="todo")
+    op.drop_index(
+        "ix_routine_log_routine_id_completed_at", table_name="routine_log"
+    )
+    op.drop_index(
+        op.f("ix_routine_element_routine_id"), table_name="routine_element"
+    )
+    op.drop_index(op.f("ix_routine_user_id"), table_name="routine")
+    op.drop_index("ix_habit_log_habit_id_completed_at", table_name="habit_log")
+    op.drop_index(op.f("ix_habit_user_id"), table_name="habit")
@@ -0,0 +1,70 @@
+"""store repeat days as weekday bitmask
+
+Revision ID: 404d8a757bc0
+Revises: 6034f9da8d9c
+Create Date: 2026-10-18 12:39:40.259053
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "404d8a757bc0"
+down_revision: Union[str, None] = "6034f9da8d9c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ("habit", "routine")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(
+            table, sa.Column("repeat_days_mask", sa.Integer(), nullable=True)
+        )
+        # "0246" -> 0b1010101
+        op.execute(
+            f"""
+            UPDATE {table} SET repeat_days_mask = (
+                SELECT COALESCE(SUM(DISTINCT 1 << day::int), 0)
+                FROM unnest(string_to_array(repeat_days, NULL)) AS day
+            )
+            """
+        )
+        op.alter_column(table, "repeat_days_mask", nullable=False)
+        op.create_index(
+            f"ix_{table}_user_id_repeat_days_mask",
+            table,
+            ["user_id", "repeat_days_mask"],
+            unique=False,
+        )
+        op.drop_column(table, "repeat_days")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "repeat_days",
+                sa.VARCHAR(length=7),
+                autoincrement=False,
+                nullable=True,
+            ),
+        )
+        op.execute(
+            f"""
+            UPDATE {table} SET repeat_days = (
+                SELECT COALESCE(string_agg(day::text, '' ORDER BY day), '')
+                FROM generate_series(0, 6) AS day
+                WHERE repeat_days_mask & (1 << day) <> 0
+            )
+            """
+        )
+        op.alter_column(table, "repeat_days", nullable=False)
+        op.drop_index(f"ix_{table}_user_id_repeat_days_mask", table_name=table)
+        op.drop_column(table, "repeat_days_mask")
@@ -0,0 +1,179 @@
+"""partition log tables by month
+
+Revision ID: 6d3fee9508e3
+Revises: fd30e522eddb
+Create Date: 2026-10-18 13:10:04.118290
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6d3fee9508e3"
+down_revision: Union[str, None] = "fd30e522eddb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 이번 달 이후로 미리 만들어 둘 월 파티션 수
+MONTHS_AHEAD = 3
+
+LOG_TABLES = {
+    "habit_log": dict(
+        parent_column="habit_id",
+        columns=[
+            "id INTEGER NOT NULL",
+            "completed_at TIMESTAMP WITHOUT TIME ZONE NOT NULL",
+            "habit_id INTEGER NOT NULL",
+        ],
+        foreign_keys=[
+            "FOREIGN KEY (habit_id) REFERENCES habit (id) ON DELETE CASCADE",
+        ],
+    ),
+    "routine_log": dict(
+        parent_column="routine_id",
+        columns=[
+            "id INTEGER NOT NULL",
+            "duration_seconds INTEGER NOT NULL",
+            "completed_at TIMESTAMP WITHOUT TIME ZONE NOT NULL",
+            "is_skipped BOOLEAN NOT NULL",
+            "routine_id INTEGER NOT NULL",
+            "routine_element_id INTEGER NOT NULL",
+        ],
+        foreign_keys=[
+            "FOREIGN KEY (routine_id) REFERENCES routine (id) "
+            "ON DELETE CASCADE",
+            "FOREIGN KEY (routine_element_id) REFERENCES routine_element (id) "
+            "ON DELETE CASCADE",
+        ],
+    ),
+}
+
+
+def _add_months(value: date, months: int) -> date:
+    month = value.year * 12 + value.month - 1 + months
+    return date(month // 12, month % 12 + 1, 1)
+
+
+def _months(table: str) -> list[date]:
+    bind = op.get_bind()
+    first, last = bind.execute(
+        sa.text(f"SELECT min(completed_at), max(completed_at) FROM {table}")
+    ).one()
+
+    current = date.today().replace(day=1)
+    start = min(first.date().replace(day=1), current) if first else current
+    end = _add_months(
+        max(last.date().replace(day=1), current) if last else current,
+        MONTHS_AHEAD,
+    )
+
+    months = []
+    while start <= end:
+        months.append(start)
+        start = _add_months(start, 1)
+
+    return months
+
+
+def _rename_old_table(table: str, parent_column: str) -> str:
+    old = f"{table}_old"
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(
+        f"ALTER TABLE {old} RENAME CONSTRAINT {table}_pkey TO {old}_pkey"
+    )
+    op.execute(
+        f"ALTER INDEX ix_{table}_{parent_column}_completed_at "
+        f"RENAME TO ix_{old}_{parent_column}_completed_at"
+    )
+    return old
+
+
+def _copy_and_replace(table: str, old: str, definition: dict, sequence: str):
+    column_names = ", ".join(
+        column.split()[0] for column in definition["columns"]
+    )
+    op.execute(
+        f"INSERT INTO {table} ({column_names}) "
+        f"SELECT {column_names} FROM {old}"
+    )
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+    op.execute(f"DROP TABLE {old}")
+    op.create_index(
+        f'ix_{table}_{definition["parent_column"]}_completed_at',
+        table,
+        [definition["parent_column"], "completed_at"],
+        unique=False,
+    )
+
+
+def upgrade() -> None:
+    for table, definition in LOG_TABLES.items():
+        sequence = (
+            op.get_bind()
+            .execute(
+                sa.text(f"SELECT pg_get_serial_sequence('{table}', 'id')")
+            )
+            .scalar()
+        )
+        months = _months(table)
+        old = _rename_old_table(table, definition["parent_column"])
+
+        columns = list(definition["columns"])
+        columns[0] = f"id INTEGER NOT NULL DEFAULT nextval('{sequence}')"
+        op.execute(
+            f"CREATE TABLE {table} ("
+            + ", ".join(
+                columns
+                + ["PRIMARY KEY (id, completed_at)"]
+                + definition["foreign_keys"]
+            )
+            + ") PARTITION BY RANGE (completed_at)"
+        )
+        op.execute(
+            f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT"
+        )
+        for month in months:
+            op.execute(
+                f"CREATE TABLE {table}_y{month.year:04d}m{month.month:02d} "
+                f"PARTITION OF {table} FOR VALUES "
+                f"FROM ('{month}') TO ('{_add_months(month, 1)}')"
+            )
+
+        _copy_and_replace(table, old, definition, sequence)
+        op.create_index(
+            f"ix_{table}_completed_at_brin",
+            table,
+            ["completed_at"],
+            unique=False,
+            postgresql_using="brin",
+        )
+
+
+def downgrade() -> None:
+    for table, definition in LOG_TABLES.items():
+        sequence = (
+            op.get_bind()
+            .execute(
+                sa.text(f"SELECT pg_get_serial_sequence('{table}', 'id')")
+            )
+            .scalar()
+        )
+        op.drop_index(f"ix_{table}_completed_at_brin", table_name=table)
+        old = _rename_old_table(table, definition["parent_column"])
+
+        columns = list(definition["columns"])
+        columns[0] = f"id INTEGER NOT NULL DEFAULT nextval('{sequence}')"
+        op.execute(
+            f"CREATE TABLE {table} ("
+            + ", ".join(
+                columns + ["PRIMARY KEY (id)"] + definition["foreign_keys"]
+            )
+            + ")"
+        )
+
+        # 파티션도 부모 테이블과 함께 삭제된다.
+        _copy_and_replace(table, old, definition, sequence)
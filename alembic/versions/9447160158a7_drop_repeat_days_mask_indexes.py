@@ -0,0 +1,38 @@
+"""drop repeat days mask indexes
+
+(user_id, repeat_days_mask) btree 인덱스는 repeat_days_mask & n != 0 조건에
+쓰이지 않고 ix_habit_user_id / ix_routine_user_id 와 역할이 겹치므로 지운다.
+
+Revision ID: 9447160158a7
+Revises: b89aa07e6dfd
+Create Date: 2026-10-18 13:28:23.676023
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9447160158a7"
+down_revision: Union[str, None] = "b89aa07e6dfd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ("habit", "routine")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_user_id_repeat_days_mask", table_name=table)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.create_index(
+            f"ix_{table}_user_id_repeat_days_mask",
+            table,
+            ["user_id", "repeat_days_mask"],
+            unique=False,
+        )
@@ -1,12 +1,18 @@
 from fastapi import APIRouter
 
+from app.core.config import EVENT_BUS, METRICS
+
 from .auth import router as auth_router
+from .batch import router as batch_router
+from .events import router as events_router
 from .health import router as health_router
+from .metrics import router as metrics_router
 from .users import router as users_router
 from .todos import router as todos_router
 from .routines import router as routines_router
 from .habits import router as habits_router
 from .task import router as task_router
+from .sync import router as sync_router
 
 
 router = APIRouter()
@@ -19,3 +25,11 @@ router.include_router(todos_router)
 router.include_router(routines_router)
 router.include_router(habits_router)
 router.include_router(task_router)
+router.include_router(sync_router)
+router.include_router(batch_router)
+
+if METRICS:
+    router.include_router(metrics_router)
+
+if EVENT_BUS != "none":
+    router.include_router(events_router)
@@ -10,7 +10,7 @@ from fastapi import (
 
 from ..dao import get_auth_dao
 from ..dao.auth_dao import AuthDAO
-from app.database.db import tx_manager
+from app.database.db import DatabaseRoute, tx_manager
 
 from app.schemas.auth import (
     LoginInput,
@@ -20,7 +20,7 @@ from app.schemas.auth import (
 )
 from app.schemas.user import UserData
 
-router = APIRouter(prefix="/auth", tags=["auth"])
+router = APIRouter(prefix="/auth", tags=["auth"], route_class=DatabaseRoute)
 
 
 @router.post(
@@ -80,7 +80,18 @@ def login(
 )
 def logout(
     response: FastAPIResponse,
+    refresh_token: Annotated[str | None, Cookie()] = None,
+    auth_dao: AuthDAO = Depends(get_auth_dao),
+    tx_manager: None = Depends(tx_manager),
 ):
+    if refresh_token:
+        with tx_manager:
+            try:
+                auth_dao.logout(refresh_token=refresh_token)
+            except HTTPException:
+                # 이미 만료되거나 폐기된 토큰이어도 쿠키는 지운다.
+                pass
+
     response.set_cookie(
         key="refresh_token",
         value="",
@@ -99,7 +110,7 @@ def logout(
     status_code=status.HTTP_200_OK,
     operation_id="refreshToken",
 )
-async def refresh(
+def refresh(
     response: FastAPIResponse,
     refresh_token: Annotated[str | None, Cookie()] = None,
     auth_dao: AuthDAO = Depends(get_auth_dao),
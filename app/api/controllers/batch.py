@@ -0,0 +1,92 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.orm import Session
+
+from app.api.errors import DATA_DOES_NOT_EXIST
+from app.core.auth import get_current_principal
+from app.database.db import DatabaseRoute, get_db
+from app.exceptions.exceptions import DataNotFoundError
+from app.models.models import HabitLog, Todo
+from app.schemas.batch import BatchInput, BatchOperationResult, BatchResult
+from app.schemas.habit import HabitLogPublic
+from app.schemas.todo import TodoPublic
+from ..repositories import get_batch_repository
+from ..repositories.batch_repository import BatchRepository
+
+router = APIRouter(
+    prefix="/batch",
+    tags=["batch"],
+    dependencies=[Depends(get_current_principal)],
+    route_class=DatabaseRoute,
+)
+
+
+def _to_public(result) -> TodoPublic | HabitLogPublic | None:
+    if isinstance(result, Todo):
+        return TodoPublic.from_orm(result)
+    elif isinstance(result, HabitLog):
+        return HabitLogPublic.from_orm(result)
+
+    return None
+
+
+# 작업을 순서대로 실행하고 한 번만 커밋한다. tx_manager 는 예외가 나도
+# 커밋하므로 쓰지 않고, 작업 하나가 실패하면 전체를 롤백한 뒤 그 작업의
+# 상태 코드로 응답한다.
+@router.post(
+    "",
+    response_model=BatchResult,
+    status_code=status.HTTP_200_OK,
+    operation_id="batch",
+)
+def batch(
+    data: BatchInput,
+    response: Response,
+    repository: BatchRepository = Depends(get_batch_repository),
+    db: Session = Depends(get_db),
+):
+    executed = []
+
+    try:
+        for operation in data.operations:
+            status_code, result = repository.execute(operation)
+            executed.append((operation, status_code, result))
+    except (HTTPException, DataNotFoundError) as e:
+        db.rollback()
+
+        if isinstance(e, HTTPException):
+            status_code, error_type = e.status_code, e.detail
+        else:
+            status_code, error_type = (
+                status.HTTP_404_NOT_FOUND,
+                DATA_DOES_NOT_EXIST,
+            )
+
+        response.status_code = status_code
+
+        return BatchResult(
+            committed=False,
+            results=[
+                BatchOperationResult(op=executed_operation.op, status=code)
+                for executed_operation, code, _ in executed
+            ]
+            + [
+                BatchOperationResult(
+                    op=operation.op, status=status_code, error_type=error_type
+                )
+            ],
+        )
+    except Exception:
+        db.rollback()
+        raise
+
+    db.commit()
+
+    return BatchResult(
+        committed=True,
+        results=[
+            BatchOperationResult(
+                op=operation.op, status=code, data=_to_public(result)
+            )
+            for operation, code, result in executed
+        ],
+    )
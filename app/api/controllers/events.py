@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.core import events
+from app.core.auth import Principal, get_current_principal
+from app.core.config import (
+    EVENT_STREAM_HEARTBEAT_INTERVAL,
+    EVENT_STREAM_MAX_SECONDS,
+)
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+# 커밋된 변경(todo.created, todo.updated, todo.completed, habit.achieved,
+# routine_log.put)을 server-sent events 로 보낸다. 이벤트에는 종류와 id 만
+# 담기므로 클라이언트는 필요한 데이터를 GET /sync 로 가져온다.
+@router.get("", operation_id="getEvents")
+async def get_events(
+    principal: Principal = Depends(get_current_principal),
+):
+    subscription = events.event_bus.subscribe(principal.id)
+
+    return StreamingResponse(
+        events.event_stream(
+            subscription,
+            heartbeat_interval=EVENT_STREAM_HEARTBEAT_INTERVAL,
+            max_duration=EVENT_STREAM_MAX_SECONDS,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(subscription.close),
+    )
@@ -3,8 +3,10 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.api.errors import DATA_DOES_NOT_EXIST
-from app.core.auth import get_current_user
-from app.database.db import tx_manager
+from app.core.auth import get_current_principal
+from app.api.etag import etag
+from app.models.models import ResourceVersion
+from app.database.db import DatabaseRoute, tx_manager
 from app.exceptions.exceptions import DataNotFoundError
 from ..repositories import get_habit_repository
 from ..repositories.habit_repository import HabitRepository
@@ -19,7 +21,10 @@ from app.schemas.habit import (
 
 
 router = APIRouter(
-    prefix="/habits", tags=["habits"], dependencies=[Depends(get_current_user)]
+    prefix="/habits",
+    tags=["habits"],
+    dependencies=[Depends(get_current_principal)],
+    route_class=DatabaseRoute,
 )
 
 
@@ -45,6 +50,7 @@ def create_habit(
     response_model=List[HabitWithLog],
     status_code=status.HTTP_200_OK,
     operation_id="getHabitList",
+    dependencies=[Depends(etag(ResourceVersion.HABIT))],
 )
 def get_habits(
     params: HabitListGetParams = Depends(),
@@ -1,8 +1,24 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-router = APIRouter(prefix="/health", tags=["health"])
+from app.core.auth import verify_internal_token
+from app.database.db import DatabaseRoute, get_request_engine
+from app.database.pool import get_pool_status
+
+router = APIRouter(
+    prefix="/health", tags=["health"], route_class=DatabaseRoute
+)
 
 
 @router.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+
+# 내부 모니터링 용도
+@router.get(
+    "/pool",
+    include_in_schema=False,
+    dependencies=[Depends(verify_internal_token)],
+)
+def pool_status():
+    return get_pool_status(get_request_engine().pool)
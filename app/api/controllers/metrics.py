@@ -0,0 +1,99 @@
+from anyio import to_thread
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.core.auth import verify_internal_token
+from app.core.metrics import (
+    format_header,
+    format_histogram,
+    format_sample,
+    registry,
+)
+from app.database.db import get_request_engine
+from app.database.pool import get_pool_status
+
+router = APIRouter(tags=["metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _gauge(name: str, documentation: str, value: float) -> list[str]:
+    return format_header(name, "gauge", documentation) + [
+        format_sample(name, {}, value)
+    ]
+
+
+def collect_pool_metrics() -> list[str]:
+    status = get_pool_status(get_request_engine().pool)
+
+    lines = _gauge(
+        "taskie_db_pool_size", "Configured pool size.", status["pool_size"]
+    )
+    lines += _gauge(
+        "taskie_db_pool_checked_out",
+        "Connections currently checked out.",
+        status["checked_out"],
+    )
+    lines += _gauge(
+        "taskie_db_pool_overflow",
+        "Connections opened beyond the pool size.",
+        status["overflow"],
+    )
+    lines += format_header(
+        "taskie_db_pool_timeouts_total",
+        "counter",
+        "Checkouts that timed out waiting for a connection.",
+    )
+    lines.append(
+        format_sample("taskie_db_pool_timeouts_total", {}, status["timeouts"])
+    )
+    lines += format_header(
+        "taskie_db_pool_checkout_wait_seconds",
+        "histogram",
+        "Time waited to check out a connection from the pool.",
+    )
+    lines += format_histogram(
+        "taskie_db_pool_checkout_wait_seconds", {}, status["wait_time"]
+    )
+
+    return lines
+
+
+# 동기 엔드포인트와 의존성이 실행되는 anyio 스레드 풀의 사용량.
+# 이벤트 루프 안에서만 읽을 수 있으므로 async 엔드포인트에서 호출한다.
+def collect_threadpool_metrics() -> list[str]:
+    statistics = to_thread.current_default_thread_limiter().statistics()
+
+    lines = _gauge(
+        "taskie_threadpool_tokens_total",
+        "Threadpool capacity.",
+        statistics.total_tokens,
+    )
+    lines += _gauge(
+        "taskie_threadpool_tokens_borrowed",
+        "Threadpool workers currently in use.",
+        statistics.borrowed_tokens,
+    )
+    lines += _gauge(
+        "taskie_threadpool_tasks_waiting",
+        "Tasks waiting for a threadpool worker.",
+        statistics.tasks_waiting,
+    )
+
+    return lines
+
+
+registry.add_collector(collect_pool_metrics)
+registry.add_collector(collect_threadpool_metrics)
+
+
+# 내부 모니터링 용도
+@router.get(
+    "/metrics",
+    include_in_schema=False,
+    dependencies=[Depends(verify_internal_token)],
+)
+async def metrics():
+    return PlainTextResponse(
+        registry.render(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
@@ -4,7 +4,9 @@ from typing import List
 from fastapi import APIRouter, Depends, status
 from pytz import timezone
 
-from app.core.auth import get_current_user
+from app.core.auth import get_current_principal
+from app.api.etag import etag
+from app.models.models import ResourceVersion
 
 from ..dao import get_routine_dao, get_routine_log_dao
 from ..repositories import get_routine_repository
@@ -13,7 +15,7 @@ from ..repositories.routine_repository import RoutineRepository
 from ..dao.routine_dao import RoutineDAO
 from ..dao.routine_log_dao import RoutineLogDAO
 
-from app.database.db import tx_manager
+from app.database.db import DatabaseRoute, tx_manager
 
 from app.schemas.routine import (
     RoutineCreateInput,
@@ -25,7 +27,8 @@ from app.schemas.routine import (
 router = APIRouter(
     prefix="/routines",
     tags=["routines"],
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_principal)],
+    route_class=DatabaseRoute,
 )
 
 
@@ -51,6 +54,7 @@ def create_routine(
     response_model=List[RoutinePublic],
     status_code=status.HTTP_200_OK,
     operation_id="getRoutineList",
+    dependencies=[Depends(etag(ResourceVersion.ROUTINE))],
 )
 def get_routine_list(
     repository: RoutineRepository = Depends(get_routine_repository),
@@ -67,6 +71,7 @@ def get_routine_list(
     response_model=RoutinePublic,
     status_code=status.HTTP_200_OK,
     operation_id="getRoutine",
+    dependencies=[Depends(etag(ResourceVersion.ROUTINE))],
 )
 def get_routine(routine_id: int, dao: RoutineDAO = Depends(get_routine_dao)):
     routine = dao.get_routine_with_elements_by_id(
@@ -124,8 +129,8 @@ def update_routine(
     tx_manager: contextmanager = Depends(tx_manager),
 ):
     with tx_manager:
-        routine = repository.update_routine(
+        routine, routine_elements = repository.update_routine(
             routine_id=routine_id, routine=data
         )
 
-    return RoutinePublic.from_routine(routine, routine.routine_elements)
+    return RoutinePublic.from_routine(routine, routine_elements)
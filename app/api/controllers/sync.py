@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Depends, Query, status
+
+from app.core.auth import get_current_principal
+from app.database.db import DatabaseRoute
+from app.models.models import Tombstone
+from app.schemas.habit import HabitPublic
+from app.schemas.sync import (
+    HabitLogSyncPublic,
+    RoutineElementPublic,
+    RoutineLogSyncPublic,
+    SyncDeleted,
+    SyncPublic,
+)
+from app.schemas.todo import TodoPublic
+from ..dao import get_sync_dao
+from ..dao.sync_dao import SyncDAO
+
+
+router = APIRouter(
+    prefix="/sync",
+    tags=["sync"],
+    dependencies=[Depends(get_current_principal)],
+    route_class=DatabaseRoute,
+)
+
+
+@router.get(
+    "",
+    response_model=SyncPublic,
+    status_code=status.HTTP_200_OK,
+    operation_id="getSync",
+)
+def get_sync(
+    since: str | None = Query(None),
+    dao: SyncDAO = Depends(get_sync_dao),
+):
+    since_time = dao.decode_sync_token(since) if since else None
+    sync_time = dao.get_sync_time()
+    changes = dao.get_changes(since_time)
+    deleted = changes["deleted"]
+
+    return SyncPublic(
+        token=dao.encode_sync_token(sync_time),
+        full=since_time is None,
+        todos=[TodoPublic.from_orm(todo) for todo in changes["todos"]],
+        routines=[
+            SyncPublic.routine_from_orm(routine)
+            for routine in changes["routines"]
+        ],
+        routine_elements=[
+            RoutineElementPublic.from_orm(element)
+            for element in changes["routine_elements"]
+        ],
+        habits=[HabitPublic.from_orm(habit) for habit in changes["habits"]],
+        habit_logs=[
+            HabitLogSyncPublic.from_orm(log) for log in changes["habit_logs"]
+        ],
+        routine_logs=[
+            RoutineLogSyncPublic.from_orm(log)
+            for log in changes["routine_logs"]
+        ],
+        deleted=SyncDeleted(
+            todos=deleted.get(Tombstone.TODO, []),
+            routines=deleted.get(Tombstone.ROUTINE, []),
+            routine_elements=deleted.get(Tombstone.ROUTINE_ELEMENT, []),
+            habits=deleted.get(Tombstone.HABIT, []),
+        ),
+    )
@@ -1,7 +1,18 @@
 from datetime import date
+from typing import Dict
 from fastapi import APIRouter, Depends, status
+from fastapi.exceptions import RequestValidationError
+from pydantic.error_wrappers import ErrorWrapper
 
-from app.core.auth import get_current_user
+from app.api.errors import (
+    DATE_RANGE_TOO_LONG,
+    START_DATE_GREATER_THAN_END_DATE,
+)
+from app.core.auth import get_current_principal
+from app.api.etag import etag
+from app.models.models import ResourceVersion
+from app.core.config import TASK_RANGE_MAX_DAYS
+from app.database.db import DatabaseRoute
 from ..repositories import get_task_repository
 from ..repositories.task_repository import TaskRepository
 
@@ -11,7 +22,12 @@ from app.schemas.task import TaskPublic
 router = APIRouter(
     prefix="/task",
     tags=["task"],
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_principal)],
+    route_class=DatabaseRoute,
+)
+
+task_etag = etag(
+    ResourceVersion.TODO, ResourceVersion.ROUTINE, ResourceVersion.HABIT
 )
 
 
@@ -20,6 +36,7 @@ router = APIRouter(
     response_model=TaskPublic,
     status_code=status.HTTP_200_OK,
     operation_id="getAllDailyTask",
+    dependencies=[Depends(task_etag)],
 )
 def get_today_all_task(
     date: date,
@@ -28,3 +45,30 @@ def get_today_all_task(
     all_task = task_repository.get_all_task_by_date(date)
 
     return all_task
+
+
+@router.get(
+    "/range",
+    response_model=Dict[date, TaskPublic],
+    status_code=status.HTTP_200_OK,
+    operation_id="getAllTaskByRange",
+    dependencies=[Depends(task_etag)],
+)
+def get_all_task_by_range(
+    start: date,
+    end: date,
+    task_repository: TaskRepository = Depends(get_task_repository),
+):
+    if end < start:
+        error = START_DATE_GREATER_THAN_END_DATE
+    elif (end - start).days + 1 > TASK_RANGE_MAX_DAYS:
+        error = DATE_RANGE_TOO_LONG
+    else:
+        error = None
+
+    if error:
+        raise RequestValidationError(
+            [ErrorWrapper(ValueError(error), loc=("query", "end"))]
+        )
+
+    return task_repository.get_all_task_by_range(start, end)
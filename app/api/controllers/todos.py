@@ -3,12 +3,12 @@ from datetime import date, datetime, timedelta
 from pytz import timezone
 
 from typing import List
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
-from app.core.auth import get_current_user
+from app.core.auth import get_current_principal
 from ..dao import get_todo_dao
 from ..dao.todo_dao import TodoDAO
-from app.database.db import tx_manager
+from app.database.db import DatabaseRoute, tx_manager
 
 from app.schemas.todo import (
     TodoCreateInput,
@@ -20,7 +20,8 @@ from app.schemas.todo import (
 router = APIRouter(
     prefix="/todos",
     tags=["todos"],
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_principal)],
+    route_class=DatabaseRoute,
 )
 
 
@@ -130,11 +131,13 @@ def delete_todo(
     operation_id="getTodoList",
 )
 def get_todo_list(
+    response: Response,
     limit: int = 30,
     offset: int = 0,
     completed: bool = False,
     start_date: date | None = None,
     end_date: date | None = None,
+    cursor: str | None = None,
     todo_dao: TodoDAO = Depends(get_todo_dao),
 ):
     if start_date and not end_date:
@@ -143,7 +146,7 @@ def get_todo_list(
     if end_date and not start_date:
         start_date = (
             datetime.now(timezone("Asia/Seoul")) - timedelta(days=30)
-        ).date
+        ).date()
 
     todo_list = todo_dao.get_todo_list(
         completed=completed,
@@ -151,6 +154,13 @@ def get_todo_list(
         offset=offset,
         start_date=start_date,
         end_date=end_date,
+        cursor=cursor,
     )
 
+    # 다음 페이지 커서는 응답 헤더로 전달한다.
+    if todo_list and len(todo_list) == limit:
+        response.headers["X-Next-Cursor"] = todo_dao.encode_todo_list_cursor(
+            todo_list[-1]
+        )
+
     return [TodoPublic.from_orm(todo) for todo in todo_list]
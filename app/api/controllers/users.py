@@ -2,10 +2,11 @@ from contextlib import contextmanager
 from fastapi import APIRouter, Depends, status
 
 from app.core.auth import get_current_user
+from app.api.etag import etag
 from ..dao import get_user_dao
 from ..dao.user_dao import UserDAO
-from app.database.db import tx_manager
-from app.models.models import User
+from app.database.db import DatabaseRoute, tx_manager
+from app.models.models import ResourceVersion, User
 
 from app.schemas.user import UserData, UserUpdateInput
 
@@ -13,6 +14,7 @@ router = APIRouter(
     prefix="/users",
     tags=["users"],
     dependencies=[Depends(get_current_user)],
+    route_class=DatabaseRoute,
 )
 
 
@@ -21,6 +23,7 @@ router = APIRouter(
     response_model=UserData,
     status_code=status.HTTP_200_OK,
     operation_id="getMe",
+    dependencies=[Depends(etag(ResourceVersion.USER))],
 )
 def get_me(user: User = Depends(get_current_user)):
     return UserData.from_orm(user)
@@ -1,8 +1,8 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
-from app.core.auth import get_current_user
+from app.core.auth import Principal, get_current_principal, get_current_user
 
-from app.database.db import get_db
+from app.database.db import async_compatible, get_db
 from app.models.models import User
 from .routine_dao import RoutineDAO
 from .routine_element_dao import RoutineElementDAO
@@ -10,40 +10,58 @@ from .todo_dao import TodoDAO
 from .auth_dao import AuthDAO
 from .user_dao import UserDAO
 from .routine_log_dao import RoutineLogDAO
+from .sync_dao import SyncDAO
 
 
+@async_compatible
 def get_routine_dao(
     db: Session = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_principal),
 ) -> RoutineDAO:
     return RoutineDAO(db=db, user=user)
 
 
+@async_compatible
 def get_routine_item_dao(
-    db: Session = Depends(get_db), user: User = Depends(get_current_user)
+    db: Session = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
 ) -> RoutineElementDAO:
     return RoutineElementDAO(db=db, user=user)
 
 
+@async_compatible
 def get_todo_dao(
-    db: Session = Depends(get_db), user: User = Depends(get_current_user)
+    db: Session = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
 ) -> TodoDAO:
     return TodoDAO(db=db, user=user)
 
 
+@async_compatible
 def get_auth_dao(
     session: Session = Depends(get_db),
 ) -> AuthDAO:
     return AuthDAO(db=session)
 
 
+@async_compatible
 def get_user_dao(
     session: Session = Depends(get_db), user: User = Depends(get_current_user)
 ) -> UserDAO:
     return UserDAO(db=session, user=user)
 
 
+@async_compatible
 def get_routine_log_dao(
-    session: Session = Depends(get_db), user: User = Depends(get_current_user)
+    session: Session = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
 ) -> RoutineLogDAO:
     return RoutineLogDAO(db=session, user=user)
+
+
+@async_compatible
+def get_sync_dao(
+    session: Session = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
+) -> SyncDAO:
+    return SyncDAO(db=session, user=user)
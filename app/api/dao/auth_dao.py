@@ -10,6 +10,7 @@ from app.core.auth import (
     create_access_token,
     create_refresh_token,
     get_password_hash,
+    invalidate_cached_user_after_commit,
     refresh_token_decode,
 )
 
@@ -66,13 +67,24 @@ class AuthDAO(BaseDAO):
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        access_token = create_access_token(user.username)
-        refresh_token = create_refresh_token(user.username)
+        access_token = create_access_token(
+            user.username, user.id, user.token_version
+        )
+        refresh_token = create_refresh_token(user.username, user.token_version)
 
         return refresh_token, access_token, user
 
     def refresh(self, refresh_token: str) -> Tuple[str, User]:
         user: User = refresh_token_decode(refresh_token, self.db)
-        access_token = create_access_token(user.username)
+        access_token = create_access_token(
+            user.username, user.id, user.token_version
+        )
 
         return access_token, user
+
+    # token_version 을 올려 이 사용자에게 발급한 모든 토큰을 폐기한다.
+    def logout(self, refresh_token: str) -> None:
+        user: User = refresh_token_decode(refresh_token, self.db)
+        user.token_version += 1
+
+        invalidate_cached_user_after_commit(self.db, user.username)
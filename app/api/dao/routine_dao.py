@@ -1,11 +1,14 @@
 from datetime import date
 from typing import List
 from fastapi import HTTPException, status
-from sqlalchemy import asc, func
+from sqlalchemy import asc
+from sqlalchemy.orm import selectinload
 from app.api.errors import DATA_DOES_NOT_EXIST
+from app.core.definition_cache import DefinitionCache
+from app.core.utils import get_date_range
 from app.schemas.routine import RoutineItem, RoutinePublic
 from .base import ProtectedBaseDAO
-from app.models.models import Routine, RoutineLog
+from app.models.models import ResourceVersion, Routine, RoutineLog, Tombstone
 
 
 class RoutineDAO(ProtectedBaseDAO):
@@ -27,10 +30,11 @@ class RoutineDAO(ProtectedBaseDAO):
     def get_routines(self) -> List[Routine]:
         routines = (
             self.db.query(Routine)
+            .options(selectinload(Routine.routine_elements))
             .filter(
                 Routine.user_id == self.user_id,
             )
-            .order_by(Routine.start_time_minutes)
+            .order_by(Routine.start_time_minutes, Routine.id)
             .all()
         )
 
@@ -39,11 +43,12 @@ class RoutineDAO(ProtectedBaseDAO):
     def get_routines_by_weekday(self, weekday: int) -> List[Routine]:
         routines = (
             self.db.query(Routine)
+            .options(selectinload(Routine.routine_elements))
             .filter(
                 Routine.user_id == self.user_id,
-                Routine.repeat_days.contains(str(weekday)),
+                Routine.repeats_on(weekday),
             )
-            .order_by(Routine.start_time_minutes)
+            .order_by(Routine.start_time_minutes, Routine.id)
             .all()
         )
 
@@ -54,6 +59,7 @@ class RoutineDAO(ProtectedBaseDAO):
     ) -> RoutinePublic:
         routine = (
             self.db.query(Routine)
+            .options(selectinload(Routine.routine_elements))
             .filter(
                 Routine.id == routine_id,
                 Routine.user_id == self.user_id,
@@ -67,11 +73,13 @@ class RoutineDAO(ProtectedBaseDAO):
                 detail=DATA_DOES_NOT_EXIST,
             )
 
+        start, end = get_date_range(date)
         routine_logs = (
             self.db.query(RoutineLog)
             .filter(
                 RoutineLog.routine_id == routine_id,
-                func.date(RoutineLog.completed_at) == date,
+                RoutineLog.completed_at >= start,
+                RoutineLog.completed_at < end,
             )
             .order_by(
                 asc(RoutineLog.routine_element_id),
@@ -117,6 +125,9 @@ class RoutineDAO(ProtectedBaseDAO):
             repeat_days and routine.repeat_days_to_string(repeat_days)
         ) or routine.repeat_days
 
+        self.bump_version(ResourceVersion.ROUTINE)
+        self.invalidate_definitions(DefinitionCache.ROUTINES)
+
         return routine
 
     def create_routine(
@@ -133,6 +144,8 @@ class RoutineDAO(ProtectedBaseDAO):
         )
 
         self.db.add(routine)
+        self.bump_version(ResourceVersion.ROUTINE)
+        self.invalidate_definitions(DefinitionCache.ROUTINES)
 
         return routine
 
@@ -143,3 +156,6 @@ class RoutineDAO(ProtectedBaseDAO):
         routine = self.get_routine_by_id(routine_id)
 
         self.db.delete(routine)
+        self.bump_version(ResourceVersion.ROUTINE)
+        self.record_deletion(Tombstone.ROUTINE, routine.id)
+        self.invalidate_definitions(DefinitionCache.ROUTINES)
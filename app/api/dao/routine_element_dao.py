@@ -1,9 +1,21 @@
 from fastapi import HTTPException, status
-from sqlalchemy import asc
+from sqlalchemy import (
+    Integer,
+    Row,
+    String,
+    column,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+    values,
+)
 
 from .base import ProtectedBaseDAO
 from app.api.errors import DATA_DOES_NOT_EXIST
-from app.models.models import RoutineElement
+from app.core.definition_cache import DefinitionCache
+from app.models.models import RoutineElement, Tombstone
 from app.schemas.routine import RoutineItemBase, RoutineItemUpdate
 
 
@@ -26,21 +38,6 @@ class RoutineElementDAO(ProtectedBaseDAO):
 
         return routine_element
 
-    def get_routine_elements_by_routine_id(
-        self, routine_id: int
-    ) -> list[RoutineElement]:
-        routine_elements = (
-            self.db.query(RoutineElement)
-            .filter(
-                RoutineElement.routine_id == routine_id,
-                RoutineElement.user_id == self.user_id,
-            )
-            .order_by(asc(RoutineElement.order))
-            .all()
-        )
-
-        return routine_elements
-
     def update_routine_element(
         self,
         routine_element: RoutineElement,
@@ -53,6 +50,7 @@ class RoutineElementDAO(ProtectedBaseDAO):
         routine_element.duration_minutes = (
             duration_minutes or routine_element.duration_minutes
         )
+        self.invalidate_definitions(DefinitionCache.ROUTINES)
 
         return routine_element
 
@@ -75,74 +73,125 @@ class RoutineElementDAO(ProtectedBaseDAO):
 
     def delete_routine_element(self, routine_element: RoutineElement) -> None:
         self.db.delete(routine_element)
+        self.record_deletion(Tombstone.ROUTINE_ELEMENT, routine_element.id)
+        self.invalidate_definitions(DefinitionCache.ROUTINES)
 
     def delete_routine_element_by_id(self, routine_element_id: int) -> None:
         routine_element = self.get_routine_element_by_id(routine_element_id)
         self.delete_routine_element(routine_element)
 
-    def create_routine_element(
-        self,
-        routine_id: int,
-        title: str,
-        order: int,
-        duration_minutes: int,
-    ) -> RoutineElement:
-        routine_element = RoutineElement(
-            user_id=self.user_id,
-            routine_id=routine_id,
-            title=title,
-            order=order,
-            duration_minutes=duration_minutes,
-        )
-
-        self.db.add(routine_element)
-
-        return routine_element
-
+    # 제출된 목록과 기존 요소를 한 번에 비교해, 수정(UPDATE ... FROM VALUES),
+    # 추가(multi-row INSERT), 삭제(DELETE ... WHERE id IN) 를 각각 한 번씩만
+    # 실행한다. 결과는 다시 조회하지 않고 RETURNING 으로 받는다.
     def update_routine_elements(
         self,
         routine_id: int,
-        routine_elements: list[RoutineElement],
         updates_routine_elements: list[RoutineItemUpdate],
-    ) -> list[RoutineElement]:
-        routine_elements_dict = {
-            routine_element.id: routine_element
-            for routine_element in routine_elements
-        }
+    ) -> list[Row]:
+        existing_ids = set(
+            self.db.scalars(
+                select(RoutineElement.id).where(
+                    RoutineElement.routine_id == routine_id,
+                    RoutineElement.user_id == self.user_id,
+                )
+            ).all()
+        )
 
+        updates = []
+        creates = []
         for index, update_routine_element in enumerate(
             updates_routine_elements
         ):
-            routine_element = routine_elements_dict.get(
-                update_routine_element.id
-            )
-
-            if routine_element and routine_id == routine_element.routine_id:
-                self.update_routine_element(
-                    routine_element=routine_element,
-                    title=update_routine_element.title,
-                    order=index,
-                    duration_minutes=update_routine_element.duration_minutes,
-                )
-
-                routine_elements_dict.pop(update_routine_element.id)
-            elif update_routine_element.id is None:
-                self.create_routine_element(
-                    routine_id=routine_id,
-                    title=update_routine_element.title,
-                    order=index,
-                    duration_minutes=update_routine_element.duration_minutes,
-                )
+            if update_routine_element.id is None:
+                creates.append((index, update_routine_element))
+            elif update_routine_element.id in existing_ids:
+                existing_ids.remove(update_routine_element.id)
+                updates.append((index, update_routine_element))
             else:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=DATA_DOES_NOT_EXIST,
                 )
 
-        for routine_element in routine_elements_dict.values():
-            self.delete_routine_element(routine_element)
+        returning = (
+            RoutineElement.id,
+            RoutineElement.title,
+            RoutineElement.order,
+            RoutineElement.duration_minutes,
+            RoutineElement.created_at,
+            RoutineElement.updated_at,
+        )
+        routine_elements = []
+
+        if updates:
+            new_values = values(
+                column("id", Integer),
+                column("title", String),
+                column("order", Integer),
+                column("duration_minutes", Integer),
+                name="new_values",
+            ).data(
+                [
+                    (item.id, item.title, index, item.duration_minutes)
+                    for index, item in updates
+                ]
+            )
+
+            # 빈 제목과 0 분은 기존 값을 유지한다.
+            routine_elements += self.db.execute(
+                update(RoutineElement)
+                .where(
+                    RoutineElement.id == new_values.c.id,
+                    RoutineElement.user_id == self.user_id,
+                )
+                .values(
+                    title=func.coalesce(
+                        func.nullif(new_values.c.title, ""),
+                        RoutineElement.title,
+                    ),
+                    order=new_values.c.order,
+                    duration_minutes=func.coalesce(
+                        func.nullif(new_values.c.duration_minutes, 0),
+                        RoutineElement.duration_minutes,
+                    ),
+                )
+                .returning(*returning)
+                .execution_options(synchronize_session="fetch")
+            ).all()
+
+        if creates:
+            routine_elements += self.db.execute(
+                insert(RoutineElement)
+                .values(
+                    [
+                        dict(
+                            user_id=self.user_id,
+                            routine_id=routine_id,
+                            title=item.title,
+                            order=index,
+                            duration_minutes=item.duration_minutes,
+                        )
+                        for index, item in creates
+                    ]
+                )
+                .returning(*returning)
+            ).all()
+
+        if existing_ids:
+            deleted_ids = self.db.scalars(
+                delete(RoutineElement)
+                .where(
+                    RoutineElement.id.in_(existing_ids),
+                    RoutineElement.user_id == self.user_id,
+                )
+                .returning(RoutineElement.id)
+                .execution_options(synchronize_session="fetch")
+            ).all()
+            self.record_deletion(Tombstone.ROUTINE_ELEMENT, *deleted_ids)
+
+        self.invalidate_definitions(DefinitionCache.ROUTINES)
 
-        return self.get_routine_elements_by_routine_id(routine_id)
+        return sorted(routine_elements, key=lambda element: element.order)
 
     def create_routine_elements(
         self,
@@ -161,5 +210,6 @@ class RoutineElementDAO(ProtectedBaseDAO):
         ]
 
         self.db.add_all(elements)
+        self.invalidate_definitions(DefinitionCache.ROUTINES)
 
         return elements
@@ -1,10 +1,18 @@
 from datetime import date
 from typing import List
 
-from sqlalchemy import func
+from fastapi import HTTPException, status
+from sqlalchemy import and_, insert, select
 
 from .base import ProtectedBaseDAO
-from app.models.models import RoutineLog
+from app.api.errors import DATA_DOES_NOT_EXIST
+from app.core.utils import get_date_range
+from app.models.models import (
+    ResourceVersion,
+    Routine,
+    RoutineElement,
+    RoutineLog,
+)
 from app.schemas.routine import RoutineLogBase
 
 
@@ -12,26 +20,70 @@ class RoutineLogDAO(ProtectedBaseDAO):
     def get_routine_logs_by_date(
         self, routine_id: int, target_date: date
     ) -> List[RoutineLog]:
+        start, end = get_date_range(target_date)
         log = (
             self.db.query(RoutineLog)
             .filter(
                 RoutineLog.routine_id == routine_id,
-                target_date == func.date(RoutineLog.completed_at),
+                RoutineLog.completed_at >= start,
+                RoutineLog.completed_at < end,
             )
             .all()
         )
 
         return log
 
-    def put_logs(self, routine_id: int, logs: List[RoutineLogBase]):
-        for log in logs:
-            routine_log = RoutineLog(
-                routine_id=routine_id,
-                routine_element_id=log.routine_item_id,
-                duration_seconds=log.duration_seconds,
-                is_skipped=bool(log.is_skipped),
+    def check_routine_elements_owned(
+        self, routine_id: int, element_ids: set[int]
+    ) -> None:
+        rows = self.db.execute(
+            select(Routine.id, RoutineElement.id.label("element_id"))
+            .outerjoin(
+                RoutineElement,
+                and_(
+                    RoutineElement.routine_id == Routine.id,
+                    RoutineElement.id.in_(element_ids),
+                ),
             )
+            .where(Routine.id == routine_id, Routine.user_id == self.user_id)
+        ).all()
 
-            self.db.add(routine_log)
+        owned_element_ids = {
+            row.element_id for row in rows if row.element_id is not None
+        }
 
-        return routine_log
+        if not rows or owned_element_ids != element_ids:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=DATA_DOES_NOT_EXIST,
+            )
+
+    def put_logs(
+        self, routine_id: int, logs: List[RoutineLogBase]
+    ) -> List[RoutineLog]:
+        self.check_routine_elements_owned(
+            routine_id, {log.routine_item_id for log in logs}
+        )
+
+        if not logs:
+            return []
+
+        routine_logs = self.db.scalars(
+            insert(RoutineLog)
+            .values(
+                [
+                    dict(
+                        routine_id=routine_id,
+                        routine_element_id=log.routine_item_id,
+                        duration_seconds=log.duration_seconds,
+                        is_skipped=bool(log.is_skipped),
+                    )
+                    for log in logs
+                ]
+            )
+            .returning(RoutineLog)
+        ).all()
+        self.bump_version(ResourceVersion.ROUTINE)
+        self.publish_event("routine_log.put", id=routine_id)
+
+        return routine_logs
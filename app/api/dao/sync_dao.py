@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+
+from .base import ProtectedBaseDAO
+from app.api.errors import INVALID_SYNC_TOKEN
+from app.core.config import SYNC_OVERLAP_SECONDS
+from app.core.utils import decode_cursor, encode_cursor
+from app.models.models import (
+    Habit,
+    HabitLog,
+    Routine,
+    RoutineElement,
+    RoutineLog,
+    Todo,
+    Tombstone,
+)
+
+
+class SyncDAO(ProtectedBaseDAO):
+    # 토큰은 조회를 시작한 DB 시각이다. updated_at 은 트랜잭션 시작 시각으로
+    # 기록되므로 조회 이후에 커밋된 변경도 놓치지 않도록 SYNC_OVERLAP_SECONDS
+    # 만큼 겹쳐서 조회한다. 따라서 같은 행이 다시 내려갈 수 있다.
+    def get_sync_time(self) -> datetime:
+        return self.db.scalar(select(func.localtimestamp()))
+
+    def encode_sync_token(self, sync_time: datetime) -> str:
+        return encode_cursor(sync_time.isoformat())
+
+    def decode_sync_token(self, token: str) -> datetime:
+        values = decode_cursor(token)
+
+        try:
+            (sync_time,) = values
+            sync_time = datetime.fromisoformat(sync_time)
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=INVALID_SYNC_TOKEN,
+            )
+
+        return sync_time - timedelta(seconds=SYNC_OVERLAP_SECONDS)
+
+    def get_changed(self, model, since: datetime | None) -> List:
+        query = select(model).where(model.user_id == self.user_id)
+
+        if since is not None:
+            query = query.where(model.updated_at >= since)
+
+        return self.db.scalars(query.order_by(model.id)).all()
+
+    # 기록은 추가만 되므로 completed_at 으로 찾는다. (파티션 범위도 좁혀진다)
+    def get_habit_logs(self, since: datetime | None) -> List[HabitLog]:
+        query = (
+            select(HabitLog)
+            .join(Habit, Habit.id == HabitLog.habit_id)
+            .where(Habit.user_id == self.user_id)
+        )
+
+        if since is not None:
+            query = query.where(HabitLog.completed_at >= since)
+
+        return self.db.scalars(query.order_by(HabitLog.id)).all()
+
+    def get_routine_logs(self, since: datetime | None) -> List[RoutineLog]:
+        query = (
+            select(RoutineLog)
+            .join(Routine, Routine.id == RoutineLog.routine_id)
+            .where(Routine.user_id == self.user_id)
+        )
+
+        if since is not None:
+            query = query.where(RoutineLog.completed_at >= since)
+
+        return self.db.scalars(query.order_by(RoutineLog.id)).all()
+
+    def get_deleted(self, since: datetime) -> dict[str, List[int]]:
+        rows = self.db.execute(
+            select(Tombstone.family, Tombstone.record_id)
+            .where(
+                Tombstone.user_id == self.user_id,
+                Tombstone.deleted_at >= since,
+            )
+            .order_by(Tombstone.id)
+        ).all()
+
+        deleted = {}
+        for row in rows:
+            deleted.setdefault(row.family, []).append(row.record_id)
+
+        return deleted
+
+    def get_changes(self, since: datetime | None) -> dict:
+        return dict(
+            todos=self.get_changed(Todo, since),
+            routines=self.get_changed(Routine, since),
+            routine_elements=self.get_changed(RoutineElement, since),
+            habits=self.get_changed(Habit, since),
+            habit_logs=self.get_habit_logs(since),
+            routine_logs=self.get_routine_logs(since),
+            deleted={} if since is None else self.get_deleted(since),
+        )
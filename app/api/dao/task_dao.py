@@ -0,0 +1,207 @@
+from datetime import date, timedelta
+from typing import Any, Dict, List, Set
+
+from sqlalchemy import (
+    JSON,
+    asc,
+    desc,
+    func,
+    literal,
+    nullsfirst,
+    select,
+    text,
+    type_coerce,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from app.core.utils import get_date_range
+from app.models.models import (
+    Habit,
+    HabitLog,
+    Routine,
+    RoutineElement,
+    RoutineLog,
+    Todo,
+)
+
+from .base import ProtectedBaseDAO
+
+
+def _json_object(*columns, **extra):
+    args = []
+    for column in columns:
+        args.extend([literal(column.key), column])
+    for key, value in extra.items():
+        args.extend([literal(key), value])
+
+    return func.json_build_object(*args)
+
+
+def _json_list(element, *order_by):
+    return func.coalesce(
+        func.json_agg(aggregate_order_by(element, *order_by)),
+        text("'[]'::json"),
+    )
+
+
+class TaskDAO(ProtectedBaseDAO):
+    def _routine_filter(self, weekdays: Set[int]):
+        return (
+            Routine.user_id == self.user_id,
+            Routine.repeats_on_any(weekdays),
+        )
+
+    def _habit_filter(self, weekdays: Set[int]):
+        return (
+            Habit.user_id == self.user_id,
+            Habit.activated,
+            Habit.repeats_on_any(weekdays),
+        )
+
+    def _todo_list_query(self, start, end):
+        return select(
+            _json_list(
+                _json_object(
+                    Todo.id,
+                    Todo.title,
+                    Todo.order,
+                    Todo.target_date,
+                    Todo.content,
+                    Todo.created_at,
+                    Todo.updated_at,
+                    Todo.completed_at,
+                ),
+                nullsfirst(desc(Todo.completed_at)),
+                desc(Todo.created_at),
+            )
+        ).where(
+            Todo.user_id == self.user_id,
+            Todo.target_date >= start,
+            Todo.target_date < end,
+        )
+
+    def _routine_list_query(self, weekdays: Set[int]):
+        routine_elements = (
+            select(
+                _json_list(
+                    _json_object(
+                        RoutineElement.id,
+                        RoutineElement.title,
+                        RoutineElement.order,
+                        RoutineElement.duration_minutes,
+                        RoutineElement.created_at,
+                        RoutineElement.updated_at,
+                    ),
+                    asc(RoutineElement.order),
+                )
+            )
+            .where(RoutineElement.routine_id == Routine.id)
+            .scalar_subquery()
+        )
+
+        return select(
+            _json_list(
+                _json_object(
+                    Routine.id,
+                    Routine.title,
+                    Routine.start_time_minutes,
+                    Routine.repeat_days_mask,
+                    Routine.created_at,
+                    Routine.updated_at,
+                    routine_elements=routine_elements,
+                ),
+                asc(Routine.start_time_minutes),
+                asc(Routine.id),
+            )
+        ).where(*self._routine_filter(weekdays))
+
+    def _routine_log_list_query(self, weekdays: Set[int], start, end):
+        routine_ids = select(Routine.id).where(*self._routine_filter(weekdays))
+
+        return select(
+            _json_list(
+                _json_object(
+                    RoutineLog.routine_id,
+                    RoutineLog.routine_element_id,
+                    RoutineLog.duration_seconds,
+                    RoutineLog.completed_at,
+                    RoutineLog.is_skipped,
+                ),
+                desc(RoutineLog.routine_id),
+                asc(RoutineLog.routine_element_id),
+                asc(RoutineLog.completed_at),
+                asc(RoutineLog.id),
+            )
+        ).where(
+            RoutineLog.routine_id.in_(routine_ids),
+            RoutineLog.completed_at >= start,
+            RoutineLog.completed_at < end,
+        )
+
+    def _habit_list_query(self, weekdays: Set[int]):
+        return select(
+            _json_list(
+                _json_object(
+                    Habit.id,
+                    Habit.title,
+                    Habit.start_time_minutes,
+                    Habit.end_time_minutes,
+                    Habit.repeat_time_minutes,
+                    Habit.repeat_days_mask,
+                    Habit.activated,
+                    Habit.created_at,
+                    Habit.updated_at,
+                ),
+                desc(Habit.id),
+            )
+        ).where(*self._habit_filter(weekdays))
+
+    def _habit_log_list_query(self, weekdays: Set[int], start, end):
+        habit_ids = select(Habit.id).where(*self._habit_filter(weekdays))
+
+        return select(
+            _json_list(
+                _json_object(
+                    HabitLog.id,
+                    HabitLog.habit_id,
+                    HabitLog.completed_at,
+                ),
+                desc(HabitLog.id),
+            )
+        ).where(
+            HabitLog.habit_id.in_(habit_ids),
+            HabitLog.completed_at >= start,
+            HabitLog.completed_at < end,
+        )
+
+    # 기간 안의 태스크를 테이블마다 한 번씩, 하나의 SELECT 로 가져온다.
+    def get_task_by_range(
+        self, start_date: date, end_date: date
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        start, end = get_date_range(start_date, end_date)
+        weekdays = {
+            (start_date + timedelta(days=offset)).weekday()
+            for offset in range(min((end_date - start_date).days + 1, 7))
+        }
+
+        queries = dict(
+            todo_list=self._todo_list_query(start, end),
+            routine_list=self._routine_list_query(weekdays),
+            routine_log_list=self._routine_log_list_query(
+                weekdays, start, end
+            ),
+            habit_list=self._habit_list_query(weekdays),
+            habit_log_list=self._habit_log_list_query(weekdays, start, end),
+        )
+
+        statement = select(
+            *[
+                type_coerce(query.scalar_subquery(), JSON).label(name)
+                for name, query in queries.items()
+            ]
+        )
+
+        return dict(self.db.execute(statement).one()._mapping)
+
+    def get_daily_task(self, target: date) -> Dict[str, List[Dict[str, Any]]]:
+        return self.get_task_by_range(target, target)
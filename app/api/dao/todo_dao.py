@@ -1,11 +1,22 @@
 from datetime import date, datetime
 from pytz import timezone
 from operator import and_
-from typing import List
+from typing import List, Tuple
 from fastapi import HTTPException, status
-from sqlalchemy import asc, desc, func, nullsfirst
-from app.api.errors import DATA_DOES_NOT_EXIST
-from app.models.models import Todo
+from sqlalchemy import (
+    Integer,
+    asc,
+    column,
+    desc,
+    nullsfirst,
+    or_,
+    select,
+    update,
+    values,
+)
+from app.api.errors import DATA_DOES_NOT_EXIST, INVALID_CURSOR
+from app.core.utils import decode_cursor, encode_cursor, get_date_range
+from app.models.models import ResourceVersion, Todo, Tombstone
 from app.schemas.todo import TodoOrderUpdate
 
 from .base import ProtectedBaseDAO
@@ -43,6 +54,9 @@ class TodoDAO(ProtectedBaseDAO):
         )
 
         self.db.add(todo)
+        self.db.flush()
+        self.bump_version(ResourceVersion.TODO)
+        self.publish_event("todo.created", id=todo.id)
 
         return todo
 
@@ -72,9 +86,12 @@ class TodoDAO(ProtectedBaseDAO):
                 detail=DATA_DOES_NOT_EXIST,
             )
 
+        event_type = "todo.updated"
+
         if self.check_completed_updated(completed, todo.completed_at):
             if completed:
                 todo.completed_at = datetime.now(timezone("Asia/Seoul"))
+                event_type = "todo.completed"
             else:
                 todo.completed_at = None
 
@@ -82,6 +99,9 @@ class TodoDAO(ProtectedBaseDAO):
         todo.content = content
         todo.target_date = target_date
 
+        self.bump_version(ResourceVersion.TODO)
+        self.publish_event(event_type, id=todo.id)
+
         return todo
 
     def delete_todo(self, todo_id: int) -> None:
@@ -94,17 +114,70 @@ class TodoDAO(ProtectedBaseDAO):
             )
 
         self.db.delete(todo)
+        self.bump_version(ResourceVersion.TODO)
+        self.record_deletion(Tombstone.TODO, todo.id)
 
         return None
 
     def update_todo_list_order(self, todo_list: List[TodoOrderUpdate]) -> None:
-        for todo in todo_list:
-            target_todo = self.get_todo_by_id(todo_id=todo.id)
+        # 같은 id 가 여러 번 들어오면 마지막 값을 사용한다.
+        orders = {todo.id: todo.order for todo in todo_list}
+
+        if not orders:
+            return None
+
+        owned_ids = self.db.scalars(
+            select(Todo.id).where(
+                Todo.id.in_(orders.keys()), Todo.user_id == self.user_id
+            )
+        ).all()
+
+        if len(owned_ids) != len(orders):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=DATA_DOES_NOT_EXIST,
+            )
+
+        new_orders = values(
+            column("id", Integer),
+            column("order", Integer),
+            name="new_orders",
+        ).data(list(orders.items()))
 
-            target_todo.order = todo.order
+        self.db.execute(
+            update(Todo)
+            .where(
+                Todo.id == new_orders.c.id,
+                Todo.user_id == self.user_id,
+            )
+            .values(order=new_orders.c.order)
+            .execution_options(synchronize_session="fetch")
+        )
+        self.bump_version(ResourceVersion.TODO)
 
         return None
 
+    def encode_todo_list_cursor(self, todo: Todo) -> str:
+        return encode_cursor(todo.target_date.isoformat(), todo.order, todo.id)
+
+    def decode_todo_list_cursor(
+        self, cursor: str
+    ) -> Tuple[datetime, int, int]:
+        values = decode_cursor(cursor)
+
+        try:
+            target_date, order, todo_id = values
+            return (
+                datetime.fromisoformat(target_date),
+                int(order),
+                int(todo_id),
+            )
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=INVALID_CURSOR,
+            )
+
     def get_todo_list(
         self,
         limit: int,
@@ -112,6 +185,7 @@ class TodoDAO(ProtectedBaseDAO):
         completed: bool = False,
         start_date: date = None,
         end_date: date = None,
+        cursor: str | None = None,
     ) -> List[Todo]:
         query = self.db.query(Todo).filter(Todo.user_id == self.user_id)
 
@@ -121,15 +195,31 @@ class TodoDAO(ProtectedBaseDAO):
             query = query.filter(Todo.completed_at.is_(None))
 
         if start_date and end_date:
+            start, end = get_date_range(start_date, end_date)
             query = query.filter(
                 and_(
-                    func.date(Todo.target_date) >= start_date,
-                    func.date(Todo.target_date) <= end_date,
+                    Todo.target_date >= start,
+                    Todo.target_date < end,
                 )
             )
 
+        # 커서가 있으면 OFFSET 대신 마지막 항목 다음부터 읽는다.
+        if cursor:
+            target_date, order, todo_id = self.decode_todo_list_cursor(cursor)
+            query = query.filter(
+                Todo.target_date <= target_date,
+                or_(
+                    Todo.target_date < target_date,
+                    Todo.order > order,
+                    and_(Todo.order == order, Todo.id > todo_id),
+                ),
+            )
+            offset = 0
+
         todo = (
-            query.order_by(desc(Todo.target_date), asc(Todo.order))
+            query.order_by(
+                desc(Todo.target_date), asc(Todo.order), asc(Todo.id)
+            )
             .limit(limit)
             .offset(offset)
             .all()
@@ -141,11 +231,13 @@ class TodoDAO(ProtectedBaseDAO):
         self,
         date: date,
     ) -> List[Todo]:
+        start, end = get_date_range(date)
         todo = (
             self.db.query(Todo)
             .filter(
                 Todo.user_id == self.user_id,
-                func.date(Todo.target_date) == date,
+                Todo.target_date >= start,
+                Todo.target_date < end,
             )
             .order_by(
                 nullsfirst(desc(Todo.completed_at)),
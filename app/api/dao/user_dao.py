@@ -4,8 +4,11 @@ from app.api.errors import (
     INCORRECT_USERNAME_OR_PASSWORD,
     USERNAME_CANNOT_BE_CHANGED,
 )
-from app.core.auth import verify_password
-from app.models.models import User
+from app.core.auth import (
+    invalidate_cached_user_after_commit,
+    verify_password,
+)
+from app.models.models import ResourceVersion, User
 from app.schemas.user import UserUpdateInput
 
 from .base import ProtectedBaseDAO
@@ -33,4 +36,7 @@ class UserDAO(ProtectedBaseDAO):
         if data.nickname:
             user.nickname = data.nickname
 
+        invalidate_cached_user_after_commit(self.db, self.username)
+        self.bump_version(ResourceVersion.USER)
+
         return user
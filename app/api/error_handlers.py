@@ -1,8 +1,9 @@
 from typing import List
 from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 
+from app.api.etag import NotModified
 from app.schemas.response import ErrorResponse
 
 
@@ -17,6 +18,13 @@ def validation_exception_handler(app: FastAPI):
             headers=exc.headers,
         )
 
+    @app.exception_handler(NotModified)
+    async def not_modified_handler(request: Request, exc: NotModified):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": exc.etag},
+        )
+
     def _filtered_location_list(location: List[str]) -> List[str]:
         if location and location[0] in ("body", "path", "query"):
             return location[1:]
@@ -7,6 +7,9 @@ INVALID_VALUE_RANGE = "INVALID_VALUE_RANGE"
 DUPLICATED_VALUE = "DUPLICATED_VALUE"
 VALUE_MUST_BE_ALPHANUM = "VALUE_MUST_BE_ALPHANUM"
 START_DATE_GREATER_THAN_END_DATE = "START_DATE_GREATER_THAN_END_DATE"
+INVALID_CURSOR = "INVALID_CURSOR"
+DATE_RANGE_TOO_LONG = "DATE_RANGE_TOO_LONG"
+INVALID_SYNC_TOKEN = "INVALID_SYNC_TOKEN"
 
 
 USERNAME_ALREADY_EXISTS = "USERNAME_ALREADY_EXISTS"
@@ -18,6 +21,9 @@ EXPIRED_TOKEN = "EXPIRED_TOKEN"
 
 DATA_DOES_NOT_EXIST = "DATA_DOES_NOT_EXIST"
 
+SERVER_BUSY = "SERVER_BUSY"
+TOO_MANY_CONNECTIONS = "TOO_MANY_CONNECTIONS"
+
 # signup
 PASSWORD_NOT_MATCH = "PASSWORD_NOT_MATCH"
 
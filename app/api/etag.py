@@ -0,0 +1,70 @@
+import hashlib
+
+from fastapi import Depends, Request, Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.auth import Principal, get_current_principal
+from app.database.db import async_compatible, get_db
+from app.models.models import ResourceVersion
+
+
+class NotModified(Exception):
+    def __init__(self, etag: str):
+        self.etag = etag
+
+
+def _parse_if_none_match(value: str) -> set[str]:
+    tags = set()
+    for tag in value.split(","):
+        tag = tag.strip()
+        # If-None-Match 는 weak 비교를 사용한다.
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        tags.add(tag)
+
+    return tags
+
+
+def get_resource_versions(
+    db: Session, user_id: int, families: tuple[str, ...]
+) -> dict[str, int]:
+    rows = db.execute(
+        select(ResourceVersion.family, ResourceVersion.version).where(
+            ResourceVersion.user_id == user_id,
+            ResourceVersion.family.in_(families),
+        )
+    ).all()
+
+    return {row.family: row.version for row in rows}
+
+
+# 응답이 의존하는 리소스 종류의 버전으로 ETag 를 만든다.
+# If-None-Match 가 같으면 조회 쿼리를 실행하지 않고 304 로 응답한다.
+def etag(*families: str):
+    @async_compatible
+    def dependency(
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_db),
+        principal: Principal = Depends(get_current_principal),
+    ) -> str:
+        versions = get_resource_versions(db, principal.id, families)
+        source = "|".join(
+            [str(request.url.path), str(request.url.query), str(principal.id)]
+            + [f"{family}:{versions.get(family, 0)}" for family in families]
+        )
+        value = f'"{hashlib.sha1(source.encode()).hexdigest()}"'
+
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and (
+            if_none_match.strip() == "*"
+            or value in _parse_if_none_match(if_none_match)
+        ):
+            raise NotModified(value)
+
+        response.headers["ETag"] = value
+
+        return value
+
+    return dependency
@@ -0,0 +1,170 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import Counter, Gauge, LabeledHistogram, registry
+from app.core.request_stats import (
+    RequestStats,
+    get_request_stats,
+    log_request,
+    request_stats,
+)
+from app.core.tracing import request_span, tracing_enabled
+
+http_requests_in_flight = registry.register(
+    Gauge(
+        "taskie_http_requests_in_flight",
+        "Requests currently being processed.",
+    )
+)
+http_requests = registry.register(
+    Counter(
+        "taskie_http_requests_total",
+        "Processed requests by route and status.",
+        ("operation_id", "method", "status"),
+    )
+)
+http_request_duration = registry.register(
+    LabeledHistogram(
+        "taskie_http_request_duration_seconds",
+        "Request latency by route.",
+        ("operation_id", "method"),
+    )
+)
+http_request_db_duration = registry.register(
+    LabeledHistogram(
+        "taskie_http_request_db_seconds",
+        "Time spent executing SQL per request by route.",
+        ("operation_id", "method"),
+    )
+)
+
+
+# 요청마다 SQL 실행 횟수와 시간을 모아 Server-Timing 헤더와 접근 로그로 남긴다.
+class RequestStatsMiddleware:
+    def __init__(self, app: ASGIApp, access_log: bool = True):
+        self.app = app
+        self.access_log = access_log
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        status = 500
+
+        async def send_with_server_timing(message: Message):
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (b"server-timing", stats.server_timing().encode())
+                )
+                message = {**message, "headers": headers}
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            request_stats.reset(token)
+
+            if self.access_log:
+                log_request(scope["method"], scope["path"], status, stats)
+
+
+def _operation_id(scope: Scope) -> str:
+    route = scope.get("route")
+
+    if route is None:
+        return "unmatched"
+    return getattr(route, "operation_id", None) or route.name
+
+
+# 라우트(operation_id)별 지연 시간, 처리 중인 요청 수, SQL 시간을 기록한다.
+# SQL 시간은 RequestStatsMiddleware 가 모은 값을 사용하므로 그 안쪽에 둔다.
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+
+            operation_id = _operation_id(scope)
+            method = scope["method"]
+
+            http_request_duration.observe(
+                time.perf_counter() - started_at,
+                operation_id=operation_id,
+                method=method,
+            )
+            http_requests.inc(
+                operation_id=operation_id, method=method, status=status
+            )
+
+            stats = get_request_stats()
+            if stats is not None:
+                http_request_db_duration.observe(
+                    stats.db_time, operation_id=operation_id, method=method
+                )
+
+
+# 요청마다 SERVER span 을 만들고, DAO/Repository/SQL span 이 그 아래에 달린다.
+class TracingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not tracing_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+
+        with request_span(method, scope["path"], scope["headers"]) as span:
+            status = 500
+
+            async def send_with_status(message: Message):
+                nonlocal status
+
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                if span.is_recording():
+                    route = scope.get("route")
+                    if route is not None:
+                        span.update_name(f"{method} {route.path}")
+                        span.set_attribute("http.route", route.path)
+
+                    span.set_attribute(
+                        "taskie.operation_id", _operation_id(scope)
+                    )
+                    span.set_attribute("http.response.status_code", status)
@@ -1,27 +1,41 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
-from app.core.auth import get_current_user
-from app.database.db import get_db
-from app.models.models import User
+from app.core.auth import Principal, get_current_principal
+from app.database.db import async_compatible, get_db
+from .batch_repository import BatchRepository
 from .habit_repository import HabitRepository
 from .task_repository import TaskRepository
 from .routine_repository import RoutineRepository
 
 
+@async_compatible
 def get_routine_repository(
-    db: Session = Depends(get_db), user: User = Depends(get_current_user)
+    db: Session = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
 ):
     return RoutineRepository(db=db, user=user)
 
 
+@async_compatible
 def get_habit_repository(
-    db: Session = Depends(get_db), user: User = Depends(get_current_user)
+    db: Session = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
 ):
     return HabitRepository(db=db, user=user)
 
 
+@async_compatible
 def get_task_repository(
-    db: Session = Depends(get_db), user: User = Depends(get_current_user)
+    db: Session = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
 ):
     return TaskRepository(db=db, user=user)
+
+
+@async_compatible
+def get_batch_repository(
+    db: Session = Depends(get_db),
+    user: Principal = Depends(get_current_principal),
+):
+    return BatchRepository(db=db, user=user)
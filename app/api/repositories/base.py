@@ -1,16 +1,39 @@
+from typing import Any, Callable
+
 from sqlalchemy.orm import Session
 
-from app.models.models import User
+from app.core.auth import Principal
+from app.core.definition_cache import definition_cache
+from app.core.events import publish_after_commit
+from app.core.tracing import TracedMixin
+from app.models.models import ResourceVersion, Tombstone, User
 
 
-class BaseRepository:
+class BaseRepository(TracedMixin):
     def __init__(self, db: Session):
         self.db = db
 
 
 class ProtectedBaseRepository(BaseRepository):
-    def __init__(self, db: Session, user: User):
+    def __init__(self, db: Session, user: User | Principal):
         super().__init__(db)
 
         self.user_id = user.id
         self.username = user.username
+
+    def bump_version(self, *families: str) -> None:
+        self.db.execute(ResourceVersion.bump(self.user_id, families))
+
+    def record_deletion(self, family: str, *record_ids: int) -> None:
+        self.db.execute(Tombstone.record(self.user_id, family, record_ids))
+
+    def publish_event(self, event_type: str, **data) -> None:
+        publish_after_commit(self.db, self.user_id, event_type, **data)
+
+    def invalidate_definitions(self, family: str) -> None:
+        definition_cache.invalidate_after_commit(self.db, family, self.user_id)
+
+    def load_definitions(self, family: str, loader: Callable[[], Any]) -> Any:
+        return definition_cache.get_or_load(
+            self.db, family, self.user_id, loader
+        )
@@ -0,0 +1,70 @@
+from typing import Any, Tuple
+
+from fastapi import status
+from sqlalchemy.orm import Session
+
+from app.api.dao.routine_log_dao import RoutineLogDAO
+from app.api.dao.todo_dao import TodoDAO
+from app.core.auth import Principal
+from app.schemas.batch import (
+    AchieveHabitOperation,
+    BatchOperation,
+    CreateTodoOperation,
+    DeleteTodoOperation,
+    PutRoutineLogOperation,
+    UpdateTodoListOrderOperation,
+    UpdateTodoOperation,
+)
+
+from .base import ProtectedBaseRepository
+from .habit_repository import HabitRepository
+
+
+# 단건 API 와 같은 DAO / Repository 메서드로 작업을 실행한다. 트랜잭션은
+# 호출하는 쪽에서 관리한다.
+class BatchRepository(ProtectedBaseRepository):
+    def __init__(self, db: Session, user: Principal):
+        super().__init__(db, user)
+
+        self.todo_dao = TodoDAO(db=db, user=user)
+        self.habit_repository = HabitRepository(db=db, user=user)
+        self.routine_log_dao = RoutineLogDAO(db=db, user=user)
+
+    def execute(self, operation: BatchOperation) -> Tuple[int, Any]:
+        if isinstance(operation, CreateTodoOperation):
+            todo = self.todo_dao.create_todo(
+                title=operation.data.title,
+                content=operation.data.content,
+                target_date=operation.data.target_date,
+                order=operation.data.order,
+            )
+            return status.HTTP_201_CREATED, todo
+        elif isinstance(operation, UpdateTodoOperation):
+            todo = self.todo_dao.update_todo(
+                todo_id=operation.todo_id,
+                title=operation.data.title,
+                target_date=operation.data.target_date,
+                completed=operation.data.completed,
+                content=operation.data.content,
+            )
+            return status.HTTP_200_OK, todo
+        elif isinstance(operation, DeleteTodoOperation):
+            self.todo_dao.delete_todo(todo_id=operation.todo_id)
+            return status.HTTP_204_NO_CONTENT, None
+        elif isinstance(operation, UpdateTodoListOrderOperation):
+            self.todo_dao.update_todo_list_order(
+                todo_list=operation.data.todo_list
+            )
+            return status.HTTP_204_NO_CONTENT, None
+        elif isinstance(operation, AchieveHabitOperation):
+            log = self.habit_repository.achieve_habit(
+                habit_id=operation.habit_id
+            )
+            return status.HTTP_200_OK, log
+        elif isinstance(operation, PutRoutineLogOperation):
+            self.routine_log_dao.put_logs(
+                routine_id=operation.routine_id, logs=operation.data.logs
+            )
+            return status.HTTP_204_NO_CONTENT, None
+
+        raise ValueError(f"Unknown batch operation: {operation.op}")
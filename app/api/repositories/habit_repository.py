@@ -1,11 +1,26 @@
 from datetime import date
+from itertools import islice
 from typing import Optional
-from sqlalchemy import desc, func
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import desc
 from pytest import Session
 
+from app.core.definition_cache import DefinitionCache
+from app.core.utils import get_date_range
 from app.exceptions.exceptions import DataNotFoundError
-from app.models.models import Habit, HabitLog, User
-from app.schemas.habit import HabitCreateInput, HabitUpdateInput, HabitWithLog
+from app.models.models import (
+    Habit,
+    HabitLog,
+    ResourceVersion,
+    Tombstone,
+    User,
+)
+from app.schemas.habit import (
+    HabitCreateInput,
+    HabitPublic,
+    HabitUpdateInput,
+    HabitWithLog,
+)
 
 from .base import ProtectedBaseRepository
 
@@ -25,38 +40,58 @@ class HabitRepository(ProtectedBaseRepository):
         )
 
         self.db.add(new_habit)
+        self.bump_version(ResourceVersion.HABIT)
+        self.invalidate_definitions(DefinitionCache.HABITS)
 
         return new_habit
 
+    # 캐시에는 jsonable_encoder 로 바꾼 값을 두고, 조건과 limit 을 먼저
+    # 적용한 뒤 돌려줄 습관만 HabitPublic 으로 만든다.
+    def get_habit_definitions(self) -> list[dict]:
+        def load():
+            habits = (
+                self.db.query(Habit)
+                .filter(Habit.user_id == self.user_id)
+                .order_by(desc(Habit.id))
+                .all()
+            )
+
+            return jsonable_encoder(
+                [HabitPublic.from_orm(habit) for habit in habits]
+            )
+
+        return self.load_definitions(DefinitionCache.HABITS, load)
+
     def get_habits(
         self,
         limit: int,
         weekday: int,
         last_id: int = None,
         activated: bool = True,
-    ):
-        query = self.db.query(Habit).filter(
-            Habit.user_id == self.user_id,
-            Habit.activated == activated,
+    ) -> list[HabitPublic]:
+        habits = (
+            habit
+            for habit in self.get_habit_definitions()
+            if habit["activated"] == activated
+            and (last_id is None or habit["id"] < last_id)
         )
 
-        if last_id is not None:
-            query = query.filter(Habit.id < last_id)
-
-        habits = query.order_by(desc(Habit.id)).limit(limit).all()
-
-        return habits
+        return [
+            HabitPublic.parse_obj(habit) for habit in islice(habits, limit)
+        ]
 
     def get_habit_logs_by_date(
         self,
         habit_ids: list[str],
         date: date,
     ):
+        start, end = get_date_range(date)
         logs = (
             self.db.query(HabitLog)
             .filter(
-                func.date(HabitLog.completed_at) == date,
                 HabitLog.habit_id.in_(habit_ids),
+                HabitLog.completed_at >= start,
+                HabitLog.completed_at < end,
             )
             .order_by(desc(HabitLog.id))
             .all()
@@ -65,7 +100,7 @@ class HabitRepository(ProtectedBaseRepository):
         return logs
 
     def _combine_habits_and_logs(
-        self, habits: list[Habit], logs: list[HabitLog], weekday: int
+        self, habits: list[HabitPublic], logs: list[HabitLog], weekday: int
     ):
         logs_by_habit_id = {}
 
@@ -113,17 +148,12 @@ class HabitRepository(ProtectedBaseRepository):
 
         return sorted(habit_list, key=sort_key)
 
-    def get_habits_by_weekday(self, weekday: int):
-        habits = (
-            self.db.query(Habit)
-            .filter(
-                Habit.user_id == self.user_id,
-                Habit.activated,
-                Habit.repeat_days.contains(weekday),
-            )
-            .order_by(desc(Habit.id))
-            .all()
-        )
+    def get_habits_by_weekday(self, weekday: int) -> list[HabitPublic]:
+        habits = [
+            HabitPublic.parse_obj(habit)
+            for habit in self.get_habit_definitions()
+            if habit["activated"] and weekday in habit["repeat_days"]
+        ]
 
         return habits
 
@@ -153,6 +183,9 @@ class HabitRepository(ProtectedBaseRepository):
             raise DataNotFoundError()
 
         self.db.delete(habit)
+        self.bump_version(ResourceVersion.HABIT)
+        self.record_deletion(Tombstone.HABIT, habit.id)
+        self.invalidate_definitions(DefinitionCache.HABITS)
 
         return None
 
@@ -171,6 +204,9 @@ class HabitRepository(ProtectedBaseRepository):
         )
         habit.activated = update_input.activated
 
+        self.bump_version(ResourceVersion.HABIT)
+        self.invalidate_definitions(DefinitionCache.HABITS)
+
         return habit
 
     def achieve_habit(self, habit_id: int) -> HabitLog:
@@ -182,5 +218,7 @@ class HabitRepository(ProtectedBaseRepository):
         log = HabitLog(habit_id=habit_id)
 
         self.db.add(log)
+        self.bump_version(ResourceVersion.HABIT)
+        self.publish_event("habit.achieved", id=habit_id)
 
         return log
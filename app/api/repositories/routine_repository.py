@@ -1,15 +1,18 @@
 from datetime import date
-from sqlalchemy import asc, desc, func
+from typing import List, Tuple
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import Row, asc, desc
 from sqlalchemy.orm import Session
 
 from app.api.dao.routine_dao import RoutineDAO
 from app.api.dao.routine_element_dao import RoutineElementDAO
 from app.api.dao.routine_log_dao import RoutineLogDAO
+from app.core.definition_cache import DefinitionCache
+from app.core.utils import get_date_range
 from app.models.models import Routine, RoutineLog, User
 from app.schemas.routine import (
     RoutineCreateInput,
     RoutinePublic,
-    RoutineItem,
     RoutineUpdateInput,
 )
 
@@ -26,7 +29,7 @@ class RoutineRepository(ProtectedBaseRepository):
 
     def update_routine(
         self, routine_id: int, routine: RoutineUpdateInput
-    ) -> Routine:
+    ) -> Tuple[Routine, List[Row]]:
         updated_routine = self.routine_dao.update_routine(
             routine_id=routine_id,
             title=routine.title,
@@ -34,15 +37,12 @@ class RoutineRepository(ProtectedBaseRepository):
             repeat_days=routine.repeat_days,
         )
 
-        self.routine_element_dao.update_routine_elements(
+        routine_elements = self.routine_element_dao.update_routine_elements(
             routine_id=routine_id,
-            routine_elements=updated_routine.routine_elements or [],
             updates_routine_elements=routine.routine_elements or [],
         )
 
-        self.db.flush()
-
-        return updated_routine
+        return updated_routine, routine_elements
 
     def create_routine(self, routine: RoutineCreateInput) -> RoutinePublic:
         new_routine = self.routine_dao.create_routine(
@@ -64,15 +64,35 @@ class RoutineRepository(ProtectedBaseRepository):
             routine=new_routine, routine_elements=routine_elements
         )
 
+    def get_routine_definitions(self) -> list[RoutinePublic]:
+        def load():
+            routines = self.routine_dao.get_routines()
+
+            return jsonable_encoder(
+                [
+                    RoutinePublic.from_routine(
+                        routine=routine,
+                        routine_elements=routine.routine_elements,
+                    )
+                    for routine in routines
+                ]
+            )
+
+        definitions = self.load_definitions(DefinitionCache.ROUTINES, load)
+
+        return [RoutinePublic.parse_obj(routine) for routine in definitions]
+
     def _get_routines_with_logs(
-        self, routines: list[Routine], target: date
+        self, routines: list[RoutinePublic], target: date
     ) -> list[RoutinePublic]:
         routine_ids = [routine.id for routine in routines]
+        start, end = get_date_range(target)
         routine_logs = (
             self.db.query(RoutineLog)
             .filter(
                 RoutineLog.routine_id.in_(routine_ids),
-                func.date(RoutineLog.completed_at) == target,
+                RoutineLog.completed_at >= start,
+                RoutineLog.completed_at < end,
             )
             .order_by(
                 desc(RoutineLog.routine_id),
@@ -89,38 +109,29 @@ class RoutineRepository(ProtectedBaseRepository):
 
             routine_log_map[log.routine_id][log.routine_element_id] = log
 
-        result_routine_list = []
         for routine in routines:
-            routine_with_logs = RoutinePublic.from_routine_with_log(
-                routine=routine, routine_items=[]
-            )
-            for element in routine.routine_elements:
-                routine_item = RoutineItem.from_routine_element(element, None)
-
-                if (
-                    routine_log_map.get(routine.id) is not None
-                    and routine_log_map[routine.id].get(routine_item.id)
-                    is not None
-                ):
-                    log = routine_log_map[routine.id][element.id]
+            logs = routine_log_map.get(routine.id, {})
+
+            for routine_item in routine.routine_elements:
+                log = logs.get(routine_item.id)
+
+                if log is not None:
                     routine_item.completed_at = log.completed_at
                     routine_item.completed_duration_seconds = (
                         log.duration_seconds
                     )
                     routine_item.is_skipped = log.is_skipped
 
-                routine_with_logs.routine_elements.append(routine_item)
-
-            result_routine_list.append(routine_with_logs)
-
-        return result_routine_list
+        return routines
 
     def get_routine_list(self, target: date) -> list[RoutinePublic]:
-        routines = self.routine_dao.get_routines()
+        routines = self.get_routine_definitions()
         return self._get_routines_with_logs(routines, target)
 
     def get_routine_by_date(self, target: date) -> list[RoutinePublic]:
-        routines = self.routine_dao.get_routines_by_weekday(
-            weekday=target.weekday()
-        )
+        routines = [
+            routine
+            for routine in self.get_routine_definitions()
+            if target.weekday() in routine.repeat_days
+        ]
         return self._get_routines_with_logs(routines, target)
@@ -1,29 +1,142 @@
-from datetime import date
+from datetime import date, timedelta
+from typing import Dict
 from pytest import Session
 from .base import ProtectedBaseRepository
 from app.models.models import User
 
-from app.api.dao.todo_dao import TodoDAO
-from .routine_repository import RoutineRepository
-from .habit_repository import HabitRepository
+from app.api.dao.task_dao import TaskDAO
+from app.core.utils import repeat_days_from_mask
+from app.schemas.habit import HabitWithLog
+from app.schemas.routine import RoutinePublic
 from app.schemas.task import TaskPublic
+from app.schemas.todo import TodoPublic
 
 
 class TaskRepository(ProtectedBaseRepository):
     def __init__(self, db: Session, user: User):
         super().__init__(db, user)
 
-        self.routine_repository = RoutineRepository(db=db, user=user)
-        self.todo_dao = TodoDAO(db=db, user=user)
-        self.habit_repository = HabitRepository(db=db, user=user)
+        self.task_dao = TaskDAO(db=db, user=user)
 
-    def get_all_task_by_date(self, date: date) -> TaskPublic:
-        todo_list = self.todo_dao.get_todo_list_by_date(date)
-        routine_list = self.routine_repository.get_routine_by_date(date)
-        habit_list = self.habit_repository.get_habits_with_log_by_date(date)
-
-        return TaskPublic(
-            todo_list=todo_list,
-            routine_list=routine_list,
-            habit_list=habit_list,
+    def _combine_routines_and_logs(
+        self, routines: list[dict], logs: list[dict]
+    ) -> list[RoutinePublic]:
+        routine_log_map = {}
+        for log in logs:
+            routine_logs = routine_log_map.setdefault(log["routine_id"], {})
+            routine_logs[log["routine_element_id"]] = log
+
+        result_routine_list = []
+        for routine in routines:
+            routine_logs = routine_log_map.get(routine["id"], {})
+            routine_items = []
+
+            for element in routine["routine_elements"]:
+                log = routine_logs.get(element["id"])
+                routine_items.append(
+                    dict(
+                        **element,
+                        completed_at=log and log["completed_at"],
+                        completed_duration_seconds=log
+                        and log["duration_seconds"],
+                        is_skipped=bool(log and log["is_skipped"]),
+                    )
+                )
+
+            result_routine_list.append(
+                RoutinePublic(
+                    id=routine["id"],
+                    title=routine["title"],
+                    start_time_minutes=routine["start_time_minutes"],
+                    repeat_days=repeat_days_from_mask(
+                        routine["repeat_days_mask"]
+                    ),
+                    created_at=routine["created_at"],
+                    updated_at=routine["updated_at"],
+                    routine_elements=routine_items,
+                )
+            )
+
+        return result_routine_list
+
+    def _combine_habits_and_logs(
+        self, habits: list[dict], logs: list[dict], weekday: int
+    ) -> list[HabitWithLog]:
+        logs_by_habit_id = {}
+        for log in logs:
+            logs_by_habit_id.setdefault(log["habit_id"], []).append(log)
+
+        result_habits = []
+        for habit in habits:
+            repeat_days = repeat_days_from_mask(habit["repeat_days_mask"])
+            result_habits.append(
+                HabitWithLog(
+                    **habit,
+                    repeat_days=repeat_days,
+                    near_weekday=HabitWithLog.calculate_near_weekday(
+                        repeat_days, weekday
+                    ),
+                    log_list=logs_by_habit_id.get(habit["id"], []),
+                )
+            )
+
+        return result_habits
+
+    def _group_by_date(
+        self, rows: list[dict], key: str
+    ) -> Dict[date, list[dict]]:
+        rows_by_date = {}
+        for row in rows:
+            row_date = date.fromisoformat(row[key][:10])
+            rows_by_date.setdefault(row_date, []).append(row)
+
+        return rows_by_date
+
+    def get_all_task_by_range(
+        self, start_date: date, end_date: date
+    ) -> Dict[date, TaskPublic]:
+        task = self.task_dao.get_task_by_range(start_date, end_date)
+
+        todos_by_date = self._group_by_date(task["todo_list"], "target_date")
+        routine_logs_by_date = self._group_by_date(
+            task["routine_log_list"], "completed_at"
+        )
+        habit_logs_by_date = self._group_by_date(
+            task["habit_log_list"], "completed_at"
         )
+
+        result = {}
+        for offset in range((end_date - start_date).days + 1):
+            target = start_date + timedelta(days=offset)
+            weekday = target.weekday()
+
+            routines = [
+                routine
+                for routine in task["routine_list"]
+                if weekday
+                in repeat_days_from_mask(routine["repeat_days_mask"])
+            ]
+            habits = [
+                habit
+                for habit in task["habit_list"]
+                if weekday in repeat_days_from_mask(habit["repeat_days_mask"])
+            ]
+
+            # 각 항목은 한 번씩만 검증하고, 이를 묶는 TaskPublic 은 검증하지 않는다.
+            result[target] = TaskPublic.construct(
+                todo_list=[
+                    TodoPublic.parse_obj(todo)
+                    for todo in todos_by_date.get(target, [])
+                ],
+                routine_list=self._combine_routines_and_logs(
+                    routines, routine_logs_by_date.get(target, [])
+                ),
+                habit_list=self._combine_habits_and_logs(
+                    habits, habit_logs_by_date.get(target, []), weekday
+                ),
+            )
+
+        return result
+
+    def get_all_task_by_date(self, date: date) -> TaskPublic:
+        return self.get_all_task_by_range(date, date)[date]
@@ -0,0 +1,145 @@
+import functools
+import inspect
+from typing import Any, get_args, get_origin
+
+import orjson
+from fastapi import Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from app.core.config import FAST_RESPONSE
+from app.core.request_stats import timed_phase
+
+
+# pydantic 모델은 이미 검증된 필드 값을 그대로 직렬화한다.
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+
+    raise TypeError
+
+
+class FastJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        with timed_phase("serialize"):
+            return orjson.dumps(
+                content, default=_default, option=orjson.OPT_NON_STR_KEYS
+            )
+
+
+# content 가 response_model 과 정확히 같은 타입의 모델(또는 그 list, dict)로만
+# 이루어져 있는지 확인한다. 하위 클래스는 응답에 없는 필드가 있을 수 있으므로
+# 제외한다.
+def is_built_response(content: Any, response_model: Any) -> bool:
+    origin = get_origin(response_model)
+
+    if origin is list:
+        (item_model,) = get_args(response_model)
+        return isinstance(content, list) and all(
+            is_built_response(item, item_model) for item in content
+        )
+    elif origin is dict:
+        _, item_model = get_args(response_model)
+        return isinstance(content, dict) and all(
+            is_built_response(item, item_model) for item in content.values()
+        )
+
+    return type(content) is response_model and issubclass(
+        response_model, BaseModel
+    )
+
+
+def _fast_response(
+    content: Any,
+    response_model: Any,
+    status_code: int | None,
+    sub_response: Response,
+) -> Any:
+    if not is_built_response(content, response_model):
+        return content
+
+    response = FastJSONResponse(
+        content, status_code=sub_response.status_code or status_code or 200
+    )
+    response.headers.raw.extend(sub_response.headers.raw)
+
+    return response
+
+
+# 컨트롤러가 응답 모델을 직접 만들어 반환하면 FastAPI 의 응답 검증과
+# jsonable_encoder 를 거치지 않고 바로 직렬화한다. 그 외의 반환값은 기존과
+# 같이 response_model 로 검증한다.
+def fast_response_endpoint(
+    endpoint, response_model: Any, status_code: int | None
+):
+    signature = inspect.signature(endpoint)
+    parameters = list(signature.parameters.values())
+
+    # 의존성에서 설정한 헤더를 옮기기 위해 FastAPI 의 sub response 를 받는다.
+    response_param = next(
+        (
+            parameter.name
+            for parameter in parameters
+            if parameter.annotation is Response
+        ),
+        None,
+    )
+    passes_response = response_param is not None
+
+    if not passes_response:
+        response_param = "_fast_response"
+        parameters.append(
+            inspect.Parameter(
+                response_param,
+                inspect.Parameter.KEYWORD_ONLY,
+                annotation=Response,
+            )
+        )
+
+    def get_sub_response(kwargs: dict) -> Response:
+        if passes_response:
+            return kwargs[response_param]
+        return kwargs.pop(response_param)
+
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def wrapper(**kwargs):
+            sub_response = get_sub_response(kwargs)
+            content = await endpoint(**kwargs)
+
+            return _fast_response(
+                content, response_model, status_code, sub_response
+            )
+
+    else:
+
+        @functools.wraps(endpoint)
+        def wrapper(**kwargs):
+            sub_response = get_sub_response(kwargs)
+            content = endpoint(**kwargs)
+
+            return _fast_response(
+                content, response_model, status_code, sub_response
+            )
+
+    wrapper.__signature__ = signature.replace(parameters=parameters)
+
+    return wrapper
+
+
+class FastResponseRoute(APIRoute):
+    def __init__(self, path: str, endpoint, **kwargs):
+        response_model = kwargs.get("response_model")
+
+        if FAST_RESPONSE and not (
+            response_model is None
+            or isinstance(response_model, DefaultPlaceholder)
+        ):
+            endpoint = fast_response_endpoint(
+                endpoint, response_model, kwargs.get("status_code")
+            )
+
+        super().__init__(path, endpoint, **kwargs)
@@ -1,41 +1,58 @@
 from fastapi import Depends, HTTPException, status
 import jwt
+import secrets
 from datetime import datetime, timedelta
 from pytz import timezone
 from pydantic import BaseModel
+from sqlalchemy import event, inspect
 from sqlalchemy.orm import Session
 from typing import Annotated, Literal
 from jwt.exceptions import InvalidTokenError
-from passlib.context import CryptContext
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.api.errors import EXPIRED_TOKEN, INVALID_CREDENTIAL
-from app.database.db import get_db
+from app.core.cache import TTLCache
+from app.core.password import password_hasher
+from app.core.request_stats import timed_phase
+from app.database.db import async_compatible, get_db
 from app.models.models import User
 
 from .config import (
+    INTERNAL_TOKEN,
     JWT_SECRET_KEY,
     JWT_ALGORITHM,
     JWT_ACCESS_TOKEN_EXPIRES,
     JWT_REFRESH_TOKEN_EXPIRES,
+    USER_CACHE_MAX_SIZE,
+    USER_CACHE_TTL,
 )
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+user_cache = TTLCache(max_size=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL)
+
 security_scheme = HTTPBearer()
+internal_security_scheme = HTTPBearer(auto_error=False)
 
 
 class TokenData(BaseModel):
     username: str | None = None
     type: Annotated[Literal["refresh", "access"], None] = None
+    user_id: int | None = None
+    version: int | None = None
+
+
+# DB 조회 없이 토큰만으로 식별한 사용자
+class Principal(BaseModel):
+    id: int
+    username: str
 
 
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
 
 
 def create_jwt_token(data: dict, expires_delta: timedelta):
@@ -50,16 +67,27 @@ def create_jwt_token(data: dict, expires_delta: timedelta):
     return encoded_jwt
 
 
-def create_refresh_token(username: str):
+def create_refresh_token(username: str, token_version: int | None = None):
     return create_jwt_token(
-        data=TokenData(username=username, type="refresh").dict(),
+        data=TokenData(
+            username=username, type="refresh", version=token_version
+        ).dict(),
         expires_delta=JWT_REFRESH_TOKEN_EXPIRES,
     )
 
 
-def create_access_token(username: str):
+def create_access_token(
+    username: str,
+    user_id: int | None = None,
+    token_version: int | None = None,
+):
     return create_jwt_token(
-        data=TokenData(username=username, type="access").dict(),
+        data=TokenData(
+            username=username,
+            type="access",
+            user_id=user_id,
+            version=token_version,
+        ).dict(),
         expires_delta=JWT_ACCESS_TOKEN_EXPIRES,
     )
 
@@ -80,6 +108,56 @@ def get_user(db: Session, username: str) -> User | None:
     return user
 
 
+USER_CACHE_SESSION_INFO_KEY = "invalidated_usernames"
+
+
+# 캐시에는 컬럼 값만 저장하고, 요청마다 세션에 속하지 않은 새 User 를 만든다.
+# 같은 세션에서 이미 변경한 사용자는 아직 커밋 전이므로 캐시를 거치지 않는다.
+def get_cached_user(db: Session, username: str) -> User | None:
+    if username in db.info.get(USER_CACHE_SESSION_INFO_KEY, ()):
+        return get_user(db, username)
+
+    values = user_cache.get(username)
+
+    if values is None:
+        user = get_user(db, username)
+
+        if user is None:
+            return None
+
+        values = {
+            attr.key: getattr(user, attr.key)
+            for attr in inspect(User).column_attrs
+        }
+        user_cache.set(username, values)
+
+    return User(**values)
+
+
+def invalidate_cached_user(username: str) -> None:
+    user_cache.delete(username)
+
+
+# 트랜잭션 안에서 바로 지우고, 커밋 후에 한 번 더 지운다. 커밋 전에
+# 다른 요청이 이전 사용자 정보를 다시 캐시에 넣는 경우를 막기 위해서이다.
+def invalidate_cached_user_after_commit(
+    session: Session, username: str
+) -> None:
+    invalidate_cached_user(username)
+    session.info.setdefault(USER_CACHE_SESSION_INFO_KEY, set()).add(username)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_cached_users(session: Session):
+    for username in session.info.pop(USER_CACHE_SESSION_INFO_KEY, ()):
+        invalidate_cached_user(username)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_cached_users(session: Session):
+    session.info.pop(USER_CACHE_SESSION_INFO_KEY, None)
+
+
 credentials_exception = HTTPException(
     status_code=status.HTTP_401_UNAUTHORIZED,
     detail=INVALID_CREDENTIAL,
@@ -87,6 +165,15 @@ credentials_exception = HTTPException(
 )
 
 
+# 토큰의 version 이 사용자의 token_version 과 다르면 폐기된 토큰이다.
+# version 이 없는 이전 형식의 토큰은 검사하지 않는다.
+def check_token_version(payload: dict, user: User) -> None:
+    version: int | None = payload.get("version")
+
+    if version is not None and version != user.token_version:
+        raise credentials_exception
+
+
 def refresh_token_decode(refresh_token: str, db: Session) -> User:
     try:
         payload = jwt.decode(
@@ -106,15 +193,13 @@ def refresh_token_decode(refresh_token: str, db: Session) -> User:
     if user is None:
         raise credentials_exception
 
+    check_token_version(payload, user)
+
     return user
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
-    db: Session = Depends(get_db),
-) -> User:
+def decode_access_token(token: str) -> dict:
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
         username: str | None = payload.get("username")
         type: str | None = payload.get("type")
@@ -131,9 +216,62 @@ def get_current_user(
     except InvalidTokenError:
         raise credentials_exception
 
-    user = get_user(db=db, username=username)
+    return payload
+
+
+def get_user_by_payload(db: Session, payload: dict) -> User:
+    user = get_cached_user(db=db, username=payload["username"])
 
     if user is None:
         raise credentials_exception
 
+    check_token_version(payload, user)
+
     return user
+
+
+@async_compatible
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+    db: Session = Depends(get_db),
+) -> User:
+    with timed_phase("auth"):
+        payload = decode_access_token(credentials.credentials)
+
+        return get_user_by_payload(db, payload)
+
+
+# user_id 가 들어있는 토큰은 DB 를 조회하지 않는다. (폐기 여부는 access token
+# 만료 시간 안에서만 늦게 반영되며, 토큰 재발급과 get_current_user 에서는
+# 바로 검사된다.)
+@async_compatible
+def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+    db: Session = Depends(get_db),
+) -> Principal:
+    with timed_phase("auth"):
+        payload = decode_access_token(credentials.credentials)
+        user_id: int | None = payload.get("user_id")
+
+        if user_id is None:
+            user = get_user_by_payload(db, payload)
+
+            return Principal(id=user.id, username=user.username)
+
+        return Principal(id=user_id, username=payload["username"])
+
+
+# 내부 모니터링 엔드포인트는 TSK_INTERNAL_TOKEN 이 설정된 경우에만 열리고,
+# 같은 값을 Bearer 토큰으로 보낸 요청만 허용한다.
+def verify_internal_token(
+    credentials: Annotated[
+        HTTPAuthorizationCredentials | None, Depends(internal_security_scheme)
+    ],
+) -> None:
+    if not INTERNAL_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials, INTERNAL_TOKEN
+    ):
+        raise credentials_exception
@@ -0,0 +1,205 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+class TTLCache:
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# 캐시 백엔드에는 JSON 으로 표현할 수 있는 값만 저장한다.
+class CacheBackend:
+    def get(self, key: str) -> Any | None:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class InMemoryCacheBackend(CacheBackend):
+    def __init__(self, max_size: int, ttl: float):
+        self._cache = TTLCache(max_size=max_size, ttl=ttl)
+
+    def get(self, key: str) -> Any | None:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        self._cache.set(key, value)
+
+    def delete(self, key: str) -> None:
+        self._cache.delete(key)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+# 값은 Redis 에 두고 워커마다 로컬 캐시를 함께 사용한다. 삭제한 키는 pub/sub
+# 으로 알려서 다른 워커의 로컬 캐시에서도 지운다.
+# Redis 에 장애가 있으면 캐시가 없는 것처럼 동작한다. (이때 다른 워커의 로컬
+# 캐시는 ttl 안에서 늦게 반영된다.)
+class RedisCacheBackend(CacheBackend):
+    CLEAR_ALL = "*"
+
+    def __init__(
+        self,
+        client: "redis.Redis",
+        max_size: int,
+        ttl: float,
+        prefix: str = "taskie:",
+        channel: str = "taskie:cache:invalidate",
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.channel = channel
+
+        self._local = TTLCache(max_size=max_size, ttl=ttl)
+        self._lock = threading.Lock()
+        self._listener = None
+
+    @classmethod
+    def from_url(cls, url: str, max_size: int, ttl: float):
+        if redis is None:
+            raise RuntimeError("redis package is required for redis cache")
+
+        return cls(redis.Redis.from_url(url), max_size=max_size, ttl=ttl)
+
+    def _subscribe(self) -> None:
+        if self._listener is not None:
+            return
+
+        with self._lock:
+            if self._listener is not None:
+                return
+
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.channel: self._on_invalidate})
+            self._listener = pubsub.run_in_thread(sleep_time=1, daemon=True)
+
+    def _on_invalidate(self, message: dict) -> None:
+        key = message["data"]
+        if isinstance(key, bytes):
+            key = key.decode()
+
+        if key == self.CLEAR_ALL:
+            self._local.clear()
+        else:
+            self._local.delete(key)
+
+    def get(self, key: str) -> Any | None:
+        value = self._local.get(key)
+        if value is not None:
+            return value
+
+        try:
+            self._subscribe()
+            data = self.client.get(self.prefix + key)
+        except redis.RedisError:
+            return None
+
+        if data is None:
+            return None
+
+        value = json.loads(data)
+        self._local.set(key, value)
+
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if not self._local.enabled:
+            return
+
+        try:
+            self._subscribe()
+            self.client.set(
+                self.prefix + key, json.dumps(value), ex=int(self.ttl) or 1
+            )
+        except redis.RedisError:
+            return
+
+        self._local.set(key, value)
+
+    def delete(self, key: str) -> None:
+        self._local.delete(key)
+
+        try:
+            self.client.delete(self.prefix + key)
+            self.client.publish(self.channel, key)
+        except redis.RedisError:
+            pass
+
+    def clear(self) -> None:
+        self._local.clear()
+
+        try:
+            keys = list(self.client.scan_iter(match=self.prefix + "*"))
+            if keys:
+                self.client.delete(*keys)
+            self.client.publish(self.channel, self.CLEAR_ALL)
+        except redis.RedisError:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            listener, self._listener = self._listener, None
+
+        if listener is not None:
+            listener.stop()
@@ -4,11 +4,122 @@ import dotenv
 
 dotenv.load_dotenv()
 
+
+def _get_bool_env(key: str, default: bool) -> bool:
+    value = os.environ.get(key)
+
+    if value is None:
+        return default
+
+    return value.lower() in ("1", "true", "yes", "on")
+
+
 DATABASE_URI = os.environ.get("TSK_DB_URL")
 JWT_SECRET_KEY = os.environ.get("JWT_SECRET_KEY")
 
+# psycopg2 (동기) 또는 asyncpg / psycopg_async (비동기)
+DATABASE_DRIVER = os.environ.get("TSK_DB_DRIVER", "psycopg2")
+DATABASE_ASYNC = DATABASE_DRIVER in ("asyncpg", "psycopg_async")
+
+DATABASE_POOL_SIZE = int(os.environ.get("TSK_DB_POOL_SIZE", 5))
+DATABASE_POOL_MAX_OVERFLOW = int(
+    os.environ.get("TSK_DB_POOL_MAX_OVERFLOW", 10)
+)
+DATABASE_POOL_TIMEOUT = float(os.environ.get("TSK_DB_POOL_TIMEOUT", 30))
+DATABASE_POOL_RECYCLE = int(os.environ.get("TSK_DB_POOL_RECYCLE", -1))
+DATABASE_POOL_PRE_PING = _get_bool_env("TSK_DB_POOL_PRE_PING", False)
+
+# PgBouncer (transaction pooling) 뒤에 있을 때는 prepared statement 를 쓰지 않는다.
+DATABASE_PGBOUNCER = _get_bool_env("TSK_DB_PGBOUNCER", False)
+
+# 인증된 사용자 캐시 (프로세스 단위). TTL 을 0 으로 두면 캐시하지 않는다.
+USER_CACHE_TTL = float(os.environ.get("TSK_USER_CACHE_TTL", 60))
+USER_CACHE_MAX_SIZE = int(os.environ.get("TSK_USER_CACHE_MAX_SIZE", 1024))
+
+# 루틴/습관 정의 캐시. memory(프로세스 단위), redis, none 중 하나를 쓴다.
+DEFINITION_CACHE_BACKEND = os.environ.get("TSK_DEFINITION_CACHE", "memory")
+DEFINITION_CACHE_TTL = float(os.environ.get("TSK_DEFINITION_CACHE_TTL", 300))
+DEFINITION_CACHE_MAX_SIZE = int(
+    os.environ.get("TSK_DEFINITION_CACHE_MAX_SIZE", 1024)
+)
+REDIS_URL = os.environ.get("TSK_REDIS_URL", "redis://localhost:6379/0")
+
+# 비밀번호 해시는 별도 프로세스 풀에서 처리한다. WORKERS 를 0 으로 두면
+# 요청 스레드에서 바로 실행한다.
+BCRYPT_ROUNDS = int(os.environ.get("TSK_BCRYPT_ROUNDS", 12))
+PASSWORD_HASH_WORKERS = int(os.environ.get("TSK_PASSWORD_HASH_WORKERS", 2))
+PASSWORD_HASH_MAX_PENDING = int(
+    os.environ.get("TSK_PASSWORD_HASH_MAX_PENDING", 16)
+)
+
+# 컨트롤러가 만든 응답 모델을 다시 검증하지 않고 orjson 으로 바로 직렬화한다.
+FAST_RESPONSE = _get_bool_env("TSK_FAST_RESPONSE", True)
+
+# 요청별 SQL 실행 횟수와 시간을 접근 로그(taskie.access)로 남긴다.
+ACCESS_LOG = _get_bool_env("TSK_ACCESS_LOG", True)
+
+# 내부 모니터링 엔드포인트(/health/pool, /metrics)에 Bearer 로 보내야 하는 토큰.
+# 비워 두면 엔드포인트를 열지 않는다.
+INTERNAL_TOKEN = os.environ.get("TSK_INTERNAL_TOKEN") or None
+
+# /metrics 로 Prometheus 지표를 노출한다.
+METRICS = _get_bool_env("TSK_METRICS", True)
+# 이벤트 루프 지연을 측정하는 주기(초). 0 이면 측정하지 않는다.
+LOOP_LAG_INTERVAL = float(os.environ.get("TSK_LOOP_LAG_INTERVAL", 0.5))
+
+# OpenTelemetry 트레이싱 (none, console, file, otlp). tracing extra 가 필요하다.
+TRACING_EXPORTER = os.environ.get("TSK_TRACING", "none")
+TRACING_SAMPLE_RATE = float(os.environ.get("TSK_TRACING_SAMPLE_RATE", 0.1))
+TRACING_FILE = os.environ.get("TSK_TRACING_FILE", "traces.jsonl")
+TRACING_SERVICE_NAME = os.environ.get(
+    "TSK_TRACING_SERVICE_NAME", "taskie-backend"
+)
+
+# 이 시간(ms)보다 오래 걸린 SQL 을 실행 계획과 함께 taskie.slow_query 로그로
+# 남긴다. 음수이면 끈다. TSK_SLOW_QUERY_LOG 를 지정하면 파일로 남긴다.
+SLOW_QUERY_THRESHOLD_MS = float(
+    os.environ.get("TSK_SLOW_QUERY_THRESHOLD_MS", 500)
+)
+SLOW_QUERY_EXPLAIN = _get_bool_env("TSK_SLOW_QUERY_EXPLAIN", True)
+SLOW_QUERY_LOG = os.environ.get("TSK_SLOW_QUERY_LOG")
+SLOW_QUERY_LOG_MAX_BYTES = int(
+    os.environ.get("TSK_SLOW_QUERY_LOG_MAX_BYTES", 10 * 1024 * 1024)
+)
+SLOW_QUERY_LOG_BACKUP_COUNT = int(
+    os.environ.get("TSK_SLOW_QUERY_LOG_BACKUP_COUNT", 5)
+)
+
 SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+# GET /task/range 로 한 번에 조회할 수 있는 최대 일수
+TASK_RANGE_MAX_DAYS = 31
+
+# POST /batch 로 한 번에 실행할 수 있는 최대 작업 수
+BATCH_MAX_OPERATIONS = 50
+
+# GET /sync 는 토큰 시각보다 이만큼(초) 앞에서부터 변경을 조회한다.
+SYNC_OVERLAP_SECONDS = int(os.environ.get("TSK_SYNC_OVERLAP_SECONDS", 60))
+
+# GET /events (SSE) 로 변경 이벤트를 보낸다. memory(프로세스 단위), postgres
+# (LISTEN/NOTIFY, 워커가 여럿일 때), none 중 하나를 쓴다.
+EVENT_BUS = os.environ.get("TSK_EVENT_BUS", "memory")
+EVENT_STREAM_MAX_CONNECTIONS = int(
+    os.environ.get("TSK_EVENT_STREAM_MAX_CONNECTIONS", 1000)
+)
+EVENT_STREAM_MAX_CONNECTIONS_PER_USER = int(
+    os.environ.get("TSK_EVENT_STREAM_MAX_CONNECTIONS_PER_USER", 5)
+)
+EVENT_STREAM_QUEUE_SIZE = int(
+    os.environ.get("TSK_EVENT_STREAM_QUEUE_SIZE", 100)
+)
+EVENT_STREAM_HEARTBEAT_INTERVAL = float(
+    os.environ.get("TSK_EVENT_STREAM_HEARTBEAT_INTERVAL", 15)
+)
+# 스트림은 이 시간(초)이 지나면 닫히고 클라이언트가 다시 연결한다.
+EVENT_STREAM_MAX_SECONDS = float(
+    os.environ.get("TSK_EVENT_STREAM_MAX_SECONDS", 900)
+)
+
 JWT_ALGORITHM = "HS256"
 JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=30)
 JWT_REFRESH_TOKEN_EXPIRES = timedelta(weeks=2)
@@ -0,0 +1,109 @@
+from typing import Any, Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .cache import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from .config import (
+    DEFINITION_CACHE_BACKEND,
+    DEFINITION_CACHE_MAX_SIZE,
+    DEFINITION_CACHE_TTL,
+    REDIS_URL,
+)
+
+
+# 자주 바뀌지 않는 루틴/습관 정의를 사용자 단위로 캐시한다.
+# 날짜별 기록(log)은 캐시하지 않는다.
+class DefinitionCache:
+    ROUTINES = "routines"
+    HABITS = "habits"
+
+    SESSION_INFO_KEY = "definition_cache_keys"
+
+    def __init__(self, backend: CacheBackend | None):
+        self.backend = backend
+
+    def _key(self, family: str, user_id: int) -> str:
+        return f"definitions:{family}:{user_id}"
+
+    def get(self, family: str, user_id: int) -> Any | None:
+        if self.backend is None:
+            return None
+
+        return self.backend.get(self._key(family, user_id))
+
+    def set(self, family: str, user_id: int, value: Any) -> None:
+        if self.backend is None:
+            return
+
+        self.backend.set(self._key(family, user_id), value)
+
+    def invalidate(self, family: str, user_id: int) -> None:
+        if self.backend is None:
+            return
+
+        self.backend.delete(self._key(family, user_id))
+
+    # 트랜잭션 안에서 바로 지우고, 커밋 후에 한 번 더 지운다. 커밋 전에
+    # 다른 요청이 이전 정의를 다시 캐시에 넣는 경우를 막기 위해서이다.
+    def invalidate_after_commit(
+        self, session: Session, family: str, user_id: int
+    ) -> None:
+        self.invalidate(family, user_id)
+        session.info.setdefault(self.SESSION_INFO_KEY, set()).add(
+            (family, user_id)
+        )
+
+    # 같은 세션에서 이미 변경한 정의는 아직 커밋 전이므로 캐시를 거치지 않는다.
+    def get_or_load(
+        self,
+        session: Session,
+        family: str,
+        user_id: int,
+        loader: Callable[[], Any],
+    ) -> Any:
+        if (family, user_id) in session.info.get(self.SESSION_INFO_KEY, ()):
+            return loader()
+
+        value = self.get(family, user_id)
+
+        if value is None:
+            value = loader()
+            self.set(family, user_id, value)
+
+        return value
+
+    def clear(self) -> None:
+        if self.backend is not None:
+            self.backend.clear()
+
+
+def create_cache_backend() -> CacheBackend | None:
+    if DEFINITION_CACHE_BACKEND == "redis":
+        return RedisCacheBackend.from_url(
+            REDIS_URL,
+            max_size=DEFINITION_CACHE_MAX_SIZE,
+            ttl=DEFINITION_CACHE_TTL,
+        )
+    elif DEFINITION_CACHE_BACKEND == "memory":
+        return InMemoryCacheBackend(
+            max_size=DEFINITION_CACHE_MAX_SIZE, ttl=DEFINITION_CACHE_TTL
+        )
+
+    return None
+
+
+definition_cache = DefinitionCache(create_cache_backend())
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session):
+    for family, user_id in session.info.pop(
+        DefinitionCache.SESSION_INFO_KEY, ()
+    ):
+        definition_cache.invalidate(family, user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session):
+    session.info.pop(DefinitionCache.SESSION_INFO_KEY, None)
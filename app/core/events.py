@@ -0,0 +1,328 @@
+import asyncio
+import json
+import logging
+import threading
+from typing import Any, AsyncIterator
+
+from fastapi import HTTPException, status
+from sqlalchemy import event, func, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.api.errors import TOO_MANY_CONNECTIONS
+from app.database.db import engine
+
+from .config import (
+    EVENT_BUS,
+    EVENT_STREAM_MAX_CONNECTIONS,
+    EVENT_STREAM_MAX_CONNECTIONS_PER_USER,
+    EVENT_STREAM_QUEUE_SIZE,
+)
+from .metrics import Gauge, registry
+
+logger = logging.getLogger("taskie.events")
+
+event_streams = registry.register(
+    Gauge("taskie_event_streams", "Open server-sent event streams.")
+)
+
+# 큐가 넘치면 쌓인 이벤트를 버리고 이 이벤트를 보낸다. 클라이언트는 GET /sync
+# 로 다시 맞춘다.
+RESYNC = {"type": "resync"}
+
+
+class Subscription:
+    def __init__(self, bus: "EventBus", user_id: int, queue_size: int):
+        self.bus = bus
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.queue_size = queue_size
+        self.overflowed = False
+        self.closed = False
+
+    # 이벤트 루프 스레드에서만 호출한다.
+    def put(self, events: list[dict]) -> None:
+        if self.overflowed:
+            return
+
+        if self.queue.qsize() + len(events) > self.queue_size:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC)
+            return
+
+        for item in events:
+            self.queue.put_nowait(item)
+
+    async def get(self, timeout: float) -> dict | None:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.bus.unsubscribe(self)
+
+
+def format_sse(item: dict) -> str:
+    data = json.dumps(item, separators=(",", ":"), default=str)
+
+    return f"event: {item['type']}\ndata: {data}\n\n"
+
+
+# heartbeat_interval 동안 이벤트가 없으면 주석(": ping")을 보내 프록시가
+# 연결을 끊지 않게 한다.
+async def event_stream(
+    subscription: Subscription,
+    heartbeat_interval: float,
+    max_duration: float,
+) -> AsyncIterator[str]:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_duration
+
+    try:
+        yield f"retry: {int(heartbeat_interval * 1000)}\n\n"
+
+        while (remaining := deadline - loop.time()) > 0:
+            item = await subscription.get(min(heartbeat_interval, remaining))
+
+            if item is None:
+                yield ": ping\n\n"
+                continue
+
+            yield format_sse(item)
+
+            if item is RESYNC:
+                break
+    finally:
+        subscription.close()
+
+
+# 커밋된 변경 이벤트를 같은 사용자의 스트림에 나눠준다. 기본 구현은 같은
+# 프로세스의 스트림에만 전달한다.
+class EventBus:
+    def __init__(
+        self,
+        max_connections: int,
+        max_connections_per_user: int,
+        queue_size: int,
+    ):
+        self.max_connections = max_connections
+        self.max_connections_per_user = max_connections_per_user
+        self.queue_size = queue_size
+        self._subscriptions: dict[int, set[Subscription]] = {}
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id: int) -> Subscription:
+        subscription = Subscription(self, user_id, self.queue_size)
+
+        with self._lock:
+            user_subscriptions = self._subscriptions.setdefault(user_id, set())
+
+            if (
+                self._count >= self.max_connections
+                or len(user_subscriptions) >= self.max_connections_per_user
+            ):
+                if not user_subscriptions:
+                    del self._subscriptions[user_id]
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail=TOO_MANY_CONNECTIONS,
+                    headers={"Retry-After": "5"},
+                )
+
+            user_subscriptions.add(subscription)
+            self._count += 1
+            event_streams.set(self._count)
+
+        return subscription
+
+    def connections(self, user_id: int) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(user_id, ()))
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            user_subscriptions = self._subscriptions.get(
+                subscription.user_id, set()
+            )
+            if subscription not in user_subscriptions:
+                return
+
+            user_subscriptions.discard(subscription)
+            if not user_subscriptions:
+                del self._subscriptions[subscription.user_id]
+
+            self._count -= 1
+            event_streams.set(self._count)
+
+    # 요청 스레드(또는 다른 이벤트 루프)에서 호출될 수 있다.
+    def dispatch(self, user_id: int, events: list[dict]) -> None:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(user_id, ()))
+
+        for subscription in subscriptions:
+            if subscription.loop.is_closed():
+                continue
+            subscription.loop.call_soon_threadsafe(subscription.put, events)
+
+    # 커밋 직전, 같은 트랜잭션 안에서 호출된다.
+    def prepare(self, session: Session, user_id: int, events: list[dict]):
+        pass
+
+    # 커밋 후에 호출된다.
+    def publish(self, user_id: int, events: list[dict]) -> None:
+        self.dispatch(user_id, events)
+
+    def stop(self) -> None:
+        pass
+
+
+# 여러 워커에서는 NOTIFY 를 변경과 같은 트랜잭션에서 보내고(커밋될 때만
+# 전달된다), 워커마다 연결 하나로 LISTEN 해서 자기 스트림에 나눠준다.
+class PostgresEventBus(EventBus):
+    CHANNEL = "taskie_events"
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self, engine, **kwargs):
+        super().__init__(**kwargs)
+        self.engine = engine
+        self._connection = None
+        self._fileno: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def subscribe(self, user_id: int) -> Subscription:
+        subscription = super().subscribe(user_id)
+
+        if self._loop is not subscription.loop:
+            self._close_listener()
+            self._listen(subscription.loop)
+
+        return subscription
+
+    def prepare(self, session: Session, user_id: int, events: list[dict]):
+        for item in events:
+            payload = json.dumps(
+                {"user_id": user_id, "event": item},
+                separators=(",", ":"),
+                default=str,
+            )
+            session.execute(select(func.pg_notify(self.CHANNEL, payload)))
+
+    def publish(self, user_id: int, events: list[dict]) -> None:
+        pass
+
+    def _listen(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+        try:
+            pooled = self.engine.raw_connection()
+            connection = pooled.driver_connection
+            pooled.detach()
+            connection.autocommit = True
+            connection.cursor().execute(f"LISTEN {self.CHANNEL}")
+        except (DBAPIError, self.engine.dialect.dbapi.Error):
+            logger.exception("failed to listen on %s", self.CHANNEL)
+            loop.call_later(self.RECONNECT_DELAY, self._reconnect, loop)
+            return
+
+        self._connection = connection
+        self._fileno = connection.fileno()
+        loop.add_reader(self._fileno, self._on_readable)
+
+    def _reconnect(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop is loop and self._connection is None:
+            self._listen(loop)
+
+    def _on_readable(self) -> None:
+        connection = self._connection
+
+        try:
+            connection.poll()
+        except self.engine.dialect.dbapi.Error:
+            logger.exception("lost listener connection")
+            loop = self._loop
+            self._close_listener()
+            self._loop = loop
+            loop.call_later(self.RECONNECT_DELAY, self._reconnect, loop)
+            return
+
+        while connection.notifies:
+            notify = connection.notifies.pop(0)
+            data = json.loads(notify.payload)
+            self.dispatch(data["user_id"], [data["event"]])
+
+    def _close_listener(self) -> None:
+        connection, self._connection = self._connection, None
+
+        if connection is not None:
+            if not self._loop.is_closed():
+                self._loop.remove_reader(self._fileno)
+            connection.close()
+
+        self._loop = None
+
+    def stop(self) -> None:
+        self._close_listener()
+
+
+def create_event_bus() -> EventBus | None:
+    options = dict(
+        max_connections=EVENT_STREAM_MAX_CONNECTIONS,
+        max_connections_per_user=EVENT_STREAM_MAX_CONNECTIONS_PER_USER,
+        queue_size=EVENT_STREAM_QUEUE_SIZE,
+    )
+
+    if EVENT_BUS == "postgres":
+        return PostgresEventBus(engine, **options)
+    elif EVENT_BUS == "memory":
+        return EventBus(**options)
+
+    return None
+
+
+event_bus = create_event_bus()
+
+SESSION_INFO_KEY = "pending_events"
+
+
+# 트랜잭션이 커밋되면 보낼 이벤트를 세션에 모아 둔다. 롤백되면 버린다.
+def publish_after_commit(
+    session: Session, user_id: int, event_type: str, **data: Any
+) -> None:
+    if event_bus is None:
+        return
+
+    session.info.setdefault(SESSION_INFO_KEY, {}).setdefault(
+        user_id, []
+    ).append({"type": event_type, **data})
+
+
+@event.listens_for(Session, "before_commit")
+def _prepare_events(session: Session):
+    if event_bus is None:
+        return
+
+    for user_id, events in session.info.get(SESSION_INFO_KEY, {}).items():
+        event_bus.prepare(session, user_id, events)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_events(session: Session):
+    pending = session.info.pop(SESSION_INFO_KEY, {})
+
+    if event_bus is None:
+        return
+
+    for user_id, events in pending.items():
+        event_bus.publish(user_id, events)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_events(session: Session):
+    session.info.pop(SESSION_INFO_KEY, None)
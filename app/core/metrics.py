@@ -0,0 +1,245 @@
+import asyncio
+import bisect
+import threading
+from typing import Callable, Sequence
+
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            buckets[
+                "+Inf" if bound == float("inf") else str(bound)
+            ] = cumulative
+
+        return {"count": cumulative, "sum": total, "buckets": buckets}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+def format_sample(name: str, labels: dict, value: float) -> str:
+    if not labels:
+        return f"{name} {_format_value(value)}"
+
+    label_text = ",".join(
+        f'{key}="{_escape(str(label))}"' for key, label in labels.items()
+    )
+    return f"{name}{{{label_text}}} {_format_value(value)}"
+
+
+def format_header(name: str, kind: str, documentation: str) -> list[str]:
+    return [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+
+
+def format_histogram(name: str, labels: dict, snapshot: dict) -> list[str]:
+    lines = [
+        format_sample(f"{name}_bucket", {**labels, "le": bound}, count)
+        for bound, count in snapshot["buckets"].items()
+    ]
+    lines.append(format_sample(f"{name}_sum", labels, snapshot["sum"]))
+    lines.append(format_sample(f"{name}_count", labels, snapshot["count"]))
+
+    return lines
+
+
+# Prometheus text format 으로 내보내는 지표. 외부 라이브러리 없이 프로세스
+# 단위로 값을 모은다.
+class Metric:
+    kind = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple) -> dict:
+        return dict(zip(self.labelnames, key))
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = list(self._values.items())
+
+        return [
+            format_sample(self.name, self._labels(key), value)
+            for key, value in values
+        ]
+
+    def collect(self) -> list[str]:
+        return (
+            format_header(self.name, self.kind, self.documentation)
+            + self.samples()
+        )
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class LabeledHistogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+
+    def labels(self, **labels) -> Histogram:
+        key = self._key(labels)
+
+        with self._lock:
+            histogram = self._values.get(key)
+            if histogram is None:
+                histogram = self._values[key] = Histogram(self.buckets)
+
+        return histogram
+
+    def observe(self, value: float, **labels) -> None:
+        self.labels(**labels).observe(value)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = list(self._values.items())
+
+        lines = []
+        for key, histogram in values:
+            lines += format_histogram(
+                self.name, self._labels(key), histogram.snapshot()
+            )
+
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: list[Metric] = []
+        self._collectors: list[Callable[[], list[str]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    # 요청 시점에 값을 읽어야 하는 지표(커넥션 풀, 스레드 풀 등)
+    def add_collector(self, collector: Callable[[], list[str]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines += metric.collect()
+        for collector in self._collectors:
+            lines += collector()
+
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+
+# 이벤트 루프가 interval 마다 깨어나는 시각이 얼마나 늦는지 측정한다.
+# 루프를 막는 동기 코드가 있으면 지연이 커진다.
+class EventLoopLagMonitor:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.lag = registry.register(
+            LabeledHistogram(
+                "taskie_event_loop_lag_seconds",
+                "Delay of event loop wakeups beyond the scheduled time.",
+            )
+        )
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            scheduled = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag.observe(max(loop.time() - scheduled, 0.0))
+
+    def start(self) -> None:
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    # 종료 이벤트는 스레드 풀에서 실행될 수 있으므로 루프에 취소를 맡긴다.
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.get_loop().call_soon_threadsafe(self._task.cancel)
+            self._task = None
@@ -0,0 +1,127 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+from app.api.errors import SERVER_BUSY
+
+from .config import (
+    BCRYPT_ROUNDS,
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_WORKERS,
+)
+from .metrics import Gauge, LabeledHistogram, registry
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS
+)
+
+
+password_hash_duration = registry.register(
+    LabeledHistogram(
+        "taskie_password_hash_seconds",
+        "Time to hash or verify a password, including queueing.",
+        ("operation",),
+    )
+)
+password_hash_pending = registry.register(
+    Gauge(
+        "taskie_password_hash_pending",
+        "Password hash operations waiting for or running on a worker.",
+    )
+)
+
+
+def _hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+# bcrypt 는 CPU 를 오래 점유하므로 요청 스레드가 아닌 별도 프로세스에서 실행한다.
+# 대기 중인 작업이 max_pending 을 넘으면 기다리지 않고 바로 503 을 돌려준다.
+class PasswordHasher:
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=SERVER_BUSY,
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+            password_hash_pending.set(self._pending)
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+            password_hash_pending.set(self._pending)
+
+    def _run(self, operation: str, func, *args):
+        started_at = time.perf_counter()
+        try:
+            return self._execute(func, *args)
+        finally:
+            password_hash_duration.observe(
+                time.perf_counter() - started_at, operation=operation
+            )
+
+    def _execute(self, func, *args):
+        if self.workers <= 0:
+            return func(*args)
+
+        self._acquire()
+        try:
+            future = self._get_executor().submit(func, *args)
+
+            # 비동기 모드에서는 이벤트 루프를 막지 않고 기다린다.
+            if in_greenlet():
+                return await_only(asyncio.wrap_future(future))
+
+            return future.result()
+        finally:
+            self._release()
+
+    def hash(self, password: str) -> str:
+        return self._run("hash", _hash_password, password)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(
+            "verify", _verify_password, plain_password, hashed_password
+        )
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    workers=PASSWORD_HASH_WORKERS, max_pending=PASSWORD_HASH_MAX_PENDING
+)
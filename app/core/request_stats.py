@@ -0,0 +1,141 @@
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+access_logger = logging.getLogger("taskie.access")
+
+
+# 요청 하나에서 실행한 SQL 과 구간(auth, serialize)별 소요 시간
+class RequestStats:
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.statement_count = 0
+        self.db_time = 0.0
+        self.slowest_time = 0.0
+        self.slowest_statement: str | None = None
+        self.phases: dict[str, float] = {}
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def add_statement(self, statement: str, duration: float) -> None:
+        self.statement_count += 1
+        self.db_time += duration
+
+        if duration >= self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = statement
+
+    def add_phase(self, name: str, duration: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + duration
+
+    def server_timing(self) -> str:
+        metrics = [
+            f"db;dur={self.db_time * 1000:.2f};"
+            f'desc="{self.statement_count} statements"'
+        ]
+        metrics += [
+            f"{name};dur={duration * 1000:.2f}"
+            for name, duration in self.phases.items()
+        ]
+        metrics.append(f"total;dur={self.elapsed * 1000:.2f}")
+
+        return ", ".join(metrics)
+
+
+request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "request_stats", default=None
+)
+
+
+def get_request_stats() -> RequestStats | None:
+    return request_stats.get()
+
+
+@contextmanager
+def timed_phase(name: str):
+    stats = request_stats.get()
+    started_at = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        if stats is not None:
+            stats.add_phase(name, time.perf_counter() - started_at)
+
+
+SERVER_TIMING_STATEMENTS = re.compile(r'db;[^,]*desc="(\d+) statements"')
+
+
+def parse_statement_count(server_timing: str) -> int | None:
+    match = SERVER_TIMING_STATEMENTS.search(server_timing)
+
+    return int(match.group(1)) if match else None
+
+
+def _short_statement(statement: str | None, length: int = 120) -> str:
+    statement = " ".join((statement or "").split())
+
+    if len(statement) > length:
+        return statement[: length - 3] + "..."
+    return statement
+
+
+def configure_access_log() -> None:
+    if access_logger.handlers:
+        return
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+    )
+    access_logger.addHandler(handler)
+    access_logger.setLevel(logging.INFO)
+
+
+def log_request(method: str, path: str, status: int, stats: RequestStats):
+    access_logger.info(
+        '%s %s %s %.1fms db=%d/%.1fms slowest=%.1fms "%s"',
+        method,
+        path,
+        status,
+        stats.elapsed * 1000,
+        stats.statement_count,
+        stats.db_time * 1000,
+        stats.slowest_time * 1000,
+        _short_statement(stats.slowest_statement),
+    )
+
+
+# 모든 엔진(비동기 엔진의 sync_engine 포함)의 SQL 실행 시간을 요청 단위로 모은다.
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, *args):
+    if request_stats.get() is not None:
+        conn.info.setdefault("query_started_at", []).append(
+            time.perf_counter()
+        )
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, *args):
+    stats = request_stats.get()
+    started_at = conn.info.get("query_started_at")
+
+    if stats is not None and started_at:
+        stats.add_statement(statement, time.perf_counter() - started_at.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context):
+    if context.connection is None:
+        return
+
+    started_at = context.connection.info.get("query_started_at")
+    if started_at:
+        started_at.pop()
@@ -0,0 +1,182 @@
+import functools
+import inspect
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+try:
+    from opentelemetry import propagate, trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+    )
+    from opentelemetry.sdk.trace.sampling import (
+        ParentBased,
+        TraceIdRatioBased,
+    )
+except ImportError:
+    trace = None
+
+_provider = None
+_tracer = None
+
+
+def set_tracer_provider(provider) -> None:
+    global _provider, _tracer
+
+    _provider = provider
+    _tracer = provider.get_tracer("taskie") if provider is not None else None
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def _create_span_processor(exporter: str, file_path: str):
+    if exporter == "otlp":
+        # 수집기 주소는 OTEL_EXPORTER_OTLP_ENDPOINT 등 표준 환경 변수를 따른다.
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return BatchSpanProcessor(OTLPSpanExporter())
+    elif exporter == "file":
+        return BatchSpanProcessor(
+            ConsoleSpanExporter(
+                out=open(file_path, "a"),
+                formatter=lambda span: span.to_json(indent=None) + "\n",
+            )
+        )
+    elif exporter == "console":
+        return SimpleSpanProcessor(ConsoleSpanExporter())
+
+    raise ValueError(f"Unknown tracing exporter: {exporter}")
+
+
+# 요청 단위로 sample_rate 만큼만 기록한다. 상위 서비스가 보낸 traceparent 가
+# 있으면 그 샘플링 결정을 따른다.
+def configure_tracing(
+    exporter: str, sample_rate: float, file_path: str, service_name: str
+) -> None:
+    if exporter == "none":
+        return
+
+    if trace is None:
+        raise RuntimeError(
+            "Tracing requires the tracing extra (poetry install -E tracing)"
+        )
+
+    provider = TracerProvider(
+        sampler=ParentBased(TraceIdRatioBased(sample_rate)),
+        resource=Resource.create({"service.name": service_name}),
+    )
+    provider.add_span_processor(_create_span_processor(exporter, file_path))
+
+    trace.set_tracer_provider(provider)
+    set_tracer_provider(provider)
+
+
+def shutdown_tracing() -> None:
+    if _provider is not None:
+        _provider.shutdown()
+
+
+@contextmanager
+def request_span(
+    method: str, path: str, headers: list[tuple[bytes, bytes]]
+) -> Iterator:
+    carrier = {
+        key.decode("latin-1"): value.decode("latin-1")
+        for key, value in headers
+    }
+
+    with _tracer.start_as_current_span(
+        method,
+        context=propagate.extract(carrier),
+        kind=trace.SpanKind.SERVER,
+        attributes={"http.request.method": method, "url.path": path},
+    ) as span:
+        yield span
+
+
+def traced(name: str):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+
+            with _tracer.start_as_current_span(name) as span:
+                result = func(*args, **kwargs)
+
+                if isinstance(result, (list, tuple)) and span.is_recording():
+                    span.set_attribute("taskie.result.count", len(result))
+
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+# DAO, Repository 의 공개 메서드마다 "클래스.메서드" 이름의 span 을 만든다.
+class TracedMixin:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for name, value in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(value):
+                setattr(cls, name, traced(f"{cls.__name__}.{name}")(value))
+
+
+def _statement_name(statement: str) -> str:
+    words = statement.split(None, 1)
+
+    return words[0].upper() if words else "SQL"
+
+
+# 요청(또는 다른 span) 안에서 실행한 SQL 만 기록한다. 시작 시의 DDL 처럼
+# 상위 span 이 없는 쿼리는 별도의 trace 로 남기지 않는다.
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_sql_span(conn, cursor, statement, *args):
+    if _tracer is None or not trace.get_current_span().is_recording():
+        return
+
+    span = _tracer.start_span(
+        _statement_name(statement),
+        kind=trace.SpanKind.CLIENT,
+        attributes={"db.system": "postgresql", "db.statement": statement},
+    )
+    conn.info.setdefault("trace_spans", []).append(span)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _end_sql_span(conn, cursor, statement, *args):
+    spans = conn.info.get("trace_spans")
+    if not spans:
+        return
+
+    span = spans.pop()
+    if span.is_recording() and cursor.rowcount >= 0:
+        span.set_attribute("db.rowcount", cursor.rowcount)
+    span.end()
+
+
+@event.listens_for(Engine, "handle_error")
+def _fail_sql_span(context):
+    if context.connection is None:
+        return
+
+    spans = context.connection.info.get("trace_spans")
+    if not spans:
+        return
+
+    span = spans.pop()
+    span.record_exception(context.original_exception)
+    span.set_status(trace.StatusCode.ERROR)
+    span.end()
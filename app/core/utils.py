@@ -0,0 +1,49 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime, time, timedelta
+from typing import Any, Iterable, List, Tuple
+
+
+# date() 로 컬럼을 감싸면 인덱스를 탈 수 없으므로 [start, end) 범위로 비교한다.
+def get_date_range(
+    start_date: date, end_date: date | None = None
+) -> Tuple[datetime, datetime]:
+    end_date = end_date or start_date
+
+    start = datetime.combine(start_date, time.min)
+    end = datetime.combine(end_date + timedelta(days=1), time.min)
+
+    return start, end
+
+
+def repeat_days_to_mask(repeat_days: Iterable[int]) -> int:
+    mask = 0
+    for day in repeat_days:
+        mask |= 1 << day
+
+    return mask
+
+
+def repeat_days_from_mask(mask: int) -> List[int]:
+    return [day for day in range(7) if mask & (1 << day)]
+
+
+# 페이지네이션 커서는 클라이언트에게 불투명한 문자열로 전달한다.
+def encode_cursor(*values: Any) -> str:
+    data = json.dumps(values, default=str, separators=(",", ":"))
+
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any] | None:
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(data)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+
+    if not isinstance(values, list):
+        return None
+
+    return values
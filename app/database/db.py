@@ -1,13 +1,93 @@
+import functools
+import inspect as pyinspect
+import uuid
 from contextlib import contextmanager
 from fastapi import Depends
 from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from sqlalchemy.util import greenlet_spawn
 
-from app.core.config import DATABASE_URI
+from app.api.responses import FastResponseRoute
+from app.core.config import (
+    DATABASE_ASYNC,
+    DATABASE_DRIVER,
+    DATABASE_PGBOUNCER,
+    DATABASE_POOL_MAX_OVERFLOW,
+    DATABASE_POOL_PRE_PING,
+    DATABASE_POOL_RECYCLE,
+    DATABASE_POOL_SIZE,
+    DATABASE_POOL_TIMEOUT,
+    DATABASE_URI,
+    SLOW_QUERY_EXPLAIN,
+    SLOW_QUERY_THRESHOLD_MS,
+)
+from app.database.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+from app.database.slow_query import SlowQueryLog
 
-engine = create_engine(DATABASE_URI)
+pool_options = dict(
+    pool_size=DATABASE_POOL_SIZE,
+    max_overflow=DATABASE_POOL_MAX_OVERFLOW,
+    pool_timeout=DATABASE_POOL_TIMEOUT,
+    pool_recycle=DATABASE_POOL_RECYCLE,
+    pool_pre_ping=DATABASE_POOL_PRE_PING,
+)
+
+
+# PgBouncer transaction pooling 에서는 같은 서버 커넥션이 여러 클라이언트에
+# 공유되므로 드라이버 레벨의 prepared statement 캐시를 끈다.
+def _get_async_url_and_connect_args():
+    url = make_url(DATABASE_URI).set(
+        drivername=f"postgresql+{DATABASE_DRIVER}"
+    )
+    connect_args = {}
+
+    if DATABASE_PGBOUNCER:
+        if DATABASE_DRIVER == "asyncpg":
+            url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+            connect_args = {
+                "statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: (
+                    f"__asyncpg_{uuid.uuid4()}__"
+                ),
+            }
+        else:
+            connect_args = {"prepare_threshold": None}
+
+    return url, connect_args
+
+
+engine = create_engine(
+    DATABASE_URI, poolclass=InstrumentedQueuePool, **pool_options
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = None
+AsyncSessionLocal = None
+
+if DATABASE_ASYNC:
+    async_url, async_connect_args = _get_async_url_and_connect_args()
+    async_engine = create_async_engine(
+        async_url,
+        connect_args=async_connect_args,
+        poolclass=InstrumentedAsyncQueuePool,
+        **pool_options,
+    )
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False)
+
+slow_query_log = SlowQueryLog(
+    threshold=(
+        SLOW_QUERY_THRESHOLD_MS / 1000
+        if SLOW_QUERY_THRESHOLD_MS >= 0
+        else None
+    ),
+    explain=SLOW_QUERY_EXPLAIN,
+)
+slow_query_log.install(engine)
+if async_engine is not None:
+    slow_query_log.install(async_engine.sync_engine)
+
 Base = declarative_base()
 
 
@@ -22,7 +102,7 @@ def initialize_database():
         print("Database is already initialized.")
 
 
-def get_db() -> Session:
+def get_sync_db() -> Session:
     session = SessionLocal()
     try:
         yield session
@@ -33,6 +113,42 @@ def get_db() -> Session:
         session.close()
 
 
+# 비동기 모드에서도 DAO / Repository 는 동기 Session API 를 그대로 사용한다.
+# AsyncSession.sync_session 의 I/O 는 async_compatible 로 감싼 함수 안에서
+# greenlet 을 통해 이벤트 루프에서 await 된다.
+async def get_async_db() -> Session:
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session.sync_session
+        except Exception as e:
+            await session.rollback()
+            raise e
+
+
+get_db = get_async_db if DATABASE_ASYNC else get_sync_db
+
+
+def get_request_engine():
+    return async_engine.sync_engine if DATABASE_ASYNC else engine
+
+
+def async_compatible(func):
+    if not DATABASE_ASYNC or pyinspect.iscoroutinefunction(func):
+        return func
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await greenlet_spawn(func, *args, **kwargs)
+
+    return wrapper
+
+
+class DatabaseRoute(FastResponseRoute):
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, async_compatible(endpoint), **kwargs)
+
+
+@async_compatible
 @contextmanager
 def tx_manager(session: Session = Depends(get_db)) -> None:
     try:
@@ -0,0 +1,165 @@
+# habit_log / routine_log 의 월별 파티션을 관리한다.
+#
+#   poetry run python -m app.database.partitions [--months-ahead 3]
+#       [--retain-months 24] [--archive-schema archive | --drop]
+#
+# 이번 달부터 months_ahead 달 뒤까지의 파티션을 미리 만들고, retain_months
+# 보다 오래된 파티션은 detach 해서 archive 스키마로 옮긴다(--drop 이면 삭제).
+import argparse
+import re
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.database.db import engine
+
+PARTITIONED_TABLES = ("habit_log", "routine_log")
+
+
+def month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def add_months(value: date, months: int) -> date:
+    month = value.year * 12 + value.month - 1 + months
+
+    return date(month // 12, month % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def list_partitions(conn: Connection, table: str) -> dict[date, str]:
+    rows = conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    ).scalars()
+    pattern = re.compile(rf"^{table}_y(\d{{4}})m(\d{{2}})$")
+
+    partitions = {}
+    for name in rows:
+        match = pattern.match(name)
+        if match:
+            partitions[date(int(match[1]), int(match[2]), 1)] = name
+
+    return partitions
+
+
+# default 파티션에 이미 그 달의 기록이 있으면 새 파티션을 붙일 수 없으므로,
+# 먼저 만든 테이블로 옮긴 뒤 attach 한다.
+def create_partition(conn: Connection, table: str, month: date) -> str:
+    name = partition_name(table, month)
+    bounds = {"start": month, "end": add_months(month, 1)}
+
+    conn.execute(
+        text(
+            f"CREATE TABLE {name} "
+            f"(LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    conn.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {table}_default "
+            "WHERE completed_at >= :start AND completed_at < :end "
+            f"RETURNING *) INSERT INTO {name} SELECT * FROM moved"
+        ),
+        bounds,
+    )
+    conn.execute(
+        text(
+            f"ALTER TABLE {table} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ('{bounds['start']}') TO ('{bounds['end']}')"
+        )
+    )
+
+    return name
+
+
+def archive_partition(
+    conn: Connection, table: str, name: str, archive_schema: str | None
+) -> None:
+    conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+
+    if archive_schema is None:
+        conn.execute(text(f"DROP TABLE {name}"))
+    else:
+        conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive_schema}"))
+        conn.execute(text(f"ALTER TABLE {name} SET SCHEMA {archive_schema}"))
+
+
+def maintain_partitions(
+    conn: Connection,
+    today: date,
+    months_ahead: int = 3,
+    retain_months: int | None = None,
+    archive_schema: str | None = "archive",
+) -> list[str]:
+    current = month_start(today)
+    actions = []
+
+    for table in PARTITIONED_TABLES:
+        partitions = list_partitions(conn, table)
+
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            if month not in partitions:
+                name = create_partition(conn, table, month)
+                actions.append(f"created {name}")
+
+        if retain_months is None:
+            continue
+
+        oldest = add_months(current, -retain_months)
+        for month, name in sorted(partitions.items()):
+            if month < oldest:
+                archive_partition(conn, table, name, archive_schema)
+                actions.append(
+                    f"dropped {name}"
+                    if archive_schema is None
+                    else f"archived {name} to {archive_schema}"
+                )
+
+    return actions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Create and archive monthly log partitions."
+    )
+    parser.add_argument("--months-ahead", type=int, default=3)
+    parser.add_argument(
+        "--retain-months",
+        type=int,
+        default=None,
+        help="archive partitions older than this many months",
+    )
+    parser.add_argument("--archive-schema", default="archive")
+    parser.add_argument(
+        "--drop",
+        action="store_true",
+        help="drop old partitions instead of archiving them",
+    )
+    args = parser.parse_args(argv)
+
+    with engine.begin() as conn:
+        actions = maintain_partitions(
+            conn,
+            date.today(),
+            months_ahead=args.months_ahead,
+            retain_months=args.retain_months,
+            archive_schema=None if args.drop else args.archive_schema,
+        )
+
+    for action in actions:
+        print(action)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import json
+import logging
+import re
+import sys
+import time
+from logging.handlers import RotatingFileHandler
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+slow_query_logger = logging.getLogger("taskie.slow_query")
+
+REDACTED = "***"
+SENSITIVE_PARAMETER = re.compile(r"password|secret|email|token(_\d+)?$", re.I)
+EXPLAINABLE_STATEMENTS = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+CALLER_SUFFIXES = ("DAO", "Repository")
+MAX_PARAMETER_SETS = 10
+
+
+def _redact(parameters):
+    if isinstance(parameters, dict):
+        return {
+            key: REDACTED if SENSITIVE_PARAMETER.search(key) else value
+            for key, value in parameters.items()
+        }
+
+    # 이름을 알 수 없는 위치 인자는 모두 가린다.
+    return [REDACTED for _ in parameters or ()]
+
+
+# 드라이버에 넘긴 값 대신 bind 이름이 남아 있는 compiled_parameters 를 쓴다.
+def redact_parameters(context, parameters, executemany: bool):
+    parameter_sets = getattr(context, "compiled_parameters", None) or (
+        parameters if executemany else [parameters]
+    )
+    redacted = [_redact(item) for item in parameter_sets[:MAX_PARAMETER_SETS]]
+
+    return redacted if executemany else redacted[0]
+
+
+# 호출 스택에서 가장 가까운 DAO / Repository 메서드를 찾는다. 커밋 시점의
+# flush 처럼 DAO 밖에서 실행된 SQL 은 가장 가까운 app 모듈의 함수를 남긴다.
+def find_caller() -> str | None:
+    frame = sys._getframe(1)
+    fallback = None
+
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        if owner is not None and type(owner).__name__.endswith(
+            CALLER_SUFFIXES
+        ):
+            return f"{type(owner).__name__}.{frame.f_code.co_name}"
+
+        module = frame.f_globals.get("__name__", "")
+        if fallback is None and module.startswith("app."):
+            if module != __name__:
+                fallback = f"{module}.{frame.f_code.co_name}"
+        frame = frame.f_back
+
+    return fallback
+
+
+# 같은 트랜잭션 안에서 실행하므로 EXPLAIN 이 실패해도 트랜잭션이 깨지지 않도록
+# savepoint 로 감싼다. ANALYZE 를 끄므로 쿼리를 다시 실행하지는 않는다.
+def explain(conn, statement: str, parameters, executemany: bool):
+    if not statement.lstrip().upper().startswith(EXPLAINABLE_STATEMENTS):
+        return None
+
+    if executemany:
+        parameters = parameters[0] if parameters else None
+
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT taskie_explain")
+        try:
+            cursor.execute(
+                f"EXPLAIN (ANALYZE off, FORMAT JSON) {statement}", parameters
+            )
+            (plan,) = cursor.fetchone()
+        except Exception:
+            cursor.execute("ROLLBACK TO SAVEPOINT taskie_explain")
+            raise
+        cursor.execute("RELEASE SAVEPOINT taskie_explain")
+    finally:
+        cursor.close()
+
+    return json.loads(plan) if isinstance(plan, str) else plan
+
+
+# threshold(초)보다 오래 걸린 SQL 을 파라미터, 호출한 DAO 메서드, 실행 계획과
+# 함께 taskie.slow_query 로그에 JSON 한 줄로 남긴다.
+class SlowQueryLog:
+    INFO_KEY = "slow_query_started_at"
+
+    def __init__(self, threshold: float | None, explain: bool = True):
+        self.threshold = threshold
+        self.explain = explain
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine, "after_cursor_execute", self._after_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def remove(self, engine: Engine) -> None:
+        event.remove(engine, "before_cursor_execute", self._before_execute)
+        event.remove(engine, "after_cursor_execute", self._after_execute)
+        event.remove(engine, "handle_error", self._handle_error)
+
+    def _before_execute(self, conn, cursor, statement, *args):
+        if self.threshold is not None:
+            conn.info.setdefault(self.INFO_KEY, []).append(time.perf_counter())
+
+    def _after_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        started_at = conn.info.get(self.INFO_KEY)
+        if not started_at:
+            return
+
+        duration = time.perf_counter() - started_at.pop()
+        if self.threshold is None or duration < self.threshold:
+            return
+
+        entry = {
+            "duration_ms": round(duration * 1000, 2),
+            "statement": statement,
+            "parameters": redact_parameters(context, parameters, executemany),
+            "caller": find_caller(),
+            "rowcount": cursor.rowcount,
+        }
+
+        if self.explain:
+            try:
+                entry["plan"] = explain(
+                    conn, statement, parameters, executemany
+                )
+            except Exception as e:
+                entry["explain_error"] = str(e)
+
+        slow_query_logger.warning(
+            json.dumps(entry, default=str), extra={"slow_query": entry}
+        )
+
+    def _handle_error(self, context):
+        if context.connection is None:
+            return
+
+        started_at = context.connection.info.get(self.INFO_KEY)
+        if started_at:
+            started_at.pop()
+
+
+def configure_slow_query_log(
+    file_path: str | None, max_bytes: int, backup_count: int
+) -> None:
+    if slow_query_logger.handlers:
+        return
+
+    if file_path:
+        handler = RotatingFileHandler(
+            file_path, maxBytes=max_bytes, backupCount=backup_count
+        )
+    else:
+        handler = logging.StreamHandler()
+
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+    )
+    slow_query_logger.addHandler(handler)
+    slow_query_logger.setLevel(logging.INFO)
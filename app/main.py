@@ -2,21 +2,59 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.controllers import router as api_router
+from app.api.middlewares import (
+    MetricsMiddleware,
+    RequestStatsMiddleware,
+    TracingMiddleware,
+)
+from app.api.responses import FastJSONResponse
+from app.core.config import (
+    ACCESS_LOG,
+    LOOP_LAG_INTERVAL,
+    METRICS,
+    SLOW_QUERY_LOG,
+    SLOW_QUERY_LOG_BACKUP_COUNT,
+    SLOW_QUERY_LOG_MAX_BYTES,
+    SLOW_QUERY_THRESHOLD_MS,
+    TRACING_EXPORTER,
+    TRACING_FILE,
+    TRACING_SAMPLE_RATE,
+    TRACING_SERVICE_NAME,
+)
+from app.core.events import event_bus
+from app.core.metrics import EventLoopLagMonitor
+from app.core.password import password_hasher
+from app.core.request_stats import configure_access_log
+from app.core.tracing import configure_tracing, shutdown_tracing
 from app.database.db import initialize_database
+from app.database.slow_query import configure_slow_query_log
 from app.schemas.response import ErrorResponse
 from app.api.error_handlers import validation_exception_handler
 
 app = FastAPI(
     title="Taskie backend",
+    default_response_class=FastJSONResponse,
     responses={
         422: {"model": ErrorResponse, "description": "Validation Error"},
     },
 )
 
+loop_lag_monitor = EventLoopLagMonitor(LOOP_LAG_INTERVAL if METRICS else 0)
+
 
 @app.on_event("startup")
 async def startup_event():
     initialize_database()
+    loop_lag_monitor.start()
+
+
+@app.on_event("shutdown")
+def shutdown_event():
+    loop_lag_monitor.stop()
+    if event_bus is not None:
+        event_bus.stop()
+    password_hasher.shutdown()
+    shutdown_tracing()
 
 
 # CORS 설정
@@ -32,8 +70,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "Server-Timing"],
+)
+
+if ACCESS_LOG:
+    configure_access_log()
+
+if SLOW_QUERY_THRESHOLD_MS >= 0:
+    configure_slow_query_log(
+        SLOW_QUERY_LOG, SLOW_QUERY_LOG_MAX_BYTES, SLOW_QUERY_LOG_BACKUP_COUNT
+    )
+
+configure_tracing(
+    TRACING_EXPORTER,
+    TRACING_SAMPLE_RATE,
+    TRACING_FILE,
+    TRACING_SERVICE_NAME,
 )
 
+app.add_middleware(TracingMiddleware)
+
+if METRICS:
+    app.add_middleware(MetricsMiddleware)
+
+app.add_middleware(RequestStatsMiddleware, access_log=ACCESS_LOG)
+
 app.include_router(api_router)
 
 validation_exception_handler(app)
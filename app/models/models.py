@@ -1,4 +1,8 @@
+from typing import Iterable
+
 from sqlalchemy import (
+    DDL,
+    BigInteger,
     Column,
     Integer,
     String,
@@ -6,13 +10,72 @@ from sqlalchemy import (
     ForeignKey,
     TIMESTAMP,
     Boolean,
+    Index,
+    TypeDecorator,
+    event,
     func,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.hybrid import hybrid_method
+from sqlalchemy.orm import declared_attr, relationship
 
+from app.core.utils import repeat_days_from_mask, repeat_days_to_mask
 from app.database.db import Base
 
 
+class Timestamp(TypeDecorator):
+    impl = TIMESTAMP
+    cache_ok = True
+
+    # psycopg2 는 timezone 이 있는 값을 넣으면 offset 을 버리고 저장하지만
+    # asyncpg 는 에러를 내므로, 드라이버와 관계없이 동일하게 동작하도록 맞춘다.
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            return value.replace(tzinfo=None)
+        return value
+
+
+# 반복 요일은 월요일(0) ~ 일요일(6)을 각 비트로 표현한 정수로 저장한다.
+# repeat_days 는 기존과 같이 "0246" 형태의 문자열로 읽고 쓸 수 있다.
+# mask & n != 0 조건은 btree 인덱스로 찾을 수 없으므로, user_id 인덱스로
+# 좁힌 뒤 걸러낸다.
+class RepeatDaysMixin:
+    repeat_days_mask = Column(Integer, nullable=False)
+
+    @property
+    def repeat_days(self) -> str:
+        return "".join(
+            str(day) for day in repeat_days_from_mask(self.repeat_days_mask)
+        )
+
+    @repeat_days.setter
+    def repeat_days(self, value: str):
+        self.repeat_days_mask = repeat_days_to_mask(int(day) for day in value)
+
+    @hybrid_method
+    def repeats_on(self, weekday: int) -> bool:
+        return bool(self.repeat_days_mask & (1 << weekday))
+
+    @repeats_on.expression
+    def repeats_on(cls, weekday: int):
+        return cls.repeat_days_mask.op("&")(1 << weekday) != 0
+
+    @hybrid_method
+    def repeats_on_any(self, weekdays: Iterable[int]) -> bool:
+        return bool(self.repeat_days_mask & repeat_days_to_mask(weekdays))
+
+    @repeats_on_any.expression
+    def repeats_on_any(cls, weekdays: Iterable[int]):
+        return cls.repeat_days_mask.op("&")(repeat_days_to_mask(weekdays)) != 0
+
+    @staticmethod
+    def repeat_days_to_string(repeat_days):
+        return "".join([str(day) for day in repeat_days])
+
+    def repeat_days_to_list(self):
+        return repeat_days_from_mask(self.repeat_days_mask)
+
+
 class User(Base):
     __tablename__ = "user"
 
@@ -22,7 +85,10 @@ class User(Base):
     email = Column(String(254), unique=True, nullable=False)
     profile_image = Column(String(100))
     nickname = Column(String(50))
-    created_at = Column(TIMESTAMP, default=func.now())
+    created_at = Column(Timestamp, default=func.now())
+    token_version = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
 
 class Todo(Base):
@@ -31,22 +97,33 @@ class Todo(Base):
     id = Column(Integer, primary_key=True)
     title = Column(String(200), nullable=False)
     order = Column(Integer, nullable=False)
-    target_date = Column(TIMESTAMP, default=func.now(), nullable=False)
+    target_date = Column(Timestamp, default=func.now(), nullable=False)
 
     content = Column(Text)
-    created_at = Column(TIMESTAMP, default=func.now(), nullable=False)
+    created_at = Column(Timestamp, default=func.now(), nullable=False)
     updated_at = Column(
-        TIMESTAMP, default=func.now(), onupdate=func.now(), nullable=False
+        Timestamp, default=func.now(), onupdate=func.now(), nullable=False
     )
 
-    completed_at = Column(TIMESTAMP)
+    completed_at = Column(Timestamp)
 
     user_id = Column(
         Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
     )
 
+    __table_args__ = (
+        # GET /todos 의 정렬 순서 (target_date DESC, order, id) 와 같다.
+        Index(
+            "ix_todo_user_id_target_date_order_id",
+            user_id,
+            target_date.desc(),
+            order,
+            id,
+        ),
+    )
+
 
-class Habit(Base):
+class Habit(RepeatDaysMixin, Base):
     __tablename__ = "habit"
 
     id = Column(Integer, primary_key=True)
@@ -54,71 +131,90 @@ class Habit(Base):
     title = Column(String(200), nullable=False)
     end_time_minutes = Column(Integer, nullable=False)
     start_time_minutes = Column(Integer, nullable=False)
-    repeat_days = Column(String(7), nullable=False)
     repeat_time_minutes = Column(Integer, nullable=False)
 
     activated = Column(Boolean, default=True, nullable=False)
 
-    created_at = Column(TIMESTAMP, default=func.now(), nullable=False)
+    created_at = Column(Timestamp, default=func.now(), nullable=False)
     updated_at = Column(
-        TIMESTAMP, default=func.now(), onupdate=func.now(), nullable=False
+        Timestamp, default=func.now(), onupdate=func.now(), nullable=False
     )
 
     user_id = Column(
-        Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
 
-    @staticmethod
-    def repeat_days_to_string(repeat_days):
-        return "".join([str(day) for day in repeat_days])
-
-    def repeat_days_to_list(self):
-        return [int(day) for day in self.repeat_days]
 
+# 기록(log) 테이블은 completed_at 기준 월 단위 range partition 으로 나눈다.
+# 파티션 키가 기본 키에 포함되어야 하므로 기본 키는 (id, completed_at) 이다.
+# 월별 파티션은 app.database.partitions 로 미리 만들고, 그 범위 밖의 기록은
+# default 파티션에 쌓인다.
+class PartitionedLogMixin:
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    completed_at = Column(
+        Timestamp, default=func.now(), nullable=False, primary_key=True
+    )
 
-class HabitLog(Base):
+    @declared_attr.directive
+    def __table_args__(cls):
+        return (
+            Index(
+                f"ix_{cls.__tablename__}_{cls.__partition_parent_column__}"
+                "_completed_at",
+                cls.__partition_parent_column__,
+                "completed_at",
+            ),
+            # 시간 순으로 쌓이는 값이므로 작은 BRIN 인덱스로 범위를 좁힌다.
+            Index(
+                f"ix_{cls.__tablename__}_completed_at_brin",
+                "completed_at",
+                postgresql_using="brin",
+            ),
+            {"postgresql_partition_by": "RANGE (completed_at)"},
+        )
+
+
+class HabitLog(PartitionedLogMixin, Base):
     __tablename__ = "habit_log"
-
-    id = Column(Integer, primary_key=True)
-    completed_at = Column(TIMESTAMP, default=func.now(), nullable=False)
+    __partition_parent_column__ = "habit_id"
 
     habit_id = Column(
         Integer, ForeignKey("habit.id", ondelete="CASCADE"), nullable=False
     )
 
 
-class Routine(Base):
+class Routine(RepeatDaysMixin, Base):
     __tablename__ = "routine"
 
     id = Column(Integer, primary_key=True)
 
     title = Column(String(200), nullable=False)
     start_time_minutes = Column(Integer, nullable=False)
-    repeat_days = Column(String(7), nullable=False)
 
-    created_at = Column(TIMESTAMP, default=func.now(), nullable=False)
+    created_at = Column(Timestamp, default=func.now(), nullable=False)
     updated_at = Column(
-        TIMESTAMP, default=func.now(), onupdate=func.now(), nullable=False
+        Timestamp, default=func.now(), onupdate=func.now(), nullable=False
     )
 
     user_id = Column(
-        Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("user.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
 
+    # 요소는 쿼리마다 필요한 방식으로 불러온다. (목록은 selectinload)
+    # 삭제 시에는 요소를 불러오지 않고 DB 의 ON DELETE CASCADE 에 맡긴다.
     routine_elements = relationship(
         "RoutineElement",
         order_by="RoutineElement.order.asc()",
         cascade="all, delete",
-        lazy="joined",
+        passive_deletes=True,
     )
 
-    def repeat_days_to_list(self):
-        return [int(day) for day in self.repeat_days]
-
-    @staticmethod
-    def repeat_days_to_string(repeat_days):
-        return "".join([str(day) for day in repeat_days])
-
 
 class RoutineElement(Base):
     __tablename__ = "routine_element"
@@ -127,33 +223,34 @@ class RoutineElement(Base):
 
     title = Column(String(200), nullable=False)
     order = Column(Integer, nullable=False)
-    created_at = Column(TIMESTAMP, default=func.now(), nullable=False)
+    created_at = Column(Timestamp, default=func.now(), nullable=False)
     updated_at = Column(
-        TIMESTAMP, default=func.now(), onupdate=func.now(), nullable=False
+        Timestamp, default=func.now(), onupdate=func.now(), nullable=False
     )
 
     duration_minutes = Column(Integer)
 
-    created_at = Column(TIMESTAMP, default=func.now())
-    updated_at = Column(TIMESTAMP, default=func.now(), onupdate=func.now())
+    created_at = Column(Timestamp, default=func.now())
+    updated_at = Column(Timestamp, default=func.now(), onupdate=func.now())
 
-    deleted_at = Column(TIMESTAMP)
+    deleted_at = Column(Timestamp)
 
     user_id = Column(
         Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
     )
     routine_id = Column(
-        Integer, ForeignKey("routine.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("routine.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
 
 
-class RoutineLog(Base):
+class RoutineLog(PartitionedLogMixin, Base):
     __tablename__ = "routine_log"
-
-    id = Column(Integer, primary_key=True)
+    __partition_parent_column__ = "routine_id"
 
     duration_seconds = Column(Integer, nullable=False)
-    completed_at = Column(TIMESTAMP, default=func.now(), nullable=False)
     is_skipped = Column(Boolean, default=False, nullable=False)
 
     routine_id = Column(
@@ -166,3 +263,87 @@ class RoutineLog(Base):
         ForeignKey("routine_element.id", ondelete="CASCADE"),
         nullable=False,
     )
+
+
+for log_table in (HabitLog.__table__, RoutineLog.__table__):
+    event.listen(
+        log_table,
+        "after_create",
+        DDL("CREATE TABLE %(table)s_default PARTITION OF %(table)s DEFAULT"),
+    )
+
+
+# 사용자별, 리소스 종류별 변경 버전. 조회 API 의 ETag 를 만드는 데 사용한다.
+class ResourceVersion(Base):
+    __tablename__ = "resource_version"
+
+    TODO = "todo"
+    ROUTINE = "routine"
+    HABIT = "habit"
+    USER = "user"
+
+    user_id = Column(
+        Integer,
+        ForeignKey("user.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    family = Column(String(20), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=1)
+
+    @classmethod
+    def bump(cls, user_id: int, families: Iterable[str]):
+        statement = insert(cls).values(
+            [dict(user_id=user_id, family=family) for family in families]
+        )
+
+        return statement.on_conflict_do_update(
+            index_elements=[cls.user_id, cls.family],
+            set_=dict(version=cls.version + 1),
+        )
+
+
+# 삭제한 리소스의 기록. 삭제는 행을 바로 지우므로 GET /sync 는 이 기록으로
+# 클라이언트에게 삭제를 전달한다. 하위 리소스(요소, 기록)는 상위 리소스와
+# 함께 삭제된 것으로 본다.
+class Tombstone(Base):
+    __tablename__ = "tombstone"
+
+    TODO = "todo"
+    ROUTINE = "routine"
+    ROUTINE_ELEMENT = "routine_element"
+    HABIT = "habit"
+
+    id = Column(BigInteger, primary_key=True)
+    user_id = Column(
+        Integer, ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+    )
+    family = Column(String(20), nullable=False)
+    record_id = Column(Integer, nullable=False)
+    deleted_at = Column(Timestamp, default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_tombstone_user_id_deleted_at", user_id, deleted_at),
+    )
+
+    @classmethod
+    def record(cls, user_id: int, family: str, record_ids: Iterable[int]):
+        return insert(cls).values(
+            [
+                dict(user_id=user_id, family=family, record_id=record_id)
+                for record_id in record_ids
+            ]
+        )
+
+
+# GET /sync 에서 사용자별로 변경된 행을 찾는다.
+for synced_table in (
+    Todo.__table__,
+    Habit.__table__,
+    Routine.__table__,
+    RoutineElement.__table__,
+):
+    Index(
+        f"ix_{synced_table.name}_user_id_updated_at",
+        synced_table.c.user_id,
+        synced_table.c.updated_at,
+    )
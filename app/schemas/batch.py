@@ -0,0 +1,89 @@
+from typing import Annotated, List, Literal, Union
+
+from pydantic import BaseModel, Field, validator
+
+from app.api.errors import VALUE_MUST_NOT_BE_EMPTY, VALUE_TOO_LONG
+from app.core.config import BATCH_MAX_OPERATIONS
+from app.schemas.habit import HabitLogPublic
+from app.schemas.routine import RoutineLogPutInput
+from app.schemas.todo import (
+    TodoCreateInput,
+    TodoOrderUpdateInput,
+    TodoPublic,
+    TodoUpdateInput,
+)
+
+
+# 각 작업의 op 는 같은 동작을 하는 단건 API 의 operation_id 이다.
+class CreateTodoOperation(BaseModel):
+    op: Literal["createTodo"]
+    data: TodoCreateInput
+
+
+class UpdateTodoOperation(BaseModel):
+    op: Literal["updateTodo"]
+    todo_id: int
+    data: TodoUpdateInput
+
+
+class DeleteTodoOperation(BaseModel):
+    op: Literal["deleteTodo"]
+    todo_id: int
+
+
+class UpdateTodoListOrderOperation(BaseModel):
+    op: Literal["updateTodoListOrder"]
+    data: TodoOrderUpdateInput
+
+
+class AchieveHabitOperation(BaseModel):
+    op: Literal["achieveHabit"]
+    habit_id: int
+
+
+class PutRoutineLogOperation(BaseModel):
+    op: Literal["putRoutineLog"]
+    routine_id: int
+    data: RoutineLogPutInput
+
+
+BatchOperation = Annotated[
+    Union[
+        CreateTodoOperation,
+        UpdateTodoOperation,
+        DeleteTodoOperation,
+        UpdateTodoListOrderOperation,
+        AchieveHabitOperation,
+        PutRoutineLogOperation,
+    ],
+    Field(discriminator="op"),
+]
+
+
+class BatchInput(BaseModel):
+    operations: List[BatchOperation]
+
+    @validator("operations")
+    def validate_operations(cls, v):
+        if len(v) == 0:
+            raise ValueError(VALUE_MUST_NOT_BE_EMPTY)
+        elif len(v) > BATCH_MAX_OPERATIONS:
+            raise ValueError(VALUE_TOO_LONG)
+        return v
+
+
+class BatchOperationResult(BaseModel):
+    op: str
+    status: int
+    data: Union[TodoPublic, HabitLogPublic, None] = None
+    error_type: str | None = None
+
+    class Config:
+        smart_union = True
+
+
+# 작업 하나가 실패하면 전체를 롤백한다. 이때 results 는 실패한 작업까지만
+# 담기며, committed 가 false 이다.
+class BatchResult(BaseModel):
+    committed: bool
+    results: List[BatchOperationResult]
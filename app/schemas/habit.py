@@ -9,7 +9,7 @@ from app.api.errors import (
     VALUE_MUST_NOT_BE_EMPTY,
     VALUE_TOO_LONG,
 )
-from app.models.models import Habit
+from app.models.models import HabitLog
 from app.schemas.common import ListLoadParams
 
 
@@ -103,21 +103,19 @@ class HabitWithLog(HabitPublic):
     near_weekday: int
     log_list: List[HabitLogPublic]
 
+    # habit 은 이미 검증된 모델이므로 다시 검증하지 않는다.
     @classmethod
     def from_orm_with_weekday(
-        cls, db_obj: Habit, log_list: list[HabitLogPublic], today_weekday: int
+        cls, habit: HabitPublic, log_list: list[HabitLog], today_weekday: int
     ):
-        habit = HabitPublic.from_orm(db_obj).dict()
-        habit_with_log = HabitWithLog(
-            **habit,
-            near_weekday=HabitWithLog.calculate_near_weekday(
-                habit["repeat_days"], today_weekday
+        return cls.construct(
+            **dict(habit),
+            near_weekday=cls.calculate_near_weekday(
+                habit.repeat_days, today_weekday
             ),
-            log_list=log_list
+            log_list=[HabitLogPublic.from_orm(log) for log in log_list],
         )
 
-        return habit_with_log
-
     @classmethod
     def calculate_near_weekday(
         cls, repeat_days: list[int], curr_week: int
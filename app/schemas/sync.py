@@ -0,0 +1,75 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel
+
+from app.models.models import Routine
+from app.schemas.habit import HabitPublic
+from app.schemas.routine import RoutineBase
+from app.schemas.todo import TodoPublic
+
+
+class RoutineElementPublic(BaseModel):
+    id: int
+    routine_id: int
+    title: str
+    order: int
+    duration_minutes: int | None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        orm_mode = True
+
+
+class HabitLogSyncPublic(BaseModel):
+    id: int
+    habit_id: int
+    completed_at: datetime
+
+    class Config:
+        orm_mode = True
+
+
+class RoutineLogSyncPublic(BaseModel):
+    id: int
+    routine_id: int
+    routine_element_id: int
+    duration_seconds: int
+    is_skipped: bool
+    completed_at: datetime
+
+    class Config:
+        orm_mode = True
+
+
+class SyncDeleted(BaseModel):
+    todos: List[int] = []
+    routines: List[int] = []
+    routine_elements: List[int] = []
+    habits: List[int] = []
+
+
+class SyncPublic(BaseModel):
+    # 다음 요청의 since 로 그대로 전달한다.
+    token: str
+    # since 없이 요청하면 전체 데이터를 내려준다. 이때 deleted 는 비어 있다.
+    full: bool
+    todos: List[TodoPublic]
+    routines: List[RoutineBase]
+    routine_elements: List[RoutineElementPublic]
+    habits: List[HabitPublic]
+    habit_logs: List[HabitLogSyncPublic]
+    routine_logs: List[RoutineLogSyncPublic]
+    deleted: SyncDeleted
+
+    @staticmethod
+    def routine_from_orm(routine: Routine) -> RoutineBase:
+        return RoutineBase(
+            id=routine.id,
+            title=routine.title,
+            start_time_minutes=routine.start_time_minutes,
+            repeat_days=routine.repeat_days_to_list(),
+            created_at=routine.created_at,
+            updated_at=routine.updated_at,
+        )
@@ -0,0 +1,141 @@
+# 큰 TaskPublic 응답의 직렬화 시간을 비교한다.
+#
+#   poetry run python -m benchmarks.task_serialization [--todos 500]
+#
+# fastapi: response_model 검증 + jsonable_encoder + JSONResponse (기존 경로)
+# fast:    FastJSONResponse 로 바로 직렬화 (TSK_FAST_RESPONSE)
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.api.responses import FastJSONResponse
+from app.schemas.habit import HabitWithLog
+from app.schemas.routine import RoutinePublic
+from app.schemas.task import TaskPublic
+from app.schemas.todo import TodoPublic
+
+
+def build_task(todos: int, routines: int, habits: int) -> TaskPublic:
+    now = datetime(2024, 7, 24, 9, 30, 15, 123456)
+
+    return TaskPublic.construct(
+        todo_list=[
+            TodoPublic(
+                id=index,
+                title=f"todo {index}",
+                content="content " * 10,
+                order=index,
+                target_date=now,
+                created_at=now,
+                updated_at=now,
+                completed_at=now if index % 2 else None,
+            )
+            for index in range(todos)
+        ],
+        routine_list=[
+            RoutinePublic(
+                id=index,
+                title=f"routine {index}",
+                start_time_minutes=480,
+                repeat_days=[0, 1, 2, 3, 4],
+                created_at=now,
+                updated_at=now,
+                routine_elements=[
+                    dict(
+                        id=index * 10 + element,
+                        title=f"element {element}",
+                        duration_minutes=10,
+                        created_at=now,
+                        updated_at=now,
+                        completed_at=now,
+                        completed_duration_seconds=600,
+                        is_skipped=False,
+                    )
+                    for element in range(10)
+                ],
+            )
+            for index in range(routines)
+        ],
+        habit_list=[
+            HabitWithLog(
+                id=index,
+                title=f"habit {index}",
+                start_time_minutes=480,
+                end_time_minutes=1320,
+                repeat_time_minutes=60,
+                repeat_days=[0, 2, 4],
+                activated=True,
+                created_at=now,
+                updated_at=now,
+                near_weekday=2,
+                log_list=[
+                    dict(
+                        id=index * 20 + log, completed_at=now + timedelta(log)
+                    )
+                    for log in range(14)
+                ],
+            )
+            for index in range(habits)
+        ],
+    )
+
+
+async def render_fastapi(task: TaskPublic) -> bytes:
+    field = create_response_field(
+        name="Response_getAllDailyTask", type_=TaskPublic
+    )
+    content = await serialize_response(
+        field=field, response_content=task, is_coroutine=True
+    )
+
+    return JSONResponse(content).body
+
+
+def render_fast(task: TaskPublic) -> bytes:
+    return FastJSONResponse(task).body
+
+
+def measure(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--todos", type=int, default=500)
+    parser.add_argument("--routines", type=int, default=50)
+    parser.add_argument("--habits", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    task = build_task(args.todos, args.routines, args.habits)
+    loop = asyncio.new_event_loop()
+
+    fastapi_body = loop.run_until_complete(render_fastapi(task))
+    fast_body = render_fast(task)
+    assert json.loads(fastapi_body) == json.loads(fast_body)
+
+    fastapi_time = measure(
+        lambda: loop.run_until_complete(render_fastapi(task)), args.repeat
+    )
+    fast_time = measure(lambda: render_fast(task), args.repeat)
+
+    print(f"payload: {len(fast_body) / 1024:.1f} KiB")
+    print(f"fastapi: {fastapi_time * 1000:8.2f} ms")
+    print(f"fast:    {fast_time * 1000:8.2f} ms")
+    print(f"speedup: {fastapi_time / fast_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
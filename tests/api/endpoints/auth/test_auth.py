@@ -1,5 +1,9 @@
+import json
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
+from app.api.errors import SERVER_BUSY
+from app.core.password import PasswordHasher, password_hasher
 from app.models.models import User
 
 from app.schemas.auth import (
@@ -64,6 +68,39 @@ def test_logout(client: TestClient, add_user: User):
     assert response.cookies.get("refresh_token") is None
 
 
+def test_logout_revokes_tokens(
+    client: TestClient, user_data: UserBase, add_user: User
+):
+    data = dict(username=user_data.username, password=user_data.password)
+    response = client.post("/auth/login", json=data)
+    refresh_token = response.cookies.get("refresh_token")
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    # 캐시에 로그아웃 이전의 token_version 을 넣어 둔다.
+    response = client.get("/users/me", headers=headers)
+    assert response.status_code == 200
+
+    response = client.post(
+        "/auth/logout", cookies={"refresh_token": refresh_token}
+    )
+    assert response.status_code == 204
+
+    response = client.get("/users/me", headers=headers)
+    assert response.status_code == 401
+
+    response = client.post(
+        "/auth/refresh", cookies={"refresh_token": refresh_token}
+    )
+    assert response.status_code == 401
+
+
+def test_logout_invalid_refresh(client: TestClient, add_user: User):
+    response = client.post("/auth/logout", cookies={"refresh_token": "test"})
+
+    assert response.status_code == 204
+    assert response.cookies.get("refresh_token") is None
+
+
 def test_refresh(
     client: TestClient, refresh_token: str, user_data: UserBase, add_user: User
 ):
@@ -95,3 +132,70 @@ def test_null_refresh(client: TestClient):
 
     assert response.status_code == 401
     assert response.cookies.get("refresh_token") is None
+
+
+def test_password_hasher_process_pool():
+    hasher = PasswordHasher(workers=1, max_pending=1)
+
+    try:
+        password_hash = hasher.hash("test123")
+
+        assert hasher.verify("test123", password_hash)
+        assert not hasher.verify("wrong", password_hash)
+    finally:
+        hasher.shutdown()
+
+
+def test_signup_password_hasher_busy(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, user_data: UserBase
+):
+    monkeypatch.setattr(password_hasher, "workers", 1)
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+
+    data = SignupInput(
+        username=user_data.username,
+        password=user_data.password,
+        password_confirm=user_data.password,
+        email=user_data.email,
+        nickname=user_data.nickname,
+    )
+
+    response = client.post("/auth/signup", json=data.dict())
+
+    assert response.status_code == 503
+    assert response.json()["error_type"] == SERVER_BUSY
+
+
+def test_signup_slow_query_log(
+    client: TestClient, user_data: UserBase, slow_queries: list[dict]
+):
+    data = SignupInput(
+        username=user_data.username,
+        password=user_data.password,
+        password_confirm=user_data.password,
+        email=user_data.email,
+        nickname=user_data.nickname,
+    )
+
+    response = client.post("/auth/signup", json=data.dict())
+    assert response.status_code == 201
+
+    (check_email,) = [
+        entry
+        for entry in slow_queries
+        if entry["caller"] == "AuthDAO.check_existing_email"
+    ]
+    assert list(check_email["parameters"].values())[0] == "***"
+    assert '"Relation Name": "user"' in json.dumps(check_email["plan"])
+
+    # 사용자 INSERT 는 커밋할 때 flush 된다.
+    (insert,) = [
+        entry
+        for entry in slow_queries
+        if entry["statement"].startswith('INSERT INTO "user"')
+    ]
+    assert insert["caller"] == "app.database.db.tx_manager"
+    assert insert["parameters"]["password"] == "***"
+    assert insert["parameters"]["email"] == "***"
+    assert insert["parameters"]["username"] == user_data.username
+    assert "Plan" in insert["plan"][0]
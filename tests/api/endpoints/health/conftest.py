@@ -1 +1,10 @@
 import pytest
+
+from app.core import auth
+
+
+@pytest.fixture
+def internal_token_headers(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    monkeypatch.setattr(auth, "INTERNAL_TOKEN", "internal")
+
+    return {"Authorization": "Bearer internal"}
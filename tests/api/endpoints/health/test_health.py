@@ -5,3 +5,70 @@ def test_health_check(client: TestClient):
     response = client.get("/health/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+def test_pool_status(
+    client: TestClient, internal_token_headers: dict[str, str]
+):
+    response = client.get("/health/pool", headers=internal_token_headers)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["checked_out"] >= 0
+    assert data["timeouts"] == 0
+    assert data["wait_time"]["count"] >= 1
+    assert data["wait_time"]["count"] == data["wait_time"]["buckets"]["+Inf"]
+
+
+def test_pool_status_disabled_without_internal_token(client: TestClient):
+    response = client.get("/health/pool")
+    assert response.status_code == 404
+
+
+def test_pool_status_invalid_internal_token(
+    client: TestClient, internal_token_headers: dict[str, str]
+):
+    response = client.get("/health/pool")
+    assert response.status_code == 401
+
+    response = client.get(
+        "/health/pool", headers={"Authorization": "Bearer wrong"}
+    )
+    assert response.status_code == 401
+
+
+def test_metrics(client: TestClient, internal_token_headers: dict[str, str]):
+    client.get("/health/health")
+    client.get("/task")
+
+    response = client.get("/metrics", headers=internal_token_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+    text = response.text
+    assert "# TYPE taskie_http_request_duration_seconds histogram" in text
+    assert (
+        'taskie_http_request_duration_seconds_count{operation_id="'
+        'getAllDailyTask",method="GET"}' in text
+    )
+    assert (
+        'taskie_http_requests_total{operation_id="health_check",'
+        'method="GET",status="200"}' in text
+    )
+    assert 'le="+Inf"' in text
+    assert "taskie_http_requests_in_flight 1.0" in text
+    assert "taskie_db_pool_checkout_wait_seconds_count" in text
+    assert "taskie_threadpool_tokens_total" in text
+    assert "taskie_threadpool_tasks_waiting" in text
+
+
+def test_metrics_disabled_without_internal_token(client: TestClient):
+    response = client.get("/metrics")
+    assert response.status_code == 404
+
+
+def test_metrics_invalid_internal_token(
+    client: TestClient, internal_token_headers: dict[str, str]
+):
+    response = client.get("/metrics", headers={"Authorization": "Bearer x"})
+    assert response.status_code == 401
@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import List
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.models import Habit, Todo, User
+
+
+@pytest.fixture
+def add_todo_list(session: Session, add_user: User) -> List[Todo]:
+    todo_list = [
+        Todo(
+            title=f"Test title {order}",
+            order=order,
+            target_date=datetime(2024, 11, 11, 0, 0, 0),
+            user_id=add_user.id,
+        )
+        for order in range(1, 4)
+    ]
+
+    session.add_all(todo_list)
+    session.commit()
+
+    return todo_list
+
+
+@pytest.fixture
+def add_habit(session: Session, add_user: User) -> Habit:
+    habit = Habit(
+        title="물 마시기",
+        start_time_minutes=480,
+        end_time_minutes=1380,
+        repeat_time_minutes=30,
+        repeat_days="0123456",
+        user_id=add_user.id,
+    )
+
+    session.add(habit)
+    session.commit()
+
+    return habit
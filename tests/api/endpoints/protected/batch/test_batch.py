@@ -0,0 +1,142 @@
+from typing import List
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.errors import DATA_DOES_NOT_EXIST, VALUE_MUST_NOT_BE_EMPTY
+from app.models.models import Habit, HabitLog, Todo
+
+
+def update_todo_operation(todo: Todo, completed: bool) -> dict:
+    return dict(
+        op="updateTodo",
+        todo_id=todo.id,
+        data=dict(
+            title=todo.title,
+            target_date=todo.target_date.isoformat(),
+            completed=completed,
+        ),
+    )
+
+
+def test_batch(
+    client: TestClient,
+    session: Session,
+    add_todo_list: List[Todo],
+    add_habit: Habit,
+    access_token_headers: dict[str, str],
+    query_budget,
+):
+    operations = [
+        update_todo_operation(todo, completed=True)
+        for todo in add_todo_list[:2]
+    ] + [
+        dict(op="achieveHabit", habit_id=add_habit.id),
+        dict(
+            op="createTodo",
+            data=dict(
+                title="새 할 일", order=4, target_date="2024-11-11T00:00:00"
+            ),
+        ),
+        dict(
+            op="updateTodoListOrder",
+            data=dict(
+                todo_list=[
+                    dict(id=add_todo_list[0].id, order=3),
+                    dict(id=add_todo_list[2].id, order=1),
+                ]
+            ),
+        ),
+    ]
+
+    with query_budget(20):
+        response = client.post(
+            "/batch",
+            json=dict(operations=operations),
+            headers=access_token_headers,
+        )
+
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["committed"] is True
+    assert [result["status"] for result in data["results"]] == [
+        200,
+        200,
+        200,
+        201,
+        204,
+    ]
+    assert data["results"][0]["data"]["completed_at"] is not None
+    assert data["results"][2]["data"]["id"]
+    assert data["results"][3]["data"]["title"] == "새 할 일"
+    assert data["results"][4]["data"] is None
+
+    session.expire_all()
+    assert (
+        session.query(Todo).filter(Todo.completed_at.isnot(None)).count() == 2
+    )
+    assert session.query(Todo).count() == 4
+    assert session.query(HabitLog).count() == 1
+    assert session.get(Todo, add_todo_list[2].id).order == 1
+
+
+def test_batch_rollback(
+    client: TestClient,
+    session: Session,
+    add_todo_list: List[Todo],
+    access_token_headers: dict[str, str],
+):
+    operations = [
+        update_todo_operation(add_todo_list[0], completed=True),
+        dict(op="achieveHabit", habit_id=999),
+        dict(op="deleteTodo", todo_id=add_todo_list[1].id),
+    ]
+
+    response = client.post(
+        "/batch",
+        json=dict(operations=operations),
+        headers=access_token_headers,
+    )
+
+    data = response.json()
+
+    assert response.status_code == 404
+    assert data["committed"] is False
+    assert data["results"] == [
+        dict(op="updateTodo", status=200, data=None, error_type=None),
+        dict(
+            op="achieveHabit",
+            status=404,
+            data=None,
+            error_type=DATA_DOES_NOT_EXIST,
+        ),
+    ]
+
+    session.expire_all()
+    assert (
+        session.query(Todo).filter(Todo.completed_at.isnot(None)).count() == 0
+    )
+    assert session.query(Todo).count() == 3
+
+
+def test_batch_invalid_operations(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+):
+    response = client.post(
+        "/batch",
+        json=dict(operations=[]),
+        headers=access_token_headers,
+    )
+
+    assert response.status_code == 422
+    assert response.json()["error_type"] == VALUE_MUST_NOT_BE_EMPTY
+
+    response = client.post(
+        "/batch",
+        json=dict(operations=[dict(op="dropTables")]),
+        headers=access_token_headers,
+    )
+
+    assert response.status_code == 422
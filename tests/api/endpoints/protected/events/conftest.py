@@ -0,0 +1,11 @@
+import pytest
+
+from app.api.controllers import events as events_controller
+
+
+@pytest.fixture
+def short_event_stream(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        events_controller, "EVENT_STREAM_HEARTBEAT_INTERVAL", 0.2
+    )
+    monkeypatch.setattr(events_controller, "EVENT_STREAM_MAX_SECONDS", 1)
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.dao.todo_dao import TodoDAO
+from app.api.errors import TOO_MANY_CONNECTIONS
+from app.core import events
+from app.core.events import PostgresEventBus
+from app.database.db import engine
+from app.models.models import User
+
+
+def parse_events(body: str) -> list[dict]:
+    return [
+        json.loads(line.removeprefix("data: "))
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+def test_get_events(
+    client: TestClient,
+    add_user: User,
+    access_token_headers: dict[str, str],
+    short_event_stream,
+):
+    bodies = []
+
+    def read_stream():
+        with client.stream(
+            "GET", "/events", headers=access_token_headers
+        ) as response:
+            assert response.headers["content-type"].startswith(
+                "text/event-stream"
+            )
+            bodies.append(response.read().decode())
+
+    reader = threading.Thread(target=read_stream)
+    reader.start()
+
+    while events.event_bus.connections(add_user.id) == 0:
+        time.sleep(0.01)
+
+    todo = client.post(
+        "/todos",
+        json=dict(title="할 일", order=1, target_date="2024-06-12T00:00:00"),
+        headers=access_token_headers,
+    ).json()
+    client.put(
+        f"/todos/{todo['id']}",
+        json=dict(
+            title="할 일", target_date="2024-06-12T00:00:00", completed=True
+        ),
+        headers=access_token_headers,
+    )
+
+    reader.join()
+
+    assert parse_events(bodies[0]) == [
+        dict(type="todo.created", id=todo["id"]),
+        dict(type="todo.completed", id=todo["id"]),
+    ]
+    assert ": ping" in bodies[0]
+    assert events.event_bus.connections(add_user.id) == 0
+
+
+def test_get_events_too_many_connections(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(events.event_bus, "max_connections_per_user", 0)
+
+    response = client.get("/events", headers=access_token_headers)
+
+    assert response.status_code == 429
+    assert response.json()["error_type"] == TOO_MANY_CONNECTIONS
+
+
+def test_postgres_event_bus(
+    session: Session,
+    add_user: User,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    bus = PostgresEventBus(
+        engine, max_connections=10, max_connections_per_user=1, queue_size=10
+    )
+    monkeypatch.setattr(events, "event_bus", bus)
+
+    def create_todo():
+        dao = TodoDAO(db=session, user=add_user)
+        todo = dao.create_todo(
+            title="할 일", order=1, target_date=datetime(2024, 6, 12)
+        )
+        session.commit()
+
+        return todo.id
+
+    # NOTIFY 는 커밋된 뒤에만 LISTEN 하는 연결로 전달된다.
+    async def receive():
+        subscription = bus.subscribe(add_user.id)
+        todo_id = await asyncio.to_thread(create_todo)
+        item = await subscription.get(timeout=5)
+        subscription.close()
+
+        return todo_id, item
+
+    try:
+        todo_id, item = asyncio.run(receive())
+    finally:
+        bus.stop()
+
+    assert item == dict(type="todo.created", id=todo_id)
@@ -36,6 +36,20 @@ def test_create_habit(
     assert session.query(Habit).filter(Habit.id == response_data.id).first()
 
 
+def test_habit_repeats_on(
+    session: Session,
+    add_habit_list: list[Habit],
+):
+    weekend_habit_ids = {
+        habit.id
+        for habit in session.query(Habit).filter(Habit.repeats_on(5)).all()
+    }
+
+    assert weekend_habit_ids == {
+        habit.id for habit in add_habit_list if "5" in habit.repeat_days
+    }
+
+
 def test_get_habits(
     client: TestClient,
     session: Session,
@@ -238,6 +252,7 @@ def test_update_habit(
     assert habit.end_time_minutes == body["end_time_minutes"]
     assert habit.start_time_minutes == body["start_time_minutes"]
     assert habit.repeat_days == "01234"
+    assert habit.repeat_days_mask == 0b0011111
     assert habit.repeat_time_minutes == body["repeat_time_minutes"]
     assert habit.activated == body["activated"]
 
@@ -261,3 +276,87 @@ def test_achieve_habit(
     assert data["completed_at"] is not None
     assert data["id"] == 1
     assert habit.habit_id == 1
+
+
+def test_get_habits_cached_definitions(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_habit_list: list[Habit],
+    executed_statements: list[str],
+):
+    params = dict(limit=3, log_target_date="2024-06-12")
+
+    response = client.get(
+        "/habits", headers=access_token_headers, params=params
+    )
+    assert response.status_code == 200
+
+    executed_statements.clear()
+    response = client.get(
+        "/habits", headers=access_token_headers, params=params
+    )
+    assert [habit["id"] for habit in response.json()] == [5, 4, 3]
+
+    # 두 번째 조회부터는 habit_log 만 조회한다.
+    statements = [s for s in executed_statements if "habit" in s]
+    assert len(statements) == 1
+    assert "FROM habit_log" in statements[0]
+
+    body = dict(
+        title="changed",
+        start_time_minutes=0,
+        end_time_minutes=1440,
+        repeat_time_minutes=60,
+        repeat_days=[0, 1, 2, 3, 4],
+        activated=False,
+    )
+    response = client.put("/habits/5", headers=access_token_headers, json=body)
+    assert response.status_code == 200
+
+    response = client.get(
+        "/habits", headers=access_token_headers, params=params
+    )
+    assert [habit["id"] for habit in response.json()] == [4, 3, 2]
+
+
+def test_get_habits_builds_only_limited_definitions(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_habit_list: list[Habit],
+    monkeypatch,
+):
+    params = dict(limit=2, last_id=5, log_target_date="2024-06-12")
+    client.get("/habits", headers=access_token_headers, params=params)
+
+    parsed = []
+    parse_obj = HabitPublic.parse_obj
+
+    def counting_parse_obj(cls, obj):
+        parsed.append(obj["id"])
+        return parse_obj(obj)
+
+    monkeypatch.setattr(
+        HabitPublic, "parse_obj", classmethod(counting_parse_obj)
+    )
+    response = client.get(
+        "/habits", headers=access_token_headers, params=params
+    )
+
+    assert [habit["id"] for habit in response.json()] == [4, 3]
+    assert parsed == [4, 3]
+
+
+def test_get_habits_query_budget(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_habit_list: list[Habit],
+    add_habit_log_list: list[HabitLog],
+    query_budget,
+):
+    params = dict(limit=10, log_target_date="2024-06-12")
+
+    # ETag, 습관, 습관 기록
+    with query_budget(3) as responses:
+        client.get("/habits", headers=access_token_headers, params=params)
+
+    assert responses[0].status_code == 200
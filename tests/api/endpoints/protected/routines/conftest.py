@@ -368,3 +368,38 @@ def add_routine_list_with_log(
     session.commit()
 
     return routine_list
+
+
+@pytest.fixture
+def add_routine_list_with_many_elements(
+    session: Session, add_user: User
+) -> list[Routine]:
+    routine_list = [
+        Routine(
+            title=f"test_routine_{index}",
+            start_time_minutes=540 + index,
+            repeat_days="0123456",
+            user_id=add_user.id,
+        )
+        for index in range(3)
+    ]
+
+    session.add_all(routine_list)
+    session.commit()
+
+    session.add_all(
+        [
+            RoutineElement(
+                routine_id=routine.id,
+                user_id=add_user.id,
+                title="test_routine_element",
+                duration_minutes=10,
+                order=order,
+            )
+            for routine in routine_list
+            for order in range(25)
+        ]
+    )
+    session.commit()
+
+    return routine_list
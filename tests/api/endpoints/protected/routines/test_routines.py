@@ -1,10 +1,14 @@
+import time
 from datetime import datetime
+import pytest
 from pytz import timezone
 from typing import List
 from fastapi.testclient import TestClient
 from sqlalchemy import func
 from sqlalchemy.orm import Session
-from app.models.models import Routine, RoutineElement, RoutineLog
+from app.core.cache import RedisCacheBackend
+from app.core.definition_cache import DefinitionCache, definition_cache
+from app.models.models import Routine, RoutineElement, RoutineLog, Tombstone
 
 from app.schemas.routine import (
     RoutineCreateInput,
@@ -302,6 +306,64 @@ def test_put_routine_log(
     )
 
 
+def test_put_routine_log_single_insert(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_routine: RoutinePublic,
+    routine_log_data: List[RoutineLogBase],
+    executed_statements: list[str],
+):
+    body = RoutineLogPutInput(logs=routine_log_data).dict()
+    response = client.put(
+        "routines/log/1",
+        headers=access_token_headers,
+        json=body,
+    )
+
+    assert response.status_code == 204
+
+    statements = [s for s in executed_statements if "routine" in s]
+    assert len(statements) == 2
+    assert statements[0].startswith("SELECT")
+    assert statements[1].startswith("INSERT INTO routine_log")
+
+
+def test_put_routine_log_not_owned_element(
+    client: TestClient,
+    session: Session,
+    access_token_headers: dict[str, str],
+    add_routine: RoutinePublic,
+    routine_log_data: List[RoutineLogBase],
+):
+    routine_log_data.append(
+        RoutineLogBase(routine_item_id=9999, duration_seconds=60)
+    )
+    body = RoutineLogPutInput(logs=routine_log_data).dict()
+    response = client.put(
+        "routines/log/1",
+        headers=access_token_headers,
+        json=body,
+    )
+
+    assert response.status_code == 404
+    assert session.query(RoutineLog).count() == 0
+
+
+def test_put_routine_log_not_owned_routine(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_routine: RoutinePublic,
+):
+    body = RoutineLogPutInput(logs=[]).dict()
+    response = client.put(
+        "routines/log/9999",
+        headers=access_token_headers,
+        json=body,
+    )
+
+    assert response.status_code == 404
+
+
 def test_get_routine_list(
     client: TestClient,
     access_token_headers: dict[str, str],
@@ -319,3 +381,188 @@ def test_get_routine_list(
 
     assert len(routine_list) == 4
     assert len(routine_list[0].get("routine_elements")) == 4
+
+
+def test_get_routine_list_cached_definitions(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_routine: RoutinePublic,
+    executed_statements: list[str],
+):
+    response = client.get("/routines", headers=access_token_headers)
+    assert response.status_code == 200
+
+    executed_statements.clear()
+    response = client.get("/routines", headers=access_token_headers)
+    assert response.status_code == 200
+    assert response.json()[0]["title"] == add_routine.title
+
+    # 두 번째 조회부터는 routine_log 만 조회한다.
+    statements = [s for s in executed_statements if "routine" in s]
+    assert len(statements) == 1
+    assert "FROM routine_log" in statements[0]
+
+    response = client.put(
+        "/routines/1",
+        headers=access_token_headers,
+        json={"title": "저녁 루틴"},
+    )
+    assert response.status_code == 200
+
+    response = client.get("/routines", headers=access_token_headers)
+    assert response.json()[0]["title"] == "저녁 루틴"
+
+
+def test_get_routine_list_redis_definition_cache(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_routine: RoutinePublic,
+    monkeypatch,
+):
+    fakeredis = pytest.importorskip("fakeredis")
+
+    # 같은 Redis 를 바라보는 두 워커
+    server = fakeredis.FakeServer()
+    backend = RedisCacheBackend(
+        fakeredis.FakeRedis(server=server), max_size=16, ttl=60
+    )
+    other_backend = RedisCacheBackend(
+        fakeredis.FakeRedis(server=server), max_size=16, ttl=60
+    )
+    monkeypatch.setattr(definition_cache, "backend", backend)
+
+    try:
+        response = client.get("/routines", headers=access_token_headers)
+        assert response.status_code == 200
+
+        key = f"definitions:{DefinitionCache.ROUTINES}:1"
+        assert other_backend.get(key)[0]["title"] == add_routine.title
+
+        response = client.delete("/routines/1", headers=access_token_headers)
+        assert response.status_code == 204
+
+        for _ in range(50):
+            if other_backend._local.get(key) is None:
+                break
+            time.sleep(0.05)
+
+        assert other_backend.get(key) is None
+    finally:
+        backend.close()
+        other_backend.close()
+
+
+def test_get_routine_list_selectin_elements(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_routine_list_with_many_elements: list[Routine],
+    executed_row_counts: list[tuple[str, int]],
+):
+    response = client.get("/routines", headers=access_token_headers)
+
+    assert response.status_code == 200
+    assert [len(r["routine_elements"]) for r in response.json()] == [25] * 3
+
+    # 루틴 한 행당 요소 수만큼 중복되지 않도록 요소는 따로 불러온다.
+    row_counts = [
+        (statement, count)
+        for statement, count in executed_row_counts
+        if "FROM routine" in statement and "routine_log" not in statement
+    ]
+    assert len(row_counts) == 2
+    assert "JOIN" not in row_counts[0][0]
+    assert row_counts[0][1] == 3
+    assert "FROM routine_element" in row_counts[1][0]
+    assert row_counts[1][1] == 75
+
+
+def test_delete_routine_without_loading_elements(
+    client: TestClient,
+    session: Session,
+    access_token_headers: dict[str, str],
+    add_routine_list_with_many_elements: list[Routine],
+    executed_statements: list[str],
+):
+    response = client.delete("/routines/1", headers=access_token_headers)
+
+    assert response.status_code == 204
+
+    statements = [s for s in executed_statements if "routine" in s]
+    assert not any("routine_element" in s for s in statements)
+    assert statements[-1].startswith("DELETE FROM routine ")
+
+    remaining = (
+        session.query(func.count(RoutineElement.id))
+        .filter(RoutineElement.routine_id == 1)
+        .scalar()
+    )
+    assert remaining == 0
+
+
+def test_get_routine_query_budget(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_routine_list_with_many_elements: list[Routine],
+    query_budget,
+):
+    # ETag, 루틴, 루틴 요소(selectin), 루틴 기록
+    with query_budget(4) as responses:
+        client.get("/routines", headers=access_token_headers)
+        client.get("/routines/1", headers=access_token_headers)
+
+    assert [response.status_code for response in responses] == [200, 200]
+
+
+def test_update_routine_elements_query_budget(
+    client: TestClient,
+    session: Session,
+    access_token_headers: dict[str, str],
+    add_routine_list_with_many_elements: list[Routine],
+    query_budget,
+):
+    routine_id = add_routine_list_with_many_elements[0].id
+    element_ids = [
+        element_id
+        for (element_id,) in session.query(RoutineElement.id)
+        .filter(RoutineElement.routine_id == routine_id)
+        .order_by(RoutineElement.order)
+    ]
+    kept_ids = element_ids[:20][::-1]
+    routine_elements = [
+        dict(id=element_id, title=f"수정 {element_id}", duration_minutes=5)
+        for element_id in kept_ids
+    ] + [dict(title=f"추가 {index}", duration_minutes=15) for index in range(10)]
+
+    # 루틴, 요소 id, UPDATE, INSERT, DELETE, 삭제 기록, 버전, 루틴 UPDATE,
+    # 커밋 후 루틴 다시 읽기
+    with query_budget(9):
+        response = client.put(
+            f"/routines/{routine_id}",
+            headers=access_token_headers,
+            json=dict(routine_elements=routine_elements),
+        )
+
+    response_data = RoutinePublic(**response.json())
+
+    assert response.status_code == 200
+    assert [item.title for item in response_data.routine_elements] == [
+        item["title"] for item in routine_elements
+    ]
+    assert [item.id for item in response_data.routine_elements[:20]] == (
+        kept_ids
+    )
+
+    session.expire_all()
+    orders = dict(
+        session.query(RoutineElement.id, RoutineElement.order).filter(
+            RoutineElement.routine_id == routine_id
+        )
+    )
+    assert len(orders) == 30
+    assert [orders[element_id] for element_id in kept_ids] == list(range(20))
+    assert (
+        session.query(Tombstone)
+        .filter(Tombstone.family == Tombstone.ROUTINE_ELEMENT)
+        .count()
+        == 5
+    )
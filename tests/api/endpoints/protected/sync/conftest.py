@@ -0,0 +1,81 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.models import (
+    Habit,
+    HabitLog,
+    Routine,
+    RoutineElement,
+    RoutineLog,
+    Todo,
+    User,
+)
+
+
+# 오래 전에 만든 데이터. 새 토큰 이후의 변경 조회에는 포함되지 않아야 한다.
+@pytest.fixture
+def add_synced_data(session: Session, add_user: User) -> dict:
+    synced_at = datetime(2024, 6, 12, 7, 0, 0)
+
+    todo = Todo(
+        title="할 일",
+        order=1,
+        target_date=synced_at,
+        user_id=add_user.id,
+        created_at=synced_at,
+        updated_at=synced_at,
+    )
+    habit = Habit(
+        title="물 마시기",
+        start_time_minutes=480,
+        end_time_minutes=1380,
+        repeat_time_minutes=30,
+        repeat_days="0123456",
+        user_id=add_user.id,
+        created_at=synced_at,
+        updated_at=synced_at,
+    )
+    routine = Routine(
+        title="아침 루틴",
+        start_time_minutes=480,
+        repeat_days="01234",
+        user_id=add_user.id,
+        created_at=synced_at,
+        updated_at=synced_at,
+    )
+    session.add_all([todo, habit, routine])
+    session.flush()
+
+    routine_element = RoutineElement(
+        title="아침 운동하기",
+        order=1,
+        duration_minutes=30,
+        routine_id=routine.id,
+        user_id=add_user.id,
+        created_at=synced_at,
+        updated_at=synced_at,
+    )
+    session.add(routine_element)
+    session.flush()
+
+    session.add_all(
+        [
+            HabitLog(habit_id=habit.id, completed_at=synced_at),
+            RoutineLog(
+                routine_id=routine.id,
+                routine_element_id=routine_element.id,
+                duration_seconds=1800,
+                completed_at=synced_at,
+            ),
+        ]
+    )
+    session.commit()
+
+    return dict(
+        todo=todo,
+        habit=habit,
+        routine=routine,
+        routine_element=routine_element,
+    )
@@ -0,0 +1,99 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.errors import INVALID_SYNC_TOKEN
+from app.models.models import Tombstone
+
+
+def test_get_full_sync(
+    client: TestClient,
+    add_synced_data: dict,
+    access_token_headers: dict[str, str],
+):
+    response = client.get("/sync", headers=access_token_headers)
+
+    assert response.status_code == 200
+
+    data = response.json()
+
+    assert data["full"] is True
+    assert data["token"]
+    assert [todo["id"] for todo in data["todos"]] == [
+        add_synced_data["todo"].id
+    ]
+    assert data["routines"][0]["repeat_days"] == [0, 1, 2, 3, 4]
+    assert data["routine_elements"][0]["routine_id"] == (
+        add_synced_data["routine"].id
+    )
+    assert data["habits"][0]["repeat_days"] == [0, 1, 2, 3, 4, 5, 6]
+    assert len(data["habit_logs"]) == 1
+    assert len(data["routine_logs"]) == 1
+    assert data["deleted"] == dict(
+        todos=[], routines=[], routine_elements=[], habits=[]
+    )
+
+
+def test_get_sync_since_token(
+    client: TestClient,
+    session: Session,
+    add_synced_data: dict,
+    access_token_headers: dict[str, str],
+    query_budget,
+):
+    token = client.get("/sync", headers=access_token_headers).json()["token"]
+    todo = add_synced_data["todo"]
+
+    with query_budget(8):
+        response = client.get(
+            "/sync", params=dict(since=token), headers=access_token_headers
+        )
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["full"] is False
+    assert data["todos"] == []
+    assert data["routines"] == []
+    assert data["habits"] == []
+    assert data["habit_logs"] == []
+
+    client.put(
+        f"/todos/{todo.id}",
+        json=dict(
+            title="수정한 할 일",
+            target_date=todo.target_date.isoformat(),
+            completed=True,
+        ),
+        headers=access_token_headers,
+    )
+    client.post(
+        f"/habits/achieve/{add_synced_data['habit'].id}",
+        headers=access_token_headers,
+    )
+    client.delete(
+        f"/routines/{add_synced_data['routine'].id}",
+        headers=access_token_headers,
+    )
+
+    data = client.get(
+        "/sync", params=dict(since=token), headers=access_token_headers
+    ).json()
+
+    assert [todo["title"] for todo in data["todos"]] == ["수정한 할 일"]
+    assert len(data["habit_logs"]) == 1
+    assert data["routine_elements"] == []
+    assert data["deleted"]["routines"] == [add_synced_data["routine"].id]
+    assert data["token"] != token
+
+    assert session.query(Tombstone).count() == 1
+
+
+def test_get_sync_invalid_token(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+):
+    response = client.get(
+        "/sync", params=dict(since="invalid"), headers=access_token_headers
+    )
+
+    assert response.status_code == 400
+    assert response.json()["error_type"] == INVALID_SYNC_TOKEN
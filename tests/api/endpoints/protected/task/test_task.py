@@ -1,9 +1,20 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+import pytest
+from fastapi import routing
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import serialize_response as fastapi_serialize_response
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
-from app.models.models import Todo
+from app.api.errors import (
+    DATE_RANGE_TOO_LONG,
+    START_DATE_GREATER_THAN_END_DATE,
+)
+from app.core.config import FAST_RESPONSE
+from app.models.models import Todo, User
 from app.schemas.habit import HabitWithLog
 from app.schemas.routine import RoutinePublic
+from app.schemas.task import TaskPublic
 
 
 def test_get_all_daily_task_empty(
@@ -104,3 +115,323 @@ def test_get_all_daily_task(
         routine_list[0].get("routine_elements")[0].get("completed_at")
         is not None
     )
+
+
+def test_get_all_daily_task_date_boundary(
+    client: TestClient,
+    session: Session,
+    add_user: User,
+    access_token_headers: dict[str, str],
+    target_date: datetime,
+):
+    session.add_all(
+        [
+            Todo(
+                title="last_minute_todo",
+                order=1,
+                user_id=add_user.id,
+                target_date=target_date.replace(hour=23, minute=59, second=59),
+            ),
+            Todo(
+                title="next_day_todo",
+                order=2,
+                user_id=add_user.id,
+                target_date=target_date + timedelta(days=1),
+            ),
+        ]
+    )
+    session.commit()
+
+    params = dict(date=target_date.strftime("%Y-%m-%d"))
+
+    response = client.get(
+        "/task",
+        params=params,
+        headers=access_token_headers,
+    )
+
+    assert response.status_code == 200
+
+    todo_list = response.json().get("todo_list")
+
+    assert len(todo_list) == 1
+    assert todo_list[0].get("title") == "last_minute_todo"
+
+
+def test_get_all_daily_task_single_query(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list: list[Todo],
+    add_habit_list_with_log: list[HabitWithLog],
+    add_routine_list_with_log: list[RoutinePublic],
+    target_date: datetime,
+    executed_statements: list[str],
+):
+    params = dict(date=target_date.strftime("%Y-%m-%d"))
+
+    response = client.get(
+        "/task",
+        params=params,
+        headers=access_token_headers,
+    )
+
+    assert response.status_code == 200
+
+    task_statements = [
+        statement
+        for statement in executed_statements
+        if "FROM todo" in statement
+        or "FROM routine" in statement
+        or "FROM habit" in statement
+    ]
+
+    assert len(task_statements) == 1
+
+
+def test_get_all_task_by_range(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list: list[Todo],
+    add_habit_list_with_log: list[HabitWithLog],
+    add_routine_list_with_log: list[RoutinePublic],
+    target_date: datetime,
+    executed_statements: list[str],
+):
+    start = target_date.date() - timedelta(days=2)
+    end = target_date.date() + timedelta(days=4)
+
+    response = client.get(
+        "/task/range",
+        params=dict(start=start.isoformat(), end=end.isoformat()),
+        headers=access_token_headers,
+    )
+
+    assert response.status_code == 200
+
+    task_statements = [
+        statement
+        for statement in executed_statements
+        if "FROM todo" in statement
+        or "FROM routine" in statement
+        or "FROM habit" in statement
+    ]
+    assert len(task_statements) == 1
+
+    response_data = response.json()
+    assert list(response_data.keys()) == [
+        (start + timedelta(days=offset)).isoformat() for offset in range(7)
+    ]
+
+    for day, task in response_data.items():
+        daily_response = client.get(
+            "/task",
+            params=dict(date=day),
+            headers=access_token_headers,
+        )
+
+        assert task == daily_response.json()
+
+
+def test_get_all_task_by_range_too_long(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+):
+    response = client.get(
+        "/task/range",
+        params=dict(start="2024-07-01", end="2024-08-31"),
+        headers=access_token_headers,
+    )
+
+    assert response.status_code == 422
+    assert response.json()["error_type"] == DATE_RANGE_TOO_LONG
+
+
+def test_get_all_task_by_range_invalid_order(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+):
+    response = client.get(
+        "/task/range",
+        params=dict(start="2024-07-24", end="2024-07-23"),
+        headers=access_token_headers,
+    )
+
+    assert response.status_code == 422
+    assert response.json()["error_type"] == START_DATE_GREATER_THAN_END_DATE
+
+
+def test_get_all_daily_task_not_modified(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list: list[Todo],
+    target_date: datetime,
+    executed_statements: list[str],
+):
+    params = dict(date=target_date.strftime("%Y-%m-%d"))
+
+    response = client.get("/task", params=params, headers=access_token_headers)
+    etag = response.headers.get("ETag")
+
+    assert response.status_code == 200
+    assert etag
+
+    executed_statements.clear()
+    response = client.get(
+        "/task",
+        params=params,
+        headers={**access_token_headers, "If-None-Match": etag},
+    )
+
+    assert response.status_code == 304
+    assert response.headers.get("ETag") == etag
+    assert response.content == b""
+    assert not [
+        statement
+        for statement in executed_statements
+        if "FROM todo" in statement
+    ]
+
+
+def test_get_all_daily_task_etag_changes_after_write(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    target_date: datetime,
+):
+    params = dict(date=target_date.strftime("%Y-%m-%d"))
+
+    response = client.get("/task", params=params, headers=access_token_headers)
+    etag = response.headers.get("ETag")
+
+    response = client.post(
+        "/todos",
+        json=dict(
+            title="new todo",
+            order=0,
+            target_date=target_date.isoformat(),
+        ),
+        headers=access_token_headers,
+    )
+    assert response.status_code == 201
+
+    response = client.get(
+        "/task",
+        params=params,
+        headers={**access_token_headers, "If-None-Match": etag},
+    )
+
+    assert response.status_code == 200
+    assert response.headers.get("ETag") != etag
+    assert len(response.json().get("todo_list")) == 1
+
+
+@pytest.mark.skipif(not FAST_RESPONSE, reason="TSK_FAST_RESPONSE is off")
+def test_get_all_daily_task_fast_response(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list: list[Todo],
+    add_habit_list_with_log: list[HabitWithLog],
+    add_routine_list_with_log: list[RoutinePublic],
+    target_date: datetime,
+    monkeypatch,
+):
+    serialized = []
+
+    async def serialize_response(**kwargs):
+        serialized.append(kwargs)
+        return await fastapi_serialize_response(**kwargs)
+
+    monkeypatch.setattr(routing, "serialize_response", serialize_response)
+
+    params = dict(date=target_date.strftime("%Y-%m-%d"))
+    response = client.get("/task", params=params, headers=access_token_headers)
+
+    assert response.status_code == 200
+    assert response.headers["ETag"]
+
+    # FastAPI 의 응답 검증을 거치지 않아도 같은 JSON 이어야 한다.
+    assert serialized == []
+    assert response.json() == jsonable_encoder(
+        TaskPublic.parse_obj(response.json())
+    )
+
+
+def test_get_all_task_query_budget(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list: list[Todo],
+    add_habit_list_with_log: list[HabitWithLog],
+    add_routine_list_with_log: list[RoutinePublic],
+    target_date: datetime,
+    query_budget,
+):
+    start = target_date - timedelta(days=3)
+    end = target_date + timedelta(days=3)
+
+    # ETag 용 버전 조회와 태스크 조회
+    with query_budget(2) as responses:
+        client.get(
+            "/task",
+            params=dict(date=target_date.strftime("%Y-%m-%d")),
+            headers=access_token_headers,
+        )
+        client.get(
+            "/task/range",
+            params=dict(
+                start=start.strftime("%Y-%m-%d"),
+                end=end.strftime("%Y-%m-%d"),
+            ),
+            headers=access_token_headers,
+        )
+
+    assert [response.status_code for response in responses] == [200, 200]
+
+
+def test_get_all_daily_task_tracing(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list: list[Todo],
+    add_habit_list_with_log: list[HabitWithLog],
+    add_routine_list_with_log: list[RoutinePublic],
+    target_date: datetime,
+    recorded_spans,
+):
+    response = client.get(
+        "/task",
+        params=dict(
+            date=target_date.strftime("%Y-%m-%d"),
+        ),
+        headers={**access_token_headers, "Cache-Control": "no-cache"},
+    )
+    assert response.status_code == 200
+
+    spans = recorded_spans.get_finished_spans()
+    spans_by_id = {span.context.span_id: span for span in spans}
+
+    (request,) = [span for span in spans if span.name == "GET /task"]
+    assert request.attributes["taskie.operation_id"] == "getAllDailyTask"
+    assert request.attributes["http.response.status_code"] == 200
+
+    (repository,) = [
+        span
+        for span in spans
+        if span.name == "TaskRepository.get_all_task_by_date"
+    ]
+    assert repository.parent.span_id == request.context.span_id
+
+    (dao,) = [
+        span for span in spans if span.name == "TaskDAO.get_task_by_range"
+    ]
+    assert spans_by_id[dao.parent.span_id].name == (
+        "TaskRepository.get_all_task_by_range"
+    )
+
+    sql_spans = [
+        span
+        for span in spans
+        if span.parent and span.parent.span_id == dao.context.span_id
+    ]
+    assert sql_spans
+    assert all(
+        span.attributes["db.system"] == "postgresql" for span in sql_spans
+    )
+    assert any(span.attributes.get("db.rowcount", 0) > 0 for span in sql_spans)
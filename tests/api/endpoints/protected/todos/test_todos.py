@@ -2,9 +2,11 @@ from typing import List
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.api.errors import INVALID_CURSOR
 from app.models.models import Todo
 from app.schemas.todo import (
     TodoPublic,
+    TodoOrderUpdate,
     TodoOrderUpdateInput,
 )
 
@@ -145,6 +147,52 @@ def test_update_todo_list_order(
     )
 
 
+def test_update_todo_list_order_single_update(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list: List[Todo],
+    todo_order_update_data: TodoOrderUpdateInput,
+    executed_statements: list[str],
+):
+    response = client.put(
+        "/todos/order",
+        json=todo_order_update_data.dict(),
+        headers=access_token_headers,
+    )
+
+    assert response.status_code == 204
+
+    statements = [s for s in executed_statements if "todo" in s]
+    assert len(statements) == 2
+    assert statements[0].startswith("SELECT")
+    assert statements[1].startswith("UPDATE")
+
+
+def test_update_todo_list_order_not_owned(
+    client: TestClient,
+    session: Session,
+    access_token_headers: dict[str, str],
+    add_todo_list: List[Todo],
+):
+    data = TodoOrderUpdateInput(
+        todo_list=[
+            TodoOrderUpdate(id=add_todo_list[0].id, order=10),
+            TodoOrderUpdate(id=9999, order=11),
+        ]
+    )
+
+    response = client.put(
+        "/todos/order",
+        json=data.dict(),
+        headers=access_token_headers,
+    )
+
+    assert response.status_code == 404
+
+    session.expire_all()
+    assert session.get(Todo, add_todo_list[0].id).order != 10
+
+
 def test_get_todo_list__valid_page_and_offset__1_page(
     client: TestClient,
     session: Session,
@@ -193,6 +241,48 @@ def test_get_todo_list__valid_page_and_offset__2_page(
     assert response_data[2].get("id") == 2
 
 
+def test_get_todo_list__cursor(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list_with_date: List[Todo],
+):
+    pages = []
+    params = dict(limit=3, completed=False)
+
+    while True:
+        response = client.get(
+            "/todos",
+            params=params,
+            headers=access_token_headers,
+        )
+
+        assert response.status_code == 200
+
+        pages.append([todo.get("id") for todo in response.json()])
+
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+
+        params = dict(limit=3, completed=False, cursor=next_cursor)
+
+    assert pages == [[7, 6, 5], [4, 3, 2], [1]]
+
+
+def test_get_todo_list__invalid_cursor(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+):
+    response = client.get(
+        "/todos",
+        params=dict(cursor="invalid"),
+        headers=access_token_headers,
+    )
+
+    assert response.status_code == 400
+    assert response.json()["error_type"] == INVALID_CURSOR
+
+
 def test_get_todo_list__valid_date_range(
     client: TestClient,
     session: Session,
@@ -245,3 +335,17 @@ def test_get_todo_list__complete(
     assert len(response_data) == 2
     assert response_data[0].get("id") == 9
     assert response_data[1].get("id") == 8
+
+
+def test_get_todo_list_query_budget(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    add_todo_list_with_date: List[Todo],
+    query_budget,
+):
+    with query_budget(1) as responses:
+        client.get(
+            "/todos", params=dict(limit=10), headers=access_token_headers
+        )
+
+    assert responses[0].status_code == 200
@@ -1,5 +1,10 @@
+import logging
+
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
+from app.api.dao.user_dao import UserDAO
+from app.core.auth import create_access_token, get_cached_user, user_cache
+from app.core.request_stats import parse_statement_count
 from app.models.models import User
 from app.schemas.auth import UserBase
 
@@ -51,3 +56,166 @@ def test_update_me(
     assert user.username == excepted_output.username
     assert user.email == excepted_output.email
     assert user.nickname == excepted_output.nickname
+
+
+def _count_user_lookups(statements: list[str]) -> int:
+    return len([s for s in statements if 'FROM "user"' in s])
+
+
+def test_get_current_user_lookup_once_per_request(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    executed_statements: list[str],
+):
+    response = client.get("/users/me", headers=access_token_headers)
+
+    assert response.status_code == 200
+    assert _count_user_lookups(executed_statements) == 1
+
+    executed_statements.clear()
+    response = client.get("/users/me", headers=access_token_headers)
+
+    assert response.status_code == 200
+    assert _count_user_lookups(executed_statements) == 0
+
+
+def test_principal_without_user_lookup(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    executed_statements: list[str],
+):
+    response = client.get("/todos", headers=access_token_headers)
+
+    assert response.status_code == 200
+    assert _count_user_lookups(executed_statements) == 0
+
+
+def test_legacy_access_token(
+    client: TestClient,
+    user_data: UserBase,
+    executed_statements: list[str],
+):
+    headers = {
+        "Authorization": f"Bearer {create_access_token(user_data.username)}"
+    }
+    response = client.get("/todos", headers=headers)
+
+    assert response.status_code == 200
+    assert _count_user_lookups(executed_statements) == 1
+
+
+def test_revoked_access_token(
+    client: TestClient,
+    session: Session,
+    access_token_headers: dict[str, str],
+    login_mock: User,
+):
+    login_mock.token_version += 1
+    session.commit()
+
+    response = client.get("/users/me", headers=access_token_headers)
+
+    assert response.status_code == 401
+
+
+def test_get_me_after_update_me(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    user_data: UserBase,
+):
+    response = client.get("/users/me", headers=access_token_headers)
+    assert response.json()["nickname"] == user_data.nickname
+
+    data = UserUpdateInput(
+        username=user_data.username,
+        password=user_data.password,
+        email=user_data.email,
+        nickname="updated_nickname",
+    )
+    response = client.put(
+        "/users/me",
+        headers=access_token_headers,
+        json=data.dict(),
+    )
+    assert response.status_code == 200
+
+    response = client.get("/users/me", headers=access_token_headers)
+    assert response.json()["nickname"] == "updated_nickname"
+
+
+def test_update_me_evicts_cached_user_after_commit(
+    session: Session,
+    login_mock: User,
+    user_data: UserBase,
+):
+    assert get_cached_user(session, user_data.username).nickname == "test"
+
+    writer = Session(bind=session.get_bind())
+    data = UserUpdateInput(
+        username=user_data.username,
+        password=user_data.password,
+        email=user_data.email,
+        nickname="updated_nickname",
+    )
+    UserDAO(db=writer, user=login_mock).update_me(data)
+    writer.flush()
+
+    # 커밋 전에 다른 요청이 이전 값을 다시 캐시에 넣는다.
+    assert get_cached_user(session, user_data.username).nickname == "test"
+    assert user_cache.get(user_data.username) is not None
+
+    writer.commit()
+    writer.close()
+    session.rollback()
+
+    assert user_cache.get(user_data.username) is None
+    assert (
+        get_cached_user(session, user_data.username).nickname
+        == "updated_nickname"
+    )
+
+
+def test_get_me_not_modified_until_update(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    user_data: UserBase,
+):
+    response = client.get("/users/me", headers=access_token_headers)
+    etag = response.headers.get("ETag")
+    headers = {**access_token_headers, "If-None-Match": etag}
+
+    response = client.get("/users/me", headers=headers)
+    assert response.status_code == 304
+
+    data = UserUpdateInput(
+        username=user_data.username,
+        password=user_data.password,
+        email=user_data.email,
+        nickname="updated_nickname",
+    )
+    client.put("/users/me", headers=access_token_headers, json=data.dict())
+
+    response = client.get("/users/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["nickname"] == "updated_nickname"
+
+
+def test_get_me_server_timing(
+    client: TestClient,
+    access_token_headers: dict[str, str],
+    caplog,
+):
+    with caplog.at_level(logging.INFO, logger="taskie.access"):
+        response = client.get("/users/me", headers=access_token_headers)
+
+    assert response.status_code == 200
+
+    server_timing = response.headers["Server-Timing"]
+    assert parse_statement_count(server_timing) == 2
+    for metric in ("db;dur=", "auth;dur=", "serialize;dur=", "total;dur="):
+        assert metric in server_timing
+
+    records = [r for r in caplog.records if r.name == "taskie.access"]
+    assert len(records) == 1
+    assert records[0].getMessage().startswith("GET /users/me 200 ")
+    assert "db=2/" in records[0].getMessage()
@@ -1,21 +1,34 @@
+import logging
+from contextlib import contextmanager
+
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 
-from app.core.config import DATABASE_URI
+from app.core.config import DATABASE_ASYNC, DATABASE_URI
 from app.schemas.auth import UserBase
-from app.database.db import Base, get_db
+from app.database.db import Base, async_engine, get_db, slow_query_log
 from app.models.models import User
-from app.core.auth import create_access_token, get_password_hash
+from app.core.auth import (
+    create_access_token,
+    get_password_hash,
+    user_cache,
+)
+from app.core.definition_cache import definition_cache
+from app.core.request_stats import parse_statement_count
+from app.core import tracing
 from app.main import app as client_app
 
 engine = create_engine(DATABASE_URI, echo=True)
 TestingSessionLocal = sessionmaker(
-    bind=engine, autocommit=False, autoflush=False
+    bind=engine,
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=not DATABASE_ASYNC,
 )
 
 
@@ -23,6 +36,8 @@ TestingSessionLocal = sessionmaker(
 def app():
     Base.metadata.drop_all(engine)
     Base.metadata.create_all(engine)
+    user_cache.clear()
+    definition_cache.clear()
 
     yield client_app
 
@@ -46,11 +61,135 @@ def client(app: FastAPI, session: Session):
         finally:
             pass
 
-    app.dependency_overrides[get_db] = get_db_override
+    # 비동기 모드에서는 실제 AsyncSession 을 거치도록 override 하지 않는다.
+    if not DATABASE_ASYNC:
+        app.dependency_overrides[get_db] = get_db_override
 
     with TestClient(app) as client:
+        if DATABASE_ASYNC:
+            client.event_hooks["response"].append(
+                lambda response: session.expunge_all()
+            )
+
         yield client
 
+    # asyncpg 커넥션은 TestClient 마다 새로 뜨는 이벤트 루프에 묶여 있다.
+    if DATABASE_ASYNC:
+        async_engine.sync_engine.dispose(close=False)
+
+
+@pytest.fixture
+def executed_statements() -> list[str]:
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engines = [engine]
+    if DATABASE_ASYNC:
+        engines.append(async_engine.sync_engine)
+
+    for target in engines:
+        event.listen(target, "before_cursor_execute", before_cursor_execute)
+
+    yield statements
+
+    for target in engines:
+        event.remove(target, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def executed_row_counts() -> list[tuple[str, int]]:
+    row_counts = []
+
+    def after_cursor_execute(conn, cursor, statement, *args):
+        row_counts.append((statement, cursor.rowcount))
+
+    engines = [engine]
+    if DATABASE_ASYNC:
+        engines.append(async_engine.sync_engine)
+
+    for target in engines:
+        event.listen(target, "after_cursor_execute", after_cursor_execute)
+
+    yield row_counts
+
+    for target in engines:
+        event.remove(target, "after_cursor_execute", after_cursor_execute)
+
+
+# 모든 SQL 을 느린 쿼리로 보고 taskie.slow_query 로그의 내용을 모은다.
+@pytest.fixture
+def slow_queries() -> list[dict]:
+    entries = []
+
+    class Collector(logging.Handler):
+        def emit(self, record: logging.LogRecord):
+            entries.append(record.slow_query)
+
+    collector = Collector()
+    logger = logging.getLogger("taskie.slow_query")
+    logger.addHandler(collector)
+
+    threshold = slow_query_log.threshold
+    slow_query_log.threshold = 0
+    if not DATABASE_ASYNC:
+        slow_query_log.install(engine)
+
+    yield entries
+
+    if not DATABASE_ASYNC:
+        slow_query_log.remove(engine)
+    slow_query_log.threshold = threshold
+    logger.removeHandler(collector)
+
+
+# 테스트 동안 모든 요청을 샘플링해 메모리에 span 을 모은다.
+@pytest.fixture
+def recorded_spans():
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    previous_provider = tracing._provider
+    tracing.set_tracer_provider(provider)
+
+    yield exporter
+
+    tracing.set_tracer_provider(previous_provider)
+
+
+# with query_budget(n): 안의 요청마다 실행한 SQL 이 n 개 이하인지 확인한다.
+# 요청별 횟수는 응답의 Server-Timing 헤더에서 읽는다.
+@pytest.fixture
+def query_budget(client: TestClient):
+    @contextmanager
+    def budget(max_statements: int):
+        responses = []
+        client.event_hooks["response"].append(responses.append)
+
+        try:
+            yield responses
+        finally:
+            client.event_hooks["response"].remove(responses.append)
+
+        for response in responses:
+            count = parse_statement_count(response.headers["Server-Timing"])
+            request = response.request
+
+            assert count <= max_statements, (
+                f"{request.method} {request.url.path} executed {count} "
+                f"statements (budget: {max_statements})"
+            )
+
+    return budget
+
 
 @pytest.fixture
 def user_data() -> UserBase:
@@ -80,8 +219,10 @@ def add_user(session: Session, user_data: UserBase) -> User:
 
 
 @pytest.fixture
-def access_token(user_data: UserBase) -> str:
-    return create_access_token(user_data.username)
+def access_token(add_user: User) -> str:
+    return create_access_token(
+        add_user.username, add_user.id, add_user.token_version
+    )
 
 
 @pytest.fixture
@@ -0,0 +1,110 @@
+import json
+from datetime import date, datetime
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.core.utils import get_date_range
+from app.database.partitions import list_partitions, maintain_partitions
+from app.models.models import Habit, HabitLog, User
+
+
+def add_habit_logs(session: Session, user: User, *dates: datetime) -> Habit:
+    habit = Habit(
+        title="습관 1",
+        start_time_minutes=480,
+        end_time_minutes=1380,
+        repeat_time_minutes=30,
+        repeat_days="0123456",
+        user_id=user.id,
+    )
+    session.add(habit)
+    session.flush()
+
+    session.add_all(
+        [HabitLog(habit_id=habit.id, completed_at=value) for value in dates]
+    )
+    session.commit()
+
+    return habit
+
+
+def count(session: Session, table: str) -> int:
+    return session.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+
+
+def test_maintain_partitions(session: Session, add_user: User):
+    habit = add_habit_logs(
+        session,
+        add_user,
+        datetime(2020, 1, 1, 9, 0),
+        datetime(2026, 10, 5, 9, 0),
+        datetime(2026, 10, 5, 10, 0),
+        datetime(2026, 11, 2, 9, 0),
+    )
+    assert count(session, "habit_log_default") == 4
+
+    actions = maintain_partitions(
+        session.connection(), date(2026, 10, 18), months_ahead=1
+    )
+    session.commit()
+
+    assert actions == [
+        "created habit_log_y2026m10",
+        "created habit_log_y2026m11",
+        "created routine_log_y2026m10",
+        "created routine_log_y2026m11",
+    ]
+    # 이미 default 에 쌓인 기록은 새 파티션으로 옮겨진다.
+    assert count(session, "habit_log_y2026m10") == 2
+    assert count(session, "habit_log_y2026m11") == 1
+    assert count(session, "habit_log_default") == 1
+
+    # 날짜별 조회는 해당 월의 파티션만 읽는다.
+    start, end = get_date_range(date(2026, 10, 5))
+    query = select(HabitLog).where(
+        HabitLog.habit_id == habit.id,
+        HabitLog.completed_at >= start,
+        HabitLog.completed_at < end,
+    )
+    compiled = query.compile(
+        session.bind, compile_kwargs={"literal_binds": True}
+    )
+    (plan,) = session.execute(
+        text(f"EXPLAIN (FORMAT JSON) {compiled}")
+    ).scalar()
+    plan_text = json.dumps(plan)
+
+    assert "habit_log_y2026m10" in plan_text
+    assert "habit_log_y2026m11" not in plan_text
+    assert "habit_log_default" not in plan_text
+
+    # 두 번째 실행에서는 만들 파티션이 없다.
+    assert (
+        maintain_partitions(
+            session.connection(), date(2026, 10, 18), months_ahead=1
+        )
+        == []
+    )
+
+    try:
+        actions = maintain_partitions(
+            session.connection(),
+            date(2026, 12, 1),
+            months_ahead=0,
+            retain_months=0,
+            archive_schema="test_archive",
+        )
+        session.commit()
+
+        assert "archived habit_log_y2026m10 to test_archive" in actions
+        assert "archived habit_log_y2026m11 to test_archive" in actions
+        assert set(list_partitions(session.connection(), "habit_log")) == {
+            date(2026, 12, 1)
+        }
+        assert count(session, "test_archive.habit_log_y2026m10") == 2
+        assert count(session, "habit_log") == 1
+    finally:
+        session.rollback()
+        session.execute(text("DROP SCHEMA IF EXISTS test_archive CASCADE"))
+        session.commit()